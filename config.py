@@ -10,7 +10,19 @@
 WINDOW_WIDTH = 800      # Ancho de la ventana en píxeles
 WINDOW_HEIGHT = 600     # Alto de la ventana en píxeles
 WINDOW_TITLE = "Space Invaders - Hybridge Edition"
-FPS = 60                # Frames por segundo (suavidad del juego)
+FPS = 60                # Límite de frames dibujados por segundo (0 = sin límite)
+
+# Simulación a paso fijo: la lógica siempre avanza en pasos de
+# 1/SIMULATION_HZ segundos, sin importar a cuántos FPS se dibuje.
+# El dibujo interpola entre los dos últimos pasos.
+SIMULATION_HZ = 60      # Pasos de simulación por segundo
+MAX_FRAME_TIME = 0.25   # Máximo tiempo simulado por frame (evita la "espiral de la muerte")
+VSYNC = False           # Sincronizar el dibujo con el refresco del monitor
+
+# Renderizado por rectángulos sucios: solo se limpian y envían a pantalla
+# las zonas que cambiaron (útil con renderizado por software).
+# False = limpiar y hacer flip() de la pantalla completa cada frame
+DIRTY_RECT_RENDERING = False
 
 # ------------------------------------------------------------------------------
 # COLORES (formato RGB)
@@ -31,7 +43,7 @@ GRAY = (128, 128, 128)      # UI y menús
 # ------------------------------------------------------------------------------
 PLAYER_WIDTH = 50           # Ancho de la nave del jugador
 PLAYER_HEIGHT = 40          # Alto de la nave del jugador
-PLAYER_SPEED = 5            # Velocidad de movimiento horizontal (px/frame)
+PLAYER_SPEED = 300          # Velocidad de movimiento horizontal (px/segundo)
 PLAYER_LIVES = 3            # Vidas iniciales
 PLAYER_SHOOT_COOLDOWN = 250 # Milisegundos entre disparos (evita spam)
 
@@ -40,21 +52,134 @@ PLAYER_SHOOT_COOLDOWN = 250 # Milisegundos entre disparos (evita spam)
 # ------------------------------------------------------------------------------
 BULLET_WIDTH = 5            # Ancho de la bala
 BULLET_HEIGHT = 15          # Alto de la bala
-BULLET_SPEED = 7            # Velocidad de la bala (px/frame)
+BULLET_SPEED = 420          # Velocidad de la bala (px/segundo)
 BULLET_COLOR = YELLOW       # Color de las balas del jugador
 ENEMY_BULLET_COLOR = RED    # Color de las balas enemigas
+ENEMY_BULLET_TINT = (255, 0, 0, 128)  # Tinte RGBA del sprite de bala enemiga
 
 # ------------------------------------------------------------------------------
 # CONFIGURACIÓN DE ENEMIGOS (valores base)
 # ------------------------------------------------------------------------------
 ENEMY_WIDTH = 40            # Ancho base del enemigo
 ENEMY_HEIGHT = 30           # Alto base del enemigo
-ENEMY_SPEED = 1             # Velocidad horizontal base
+ENEMY_SPEED = 60            # Velocidad horizontal base (px/segundo)
+ENEMY_SPEED_PER_LEVEL = 12  # Velocidad extra de la formación por nivel (px/segundo)
 ENEMY_ROWS = 4              # Número de filas de enemigos
 ENEMY_COLS = 8              # Número de columnas de enemigos
 ENEMY_SPACING_X = 60        # Espacio horizontal entre enemigos
 ENEMY_SPACING_Y = 50        # Espacio vertical entre filas
 ENEMY_DESCENT_SPEED = 20    # Cuánto bajan cuando llegan al borde
+INVASION_LINE = WINDOW_HEIGHT - 100  # Si un enemigo la alcanza: invasión
+
+# Disparo enemigo (FireDirector): la cadencia sube con el nivel y
+# a medida que la oleada pierde enemigos
+ENEMY_FIRE_INTERVAL = 1.5          # Segundos entre disparos (nivel 1, oleada completa)
+ENEMY_FIRE_LEVEL_SCALE = 0.1       # Cadencia extra por nivel (+10%)
+ENEMY_FIRE_POPULATION_SCALE = 1.0  # Cadencia extra con la oleada vacía (+100%)
+ENEMY_SHOT_COOLDOWN = (1.0, 3.0)   # Recarga de cada enemigo tras disparar (segundos, aleatorio)
+
+# Aparición de oleadas: los enemigos se crean por partes durante la
+# presentación de la oleada, sin concentrar el trabajo en un solo frame
+WAVE_SPAWN_PER_STEP = 8      # Máximo de enemigos creados por paso de simulación
+WAVE_SPAWN_BUDGET_MS = 1.0   # Tiempo máximo dedicado a crearlos por paso (ms)
+
+# Tintes RGBA por tipo de enemigo (None = color original del sprite)
+ENEMY_TINTS = {
+    "basic": None,
+    "fast": (0, 255, 255, 100),     # Cyan
+    "tank": (255, 0, 255, 100),     # Magenta
+}
+ENEMY_DAMAGE_TINT = (255, 80, 80, 255)  # Tinte rojizo al recibir daño
+
+# ------------------------------------------------------------------------------
+# CONFIGURACIÓN DE COLISIONES
+# ------------------------------------------------------------------------------
+# Tamaño de celda de la rejilla espacial (spatial hash) en píxeles.
+# Conviene que sea algo mayor que el sprite más grande (enemigo: 40x30)
+COLLISION_CELL_SIZE = 64
+
+# ------------------------------------------------------------------------------
+# ENTIDADES EN ARREGLOS (requiere NumPy, opcional)
+# ------------------------------------------------------------------------------
+# True = las balas viven en arreglos de NumPy (EntityArrays) y se mueven,
+# descartan y colisionan de forma vectorizada (modos "bullet hell").
+# Si NumPy no está instalado se usan sprites normales
+ARRAY_BULLETS = False
+ENTITY_ARRAYS_CAPACITY = 1024   # Capacidad inicial (se duplica al llenarse)
+
+# ------------------------------------------------------------------------------
+# POOLS DE ENTIDADES (reutilización de balas y enemigos)
+# ------------------------------------------------------------------------------
+# Máximo de entidades libres guardadas por clase (el resto se descarta)
+POOL_CAPACITY = {
+    "Bullet": 256,
+    "Enemy": 128,
+}
+POOL_DEFAULT_CAPACITY = 64
+
+# Entidades creadas por adelantado durante la pantalla de carga
+POOL_PREWARM = {
+    "Bullet": 64,
+    "Enemy": 64,
+}
+
+# ------------------------------------------------------------------------------
+# RECOLECTOR DE BASURA (GC)
+# ------------------------------------------------------------------------------
+# Tras la carga se congelan los objetos de larga vida (gc.freeze): el GC
+# ya no los recorre. Durante la partida los umbrales suben para que casi
+# no haya recolecciones automáticas; se recoge en momentos seguros
+# (cambio de estado, fin de oleada, pausa)
+GC_FREEZE_AFTER_LOAD = True
+GC_GAMEPLAY_THRESHOLDS = (5000, 50, 1000000)  # Generación 2 prácticamente desactivada
+GC_SAFE_POINT_COLLECT = True    # Recolección completa en los momentos seguros
+GC_PAUSE_WINDOW = 300           # Pausas guardadas para los percentiles
+GC_SLOW_PAUSE_MS = 5.0          # Pausas más largas se avisan en el log
+
+# ------------------------------------------------------------------------------
+# REGISTRO DE MENSAJES (LOGGING)
+# ------------------------------------------------------------------------------
+# DEBUG muestra cada disparo, impacto y descenso (mucho texto por segundo);
+# INFO solo los eventos de la partida (oleadas, niveles, game over)
+LOG_LEVEL = "INFO"
+LOG_FORMAT = "%(message)s"
+LOG_ASYNC = True         # Escribir en un hilo aparte (un stdout lento no frena el juego)
+LOG_QUEUE_SIZE = 10000   # Mensajes en espera como máximo (los que sobran se descartan)
+LOG_RING_SIZE = 256      # Últimos mensajes guardados en memoria (diagnóstico)
+
+# ------------------------------------------------------------------------------
+# PERFILADOR DE FRAMES
+# ------------------------------------------------------------------------------
+# Tiempo de cada fase del frame, con percentiles p50/p95/p99.
+# Las teclas son nombres de pygame.key.key_code()
+PROFILER_OVERLAY_KEY = "f3"     # Mostrar/ocultar el overlay de tiempos
+PROFILER_CSV_KEY = "f4"         # Empezar/terminar la grabación en CSV
+PROFILER_WINDOW = 300           # Frames usados para los percentiles
+PROFILER_OVERLAY_REFRESH = 30   # Frames entre actualizaciones del overlay
+PROFILER_CSV_DIR = "profiles"   # Carpeta de los CSV (una fila por frame)
+
+# Trazas para Perfetto / chrome://tracing (un span por fase, frame a frame)
+TRACE_KEY = "f5"                # Empezar/terminar la traza (al terminar se guarda)
+TRACE_BUFFER_SIZE = 200000      # Eventos en memoria (se descartan los más viejos)
+TRACE_DIR = "traces"            # Carpeta de las trazas JSON
+
+# Capturas de cProfile en plena partida (.pstats + pilas colapsadas)
+PROFILE_CAPTURE_KEY = "f6"      # Empezar/terminar la captura (al terminar se guarda)
+PROFILE_CAPTURE_SECONDS = 0.0   # Fin automático (0 = hasta volver a pulsar la tecla)
+PROFILE_CAPTURE_DIR = "profiles"  # Carpeta de las capturas
+PROFILE_CAPTURE_MAX_DEPTH = 64  # Profundidad máxima de las pilas colapsadas
+
+# Vigilante de tirones: si un frame se pasa de 1/FPS + WATCHDOG_MARGIN_MS,
+# un hilo aparte muestrea la pila del juego y escribe un informe
+WATCHDOG_ENABLED = True
+WATCHDOG_MARGIN_MS = 33         # Retraso tolerado sobre la duración del frame
+WATCHDOG_SAMPLE_MS = 5          # Intervalo de muestreo de la pila durante el tirón
+WATCHDOG_STACK_DEPTH = 12       # Frames de pila por muestra (los más internos)
+WATCHDOG_STACKS = 3             # Pilas distintas por informe (las más frecuentes)
+WATCHDOG_REPORT_INTERVAL = 10.0  # Segundos mínimos entre informes
+WATCHDOG_LOG_PATH = "logs/hitches.log"   # Archivo rotativo de informes
+WATCHDOG_LOG_MAX_BYTES = 1000000         # Tamaño máximo antes de rotar
+WATCHDOG_LOG_BACKUPS = 3                 # Archivos viejos que se conservan
 
 # ------------------------------------------------------------------------------
 # CONFIGURACIÓN DE PUNTUACIÓN
@@ -82,4 +207,53 @@ STATE_VICTORY = "victory"   # Victoria
 ASSETS_DIR = "assets"
 IMAGES_DIR = f"{ASSETS_DIR}/images"
 SOUNDS_DIR = f"{ASSETS_DIR}/sounds"
-FONTS_DIR = f"{ASSETS_DIR}/fonts"
\ No newline at end of file
+FONTS_DIR = f"{ASSETS_DIR}/fonts"
+
+# Caché en disco de las fuentes del sistema ya resueltas (None = desactivada)
+FONT_CACHE_FILE = ".cache/fonts.json"
+
+# Imágenes de las entidades (se cargan una sola vez vía AssetManager)
+PLAYER_IMAGE = f"{IMAGES_DIR}/player.png"
+ENEMY_IMAGE = f"{IMAGES_DIR}/enemy.png"
+BULLET_IMAGE = f"{IMAGES_DIR}/bullet.png"
+
+# ------------------------------------------------------------------------------
+# FUENTES DE LA INTERFAZ
+# ------------------------------------------------------------------------------
+# Fuentes usadas por las pantallas: (nombre, tamaño, negrita, cursiva)
+# Se crean una sola vez durante la carga vía FontManager
+FONT_NAME = 'arial'
+FONT_LOADING_TITLE = (FONT_NAME, 48, True, False)
+FONT_LOADING_TEXT = (FONT_NAME, 24, False, False)
+FONT_MENU_TITLE = (FONT_NAME, 64, True, False)
+FONT_MENU_SUBTITLE = (FONT_NAME, 24, False, True)
+FONT_MENU_OPTIONS = (FONT_NAME, 36, True, False)
+FONT_MENU_CONTROLS = (FONT_NAME, 18, False, False)
+FONT_HUD = (FONT_NAME, 24, False, False)
+FONT_GAME_OVER = (FONT_NAME, 64, True, False)
+FONT_PROFILER = (FONT_NAME, 14, False, False)
+
+# Máximo de textos renderizados guardados en la TextCache (LRU)
+TEXT_CACHE_SIZE = 256
+
+UI_FONTS = [
+    FONT_LOADING_TITLE, FONT_LOADING_TEXT,
+    FONT_MENU_TITLE, FONT_MENU_SUBTITLE, FONT_MENU_OPTIONS, FONT_MENU_CONTROLS,
+    FONT_HUD, FONT_GAME_OVER, FONT_PROFILER,
+]
+
+# ------------------------------------------------------------------------------
+# VARIANTES DE SPRITES PRE-TINTADAS
+# ------------------------------------------------------------------------------
+# Cada combinación (imagen, tamaño, tintes) se genera UNA vez al cargar
+# el juego. Las entidades solo referencian la superficie ya preparada.
+SPRITE_VARIANTS = [
+    (PLAYER_IMAGE, (PLAYER_WIDTH, PLAYER_HEIGHT), ()),
+    (BULLET_IMAGE, (BULLET_WIDTH, BULLET_HEIGHT), ()),
+    (BULLET_IMAGE, (BULLET_WIDTH, BULLET_HEIGHT), (ENEMY_BULLET_TINT,)),
+]
+for _tint in ENEMY_TINTS.values():
+    _tints = (_tint,) if _tint else ()
+    SPRITE_VARIANTS.append((ENEMY_IMAGE, (ENEMY_WIDTH, ENEMY_HEIGHT), _tints))
+    SPRITE_VARIANTS.append((ENEMY_IMAGE, (ENEMY_WIDTH, ENEMY_HEIGHT), _tints + (ENEMY_DAMAGE_TINT,)))
+del _tint, _tints
@@ -1,10 +1,15 @@
+import argparse
+import logging
+import os
 import pygame
 import sys
 
 from config import *
-from src.managers import GameManager
+from src.managers import GameManager, PoolManager, LogManager, FrameProfiler, Tracer, HitchWatchdog, ProfileCapture, GCManager
 from src.screens import LoadingScreen
 
+logger = logging.getLogger(__name__)
+
 class Game:
     """
     Clase principal que maneja la inicialización y el game loop.
@@ -14,17 +19,35 @@ class Game:
     - Managers (colisiones, spawn, etc.)
     - Grupos de sprites
     """
-    def __init__(self):
+    def __init__(self, headless=False):
+        """
+        Args:
+            headless: True para correr sin ventana ni audio
+                      (simulaciones en CI / servidores sin X)
+        """
+        
+        self.headless = headless
+        if headless:
+            # Drivers "dummy" de SDL: no necesitan servidor gráfico ni de audio
+            os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+            os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
         
         # Inicialización de Pygame
         pygame.init()
 
-        # Crear la ventana del juego con las dimensiones definidas en config.py
-        self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
-        pygame.display.set_caption(WINDOW_TITLE)
+        if headless:
+            # Superficie en memoria: nunca se abre una ventana
+            self.screen = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+        else:
+            # Crear la ventana del juego con las dimensiones definidas en config.py
+            # VSYNC requiere una ventana SCALED (renderizador de SDL)
+            if VSYNC:
+                self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT), pygame.SCALED, vsync=1)
+            else:
+                self.screen = pygame.display.set_mode((WINDOW_WIDTH, WINDOW_HEIGHT))
 
-        # Establecer el título de la ventana
-        pygame.display.set_caption(WINDOW_TITLE)
+            # Establecer el título de la ventana
+            pygame.display.set_caption(WINDOW_TITLE)
 
         ## Crear el reloj para controlar los FPS
         # El reloj nos ayudará a mantener una velocidad constante de frames por segundo
@@ -33,13 +56,42 @@ class Game:
         # Variable que controla si el juego está corriendo
         self.running = True
 
+        # Registro de mensajes (se configura en __main__)
+        self.log_manager = LogManager()
+
+        # Perfilador de frames (F3 = overlay, F4 = CSV)
+        self.profiler = FrameProfiler()
+        self.profiler_overlay_key = pygame.key.key_code(PROFILER_OVERLAY_KEY)
+        self.profiler_csv_key = pygame.key.key_code(PROFILER_CSV_KEY)
+
+        # Trazas para Perfetto / chrome://tracing (F5 = grabar / guardar)
+        self.tracer = Tracer()
+        self.trace_key = pygame.key.key_code(TRACE_KEY)
+
+        # Capturas de cProfile en plena partida (F6 = empezar / guardar)
+        self.profile_capture = ProfileCapture()
+        self.profile_capture_key = pygame.key.key_code(PROFILE_CAPTURE_KEY)
+
+        # Vigilante de tirones del game loop (solo con ventana: arranca en run())
+        self.watchdog = HitchWatchdog(self) if WATCHDOG_ENABLED and not headless else None
+
         # Inicializar el GameManager (singleton)
         self.game_manager = GameManager(self)
 
-        self.game_manager.change_state(LoadingScreen(self)) 
+        # En modo headless el simulador elige el estado (sin pantalla de carga)
+        if not headless:
+            self.game_manager.change_state(LoadingScreen(self)) 
 
-        # Tiempo transcurrido entre frames
-        self.delta_time = 0
+        # Duración fija de cada paso de simulación (segundos)
+        # Todas las actualizaciones reciben siempre este mismo delta_time
+        self.delta_time = 1.0 / SIMULATION_HZ
+        
+        # Tiempo real acumulado aún no simulado
+        self.accumulator = 0.0
+        
+        # Fracción del paso actual transcurrida (0.0 a 1.0)
+        # Se usa para dibujar interpolando entre los dos últimos pasos
+        self.interpolation = 1.0
 
         self.clock = pygame.time.Clock()
     
@@ -63,8 +115,26 @@ class Game:
             if event.type == pygame.KEYDOWN:
                 if event.key == pygame.K_ESCAPE:
                     self.running = False
+                elif event.key == self.profiler_overlay_key:
+                    self.toggle_profiler_overlay()
+                elif event.key == self.profiler_csv_key:
+                    self.profiler.toggle_csv()
+                elif event.key == self.trace_key:
+                    self.tracer.toggle()
+                elif event.key == self.profile_capture_key:
+                    self.profile_capture.toggle()
 
         self.game_manager.handle_events(events)
+
+    def toggle_profiler_overlay(self):
+        """
+        Muestra u oculta el overlay de tiempos del perfilador.
+        """
+        if not self.profiler.toggle_overlay():
+            # El overlay deja su rastro en pantalla: repintar todo
+            renderer = getattr(self.game_manager.current_state, 'renderer', None)
+            if renderer is not None:
+                renderer.invalidate()
     # TODO: Agregar más métodos para manejar lógica del juego.
     def update(self):
         """
@@ -100,23 +170,71 @@ class Game:
         5. UI (puntuación, vidas)
         """
         
-        # Llenar la pantalla con el color de fondo (negro)
-        self.game_manager.draw()
-        pygame.display.flip()
-        #TODO: Dibujar los sprites
+        # El estado dibuja y devuelve qué zonas cambiaron
+        dirty_rects = self.game_manager.draw()
+        
+        # Overlay del perfilador (encima de todo)
+        overlay_rect = self.profiler.draw_overlay(self.screen)
+        if overlay_rect is not None and dirty_rects is not None:
+            dirty_rects.append(overlay_rect)
+        
+        if dirty_rects is None:
+            # Actualizar la pantalla completa
+            pygame.display.flip()
+        else:
+            # Modo dirty rects: actualizar solo las zonas que cambiaron
+            pygame.display.update(dirty_rects)
+        self.profiler.split("draw.flip")
 
     def run(self):
         """
         Game Loop principal
         
-        Método con el ciclo infinito que mantiene el juego corriendo
+        Método con el ciclo infinito que mantiene el juego corriendo.
+        
+        Paso fijo:
+        1. Medir el tiempo real del frame y acumularlo
+        2. Simular tantos pasos de 1/SIMULATION_HZ como quepan
+        3. Dibujar interpolando con el tiempo sobrante
+        
+        Así la velocidad del juego no depende de los FPS de dibujo.
         """
 
+        if self.watchdog is not None:
+            self.watchdog.start()
+
         while self.running:
-            self.delta_time = self.clock.tick(FPS) / 1000.0
-            self.handle_events()
-            self.update()
-            self.draw()
+            # Tiempo real transcurrido (limitado para no simular de golpe
+            # demasiados pasos tras una pausa larga)
+            frame_time = min(self.clock.tick(FPS) / 1000.0, MAX_FRAME_TIME)
+            self.accumulator += frame_time
+            if self.watchdog is not None:
+                self.watchdog.heartbeat()
+            
+            # Los mensajes de este frame se anotan con su número
+            self.log_manager.begin_frame()
+            self.profiler.begin_frame()
+            
+            # Un span por frame en la traza (sin contar la espera de tick())
+            with self.tracer.span("Game.frame"):
+                with self.tracer.span("Game.handle_events"):
+                    self.handle_events()
+                self.profiler.lap("events")
+                
+                steps = 0
+                while self.accumulator >= self.delta_time:
+                    self.update()
+                    self.accumulator -= self.delta_time
+                    steps += 1
+                self.profiler.lap("update")
+                
+                self.interpolation = self.accumulator / self.delta_time
+                self.draw()
+                self.profiler.lap("draw")
+                self.profiler.end_frame(steps)
+            self.tracer.counter("steps", steps=steps)
+            if self.profile_capture.active:
+                self.profile_capture.check()
         
         self.cleanup()
 
@@ -130,17 +248,97 @@ class Game:
         - Liberar memoria
         """
 
-        print("Limpiando recursos...")
+        logger.info("Limpiando recursos...")
+        if self.watchdog is not None:
+            self.watchdog.stop()
+        self.profiler.stop_csv()
+        self.profile_capture.stop()
+        if self.tracer.enabled:
+            self.tracer.stop()
+            self.tracer.flush()
+        self.log_manager.shutdown()  # Escribir los mensajes pendientes
         pygame.quit()
         sys.exit()
 
 
         
 
+def parse_args():
+    """
+    Lee los argumentos de línea de comandos.
+    
+    Returns:
+        Namespace: Argumentos leídos
+    """
+    parser = argparse.ArgumentParser(description=WINDOW_TITLE)
+    parser.add_argument('--headless', action='store_true',
+                        help='Simular partidas sin ventana, con piloto automático')
+    parser.add_argument('--games', type=int, default=1,
+                        help='Partidas a simular en modo headless')
+    parser.add_argument('--seed', type=int, default=0,
+                        help='Semilla de la primera partida simulada')
+    parser.add_argument('--max-steps', type=int, default=36000,
+                        help='Máximo de pasos de simulación por partida')
+    parser.add_argument('--trace', action='store_true',
+                        help='Grabar una traza desde el inicio (se guarda al salir en traces/)')
+    return parser.parse_args()
+
+
+def run_headless(args):
+    """
+    Simula partidas a máxima velocidad y muestra un resumen.
+    
+    Args:
+        args: Argumentos de línea de comandos
+    """
+    from src.simulation import run_simulations
+
+    game = Game(headless=True)
+    results = run_simulations(game, args.games, args.seed, args.max_steps)
+    pygame.quit()
+
+    if game.tracer.enabled:
+        game.tracer.stop()
+        game.tracer.flush()
+
+    for result in results:
+        print(
+            f"seed={result['seed']} score={result['score']} level={result['level']} "
+            f"steps={result['steps']} wall={result['wall_time']:.2f}s"
+        )
+
+    total_steps = sum(result['steps'] for result in results)
+    total_time = sum(result['wall_time'] for result in results)
+    if total_time > 0:
+        print(f"📊 {len(results)} partidas, {total_steps / total_time:.0f} pasos/s")
+
+    for name, stats in PoolManager().get_stats().items():
+        print(
+            f"♻️ Pool {name}: {stats['created']} creados, {stats['reused']} reusados, "
+            f"máximo en uso {stats['high_water']}"
+        )
+
+    stats = GCManager().get_stats()
+    gen0, gen1, gen2 = stats['collections']
+    print(
+        f"🧹 GC: {gen0}/{gen1}/{gen2} recolecciones automáticas (gen 0/1/2), "
+        f"pausa máxima {stats['pause_max_ms']:.1f} ms, total {stats['pause_total_ms']:.1f} ms, "
+        f"{stats['safe_collections']} en momentos seguros"
+    )
+
+
 if __name__ == "__main__":
-    print("=" * 60)
-    print("🌌 SPACE INVADERS - HYBRIDGE EDITION 🌌")
-    print("=" * 60)
+    args = parse_args()
+    LogManager().setup()
+    if args.trace:
+        Tracer().start()
+
+    if args.headless:
+        run_headless(args)
+    else:
+        print("=" * 60)
+        print("🌌 SPACE INVADERS - HYBRIDGE EDITION 🌌")
+        print("=" * 60)
 
-    game = Game()
-    game.run()
+        game = Game()
+        game.run()
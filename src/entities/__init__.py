@@ -7,3 +7,6 @@ from .entity import Entity
 from .player import Player
 from .bullet import Bullet
 from .enemy import Enemy
+from .formation import Formation
+from .entity_registry import EntityRegistry
+from .entity_arrays import EntityArrays, NUMPY_AVAILABLE
@@ -3,10 +3,14 @@
 # ==============================================================================
 # Clase que representa las balas disparadas por el jugador o enemigos
 
+import logging
 import pygame
 from src.entities.entity import Entity
+from src.managers.asset_manager import AssetManager
 from config import *
 
+logger = logging.getLogger(__name__)
+
 class Bullet(Entity):
     """
     Clase de las balas/proyectiles.
@@ -30,28 +34,36 @@ class Bullet(Entity):
         # Llamar al constructor de Entity
         super().__init__(x, y, BULLET_WIDTH, BULLET_HEIGHT)
         
-        # Cargar sprite de la bala desde imagen
+        # Configurar la bala (el mismo código reinicia las balas reutilizadas)
+        self.reset(x, y, direction, is_player_bullet)
+    
+    def reset(self, x, y, direction, is_player_bullet=True):
+        """
+        Configura la bala para un nuevo disparo.
+        
+        Lo usa el constructor y el PoolManager al reutilizar una bala.
+        
+        Args:
+            x: Posición horizontal del centro
+            y: Posición vertical del centro
+            direction: 1 para arriba, -1 para abajo
+            is_player_bullet: True si es del jugador, False si es del enemigo
+        """
+        super().reset(x, y)
+        
+        # Obtener sprite de la bala desde la caché (ya cargado y escalado)
         try:
-            self.image = pygame.image.load('assets/images/bullet.png').convert_alpha()
-            # Escalar la imagen al tamaño configurado
-            self.image = pygame.transform.scale(self.image, (BULLET_WIDTH, BULLET_HEIGHT))
-            
-            # Si es bala de enemigo, cambiar color (tintear de rojo)
-            if not is_player_bullet:
-                # Crear una copia para aplicar tinte rojo
-                self.image = self.image.copy()
-                red_tint = pygame.Surface(self.image.get_size(), pygame.SRCALPHA)
-                red_tint.fill((255, 0, 0, 128))  # Rojo semi-transparente
-                self.image.blit(red_tint, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+            self.image = self.get_sprite(is_player_bullet)
         except pygame.error as e:
-            print(f"⚠️ No se pudo cargar sprite de bala: {e}")
+            logger.warning("⚠️ No se pudo cargar sprite de bala: %s", e)
             # Fallback: usar rectángulo de color
+            self.image = pygame.Surface((BULLET_WIDTH, BULLET_HEIGHT))
             if is_player_bullet:
                 self.image.fill(BULLET_COLOR)  # Amarillo para jugador
             else:
                 self.image.fill(ENEMY_BULLET_COLOR)  # Rojo para enemigos
         
-        # Velocidad vertical
+        # Velocidad vertical (píxeles por segundo)
         # direction: 1 = hacia arriba, -1 = hacia abajo
         # Multiplicamos por la velocidad configurada
         self.velocity_y = -BULLET_SPEED * direction
@@ -59,9 +71,25 @@ class Bullet(Entity):
         # Guardar si es del jugador (útil para colisiones)
         self.is_player_bullet = is_player_bullet
         
-        # Centrar la bala horizontalmente
-        self.rect.centerx = x
-        self.rect.centery = y
+        # Centrar la bala en el punto de disparo
+        self.rect.center = (x, y)
+        self.set_position(self.rect.x, self.rect.y)
+    
+    @staticmethod
+    def get_sprite(is_player_bullet=True):
+        """
+        Devuelve el sprite compartido de la bala.
+        
+        Las balas enemigas usan la variante pre-tintada de rojo.
+        
+        Args:
+            is_player_bullet: True para la bala del jugador
+        
+        Returns:
+            Surface: Superficie compartida (no modificar)
+        """
+        tints = () if is_player_bullet else (ENEMY_BULLET_TINT,)
+        return AssetManager().get_variant(BULLET_IMAGE, (BULLET_WIDTH, BULLET_HEIGHT), tints)
     
     def update(self, delta_time):
         """
@@ -71,7 +99,7 @@ class Bullet(Entity):
             delta_time: Tiempo desde el último frame (segundos)
         """
         # Mover la bala verticalmente
-        self.rect.y += self.velocity_y
+        self.move(delta_time)
         
         # Auto-destruirse si sale de la pantalla
         # Bala del jugador: sale por arriba
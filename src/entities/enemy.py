@@ -3,10 +3,14 @@
 # ==============================================================================
 # Clase que representa a los enemigos (aliens)
 
+import logging
 import pygame
 from src.entities.entity import Entity
+from src.managers.asset_manager import AssetManager
 from config import *
 
+logger = logging.getLogger(__name__)
+
 class Enemy(Entity):
     """
     Clase de los enemigos.
@@ -30,28 +34,36 @@ class Enemy(Entity):
         # Llamar al constructor de Entity
         super().__init__(x, y, ENEMY_WIDTH, ENEMY_HEIGHT)
         
+        # Configurar el enemigo (el mismo código reinicia los reutilizados)
+        self.reset(x, y, enemy_type)
+    
+    def reset(self, x, y, enemy_type="basic"):
+        """
+        Configura el enemigo para una nueva oleada.
+        
+        Lo usa el constructor y el PoolManager al reutilizar un enemigo.
+        
+        Args:
+            x: Posición horizontal inicial
+            y: Posición vertical inicial
+            enemy_type: Tipo de enemigo ("basic", "fast", "tank")
+        """
+        super().reset(x, y)
+        
         # Tipo de enemigo
         self.enemy_type = enemy_type
         
-        # Cargar sprite del enemigo desde imagen
+        # Tintes del sprite según el tipo ("basic" mantiene el color original)
+        tint = ENEMY_TINTS.get(enemy_type)
+        self.tints = (tint,) if tint else ()
+        
+        # Obtener la variante pre-tintada desde la caché (sin tintar aquí)
         try:
-            self.image = pygame.image.load('assets/images/enemy.png').convert_alpha()
-            # Escalar la imagen al tamaño configurado
-            self.image = pygame.transform.scale(self.image, (ENEMY_WIDTH, ENEMY_HEIGHT))
-            
-            # Aplicar tinte según el tipo de enemigo
-            if enemy_type == "fast":
-                # Enemigos rápidos: tinte cyan
-                self.apply_tint((0, 255, 255, 100))  # Cyan
-            elif enemy_type == "tank":
-                # Enemigos tanque: tinte magenta
-                self.apply_tint((255, 0, 255, 100))  # Magenta
-            # "basic" mantiene el color original
-            
-            print(f"✅ Sprite de enemigo '{enemy_type}' cargado")
+            self.image = self.get_sprite()
         except pygame.error as e:
-            print(f"⚠️ No se pudo cargar sprite de enemigo: {e}")
+            logger.warning("⚠️ No se pudo cargar sprite de enemigo: %s", e)
             # Fallback: usar rectángulo de color según tipo
+            self.image = pygame.Surface((ENEMY_WIDTH, ENEMY_HEIGHT))
             if enemy_type == "basic":
                 self.image.fill(CYAN)
             elif enemy_type == "fast":
@@ -74,24 +86,29 @@ class Enemy(Entity):
             self.points = SCORE_ENEMY_TANK
         
         # Dirección de movimiento (1 = derecha, -1 = izquierda)
+        # Solo se usa si el enemigo está fuera de formación
         self.direction = 1
         
-        # Tiempo para el próximo disparo
-        self.shoot_timer = 0
-        self.shoot_cooldown = 2.0  # Dispara cada 2 segundos (aleatorio)
+        # Formación a la que pertenece y su celda (fila, columna)
+        # Mientras está en formación, es la formación quien lo mueve
+        self.formation = None
+        self.slot = None
     
-    def apply_tint(self, color):
+    def get_sprite(self, damaged=False):
         """
-        Aplica un tinte de color a la imagen del enemigo.
+        Devuelve la variante pre-tintada del sprite de este enemigo.
+        
+        Las variantes se generan una sola vez en el AssetManager,
+        así que cambiar de aspecto no crea superficies nuevas.
         
         Args:
-            color: Tupla RGBA (red, green, blue, alpha)
+            damaged: True para obtener la variante de daño (tinte rojizo)
+        
+        Returns:
+            Surface: Superficie compartida (no modificar)
         """
-        # Crear superficie de tinte
-        tint = pygame.Surface(self.image.get_size(), pygame.SRCALPHA)
-        tint.fill(color)
-        # Aplicar el tinte a la imagen
-        self.image.blit(tint, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+        tints = self.tints + (ENEMY_DAMAGE_TINT,) if damaged else self.tints
+        return AssetManager().get_variant(ENEMY_IMAGE, (ENEMY_WIDTH, ENEMY_HEIGHT), tints)
     
     def update(self, delta_time):
         """
@@ -100,17 +117,17 @@ class Enemy(Entity):
         Args:
             delta_time: Tiempo desde el último frame (segundos)
         """
-        # Movimiento horizontal
-        self.rect.x += self.speed * self.direction
-        
-        # Actualizar timer de disparo
-        self.shoot_timer -= delta_time
+        # Movimiento horizontal propio (solo fuera de formación)
+        if self.formation is None:
+            self.velocity_x = self.speed * self.direction
+            self.move(delta_time)
     
     def move_down(self):
         """
         Mueve al enemigo hacia abajo (cuando llega al borde).
         """
-        self.rect.y += ENEMY_DESCENT_SPEED
+        self.pos_y += ENEMY_DESCENT_SPEED
+        self.sync_rect()
     
     def reverse_direction(self):
         """
@@ -118,35 +135,18 @@ class Enemy(Entity):
         """
         self.direction *= -1
     
-    def can_shoot(self):
-        """
-        Verifica si el enemigo puede disparar.
-        
-        Returns:
-            bool: True si puede disparar, False si está en cooldown
-        """
-        return self.shoot_timer <= 0
-    
     def shoot(self):
         """
-        El enemigo dispara (resetea el timer).
+        El enemigo dispara.
+        
+        La recarga la controla el FireDirector: solo elige a
+        enemigos que ya pueden disparar.
         
         Returns:
-            tuple: Posición (x, y) desde donde sale la bala, o None
-        """
-        if self.can_shoot():
-            # Resetear timer con un valor aleatorio
-            import random
-            self.shoot_timer = random.uniform(1.0, 3.0)
-            
-            # Calcular posición de spawn de la bala
-            # Sale del centro-abajo del enemigo
-            bullet_x = self.rect.centerx
-            bullet_y = self.rect.bottom
-            
-            return (bullet_x, bullet_y)
-        
-        return None
+            tuple: Posición (x, y) desde donde sale la bala
+        """
+        # Sale del centro-abajo del enemigo
+        return (self.rect.centerx, self.rect.bottom)
     
     def take_damage(self, damage=1):
         """
@@ -162,11 +162,36 @@ class Enemy(Entity):
         
         if self.health <= 0:
             # Enemigo muerto
-            print(f"💥 Enemigo {self.enemy_type} destruido!")
+            logger.debug("💥 Enemigo %s destruido!", self.enemy_type)
             self.destroy()
             return self.points
         else:
             # Aún vivo (solo tanques pueden sobrevivir un disparo)
-            print(f"🎯 Enemigo golpeado! Vida restante: {self.health}")
-            # Efecto visual: parpadeo rojo (opcional)
+            logger.debug("🎯 Enemigo golpeado! Vida restante: %s", self.health)
+            # Efecto visual: usar la variante dañada (ya pre-tintada)
+            try:
+                self.set_image(self.get_sprite(damaged=True))
+            except pygame.error:
+                pass  # Sin sprite: se mantiene el rectángulo de color
             return 0
+    
+    def set_image(self, image):
+        """
+        Cambia el aspecto del enemigo (daño, frame de animación...).
+        
+        Si está en formación, avisa para que se vuelva a componer.
+        
+        Args:
+            image: Nueva superficie del enemigo
+        """
+        self.image = image
+        if self.formation is not None:
+            self.formation.mark_changed()
+    
+    def destroy(self):
+        """
+        Destruye al enemigo y libera su celda de la formación.
+        """
+        if self.formation is not None:
+            self.formation.remove(self)
+        super().destroy()
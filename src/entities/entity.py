@@ -4,6 +4,7 @@
 # Esta clase base define la interfaz común para todas las entidades
 # (jugador, enemigos, balas, power-ups, etc.)
 
+import math
 import pygame
 from abc import ABC, abstractmethod
 
@@ -45,12 +46,49 @@ class Entity(pygame.sprite.Sprite, ABC):
         self.rect.x = x
         self.rect.y = y
         
-        # Velocidad de la entidad (píxeles por frame)
+        # Posición real en float (el rect solo guarda enteros)
+        # prev_x/prev_y: posición al inicio del paso de simulación,
+        # para interpolar el dibujo entre dos pasos
+        self.pos_x = float(x)
+        self.pos_y = float(y)
+        self.prev_x = self.pos_x
+        self.prev_y = self.pos_y
+        
+        # Velocidad de la entidad (píxeles por segundo)
         self.velocity_x = 0
         self.velocity_y = 0
         
         # Estado de vida (para saber si debe ser eliminada)
         self.alive = True
+        
+        # Visibilidad de este frame (False = no se dibuja, ej: parpadeo)
+        self.visible = True
+        
+        # Pool al que vuelve al destruirse (None = no se reutiliza)
+        # in_pool: True mientras espera en la lista libre del pool
+        self.pool = None
+        self.in_pool = False
+        
+        # Registro de entidades al que pertenece y su posición en la
+        # lista de cada tipo: {tipo: índice} (lo gestiona EntityRegistry)
+        self.registry = None
+        self.slots = {}
+    
+    def reset(self, x, y):
+        """
+        Reinicia el estado común para reutilizar la entidad (pools).
+        
+        Las subclases lo extienden con sus propios atributos.
+        
+        Args:
+            x: Posición horizontal (píxeles)
+            y: Posición vertical (píxeles)
+        """
+        self.velocity_x = 0
+        self.velocity_y = 0
+        self.alive = True
+        self.visible = True
+        self.set_position(x, y)
     
     @abstractmethod
     def update(self, delta_time):
@@ -74,26 +112,76 @@ class Entity(pygame.sprite.Sprite, ABC):
         
         Args:
             screen: Superficie donde dibujar
+        
+        Returns:
+            Rect: Zona de la pantalla que se dibujó, o None si es invisible
         """
-        screen.blit(self.image, self.rect)
+        if not self.visible:
+            return None
+        return screen.blit(self.image, self.rect)
     
     def move(self, delta_time):
         """
         Mueve la entidad según su velocidad.
         
         Usa delta_time para movimiento independiente de FPS.
+        Guarda la posición anterior para poder interpolar el dibujo.
         
         Args:
             delta_time: Tiempo desde el último frame (segundos)
         """
-        self.rect.x += self.velocity_x * delta_time
-        self.rect.y += self.velocity_y * delta_time
+        self.prev_x = self.pos_x
+        self.prev_y = self.pos_y
+        self.pos_x += self.velocity_x * delta_time
+        self.pos_y += self.velocity_y * delta_time
+        self.sync_rect()
+    
+    def sync_rect(self):
+        """
+        Copia la posición float al rect (usado en colisiones).
+        """
+        self.rect.x = math.floor(self.pos_x)
+        self.rect.y = math.floor(self.pos_y)
+    
+    def set_position(self, x, y):
+        """
+        Coloca la entidad en una posición sin interpolar (teletransporte).
+        
+        Args:
+            x: Posición horizontal (esquina superior izquierda)
+            y: Posición vertical (esquina superior izquierda)
+        """
+        self.pos_x = self.prev_x = float(x)
+        self.pos_y = self.prev_y = float(y)
+        self.sync_rect()
+    
+    def render_position(self, alpha):
+        """
+        Posición de dibujo interpolada entre los dos últimos pasos.
+        
+        Args:
+            alpha: Fracción del paso de simulación transcurrida (0.0 a 1.0)
+        
+        Returns:
+            tuple: (x, y) en píxeles enteros
+        """
+        return (
+            math.floor(self.prev_x + (self.pos_x - self.prev_x) * alpha),
+            math.floor(self.prev_y + (self.pos_y - self.prev_y) * alpha)
+        )
     
     def destroy(self):
         """
         Marca la entidad para destrucción.
         
-        En el próximo update, será removida del juego.
+        Si está en un EntityRegistry, entra en su cola de destrucción
+        y se quita (y vuelve a su pool) en el próximo flush().
         """
         self.alive = False
         self.kill()  # Método de Sprite que remueve de todos los grupos
+        
+        if self.registry is not None:
+            self.registry.discard(self)
+        elif self.pool is not None:
+            # Volver al pool para ser reutilizada (en vez de ir al recolector)
+            self.pool.release(self)
@@ -0,0 +1,293 @@
+# ==============================================================================
+# ENTITY ARRAYS - ENTIDADES EN ARREGLOS DE NUMPY (STRUCTURE OF ARRAYS)
+# ==============================================================================
+# En vez de un objeto Sprite por entidad, cada atributo (x, y, velocidad...)
+# es un arreglo de NumPy con una posición por entidad. Mover, descontar
+# timers, descartar las que salen de pantalla y probar colisiones se hace
+# con UNA operación vectorizada para toda la población.
+#
+# NumPy es OPCIONAL: si no está instalado, NUMPY_AVAILABLE = False y el
+# juego sigue usando sprites normales
+
+import math
+import pygame
+from config import *
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+
+class EntityArrays:
+    """
+    Almacén de entidades simples en arreglos (SoA).
+
+    Campos por entidad: x, y (y su valor anterior para interpolar),
+    vx, vy (px/segundo), w, h, kind (índice de imagen), health,
+    timer (cuenta regresiva en segundos) y alive.
+
+    Las entidades vivas ocupan las posiciones [0, count). Las muertas
+    se marcan con alive = False y se compactan en compact().
+    Los índices son estables hasta la siguiente compactación.
+
+    Adaptador: al iterar se obtienen vistas (ArrayEntity) con rect,
+    alive y destroy(), así que CollisionManager y cualquier código
+    pensado para grupos de sprites sigue funcionando.
+    """
+
+    FIELDS = (
+        ('x', 'f8'), ('y', 'f8'), ('prev_x', 'f8'), ('prev_y', 'f8'),
+        ('vx', 'f8'), ('vy', 'f8'), ('w', 'i4'), ('h', 'i4'),
+        ('kind', 'i2'), ('health', 'i2'), ('timer', 'f8'), ('alive', '?'),
+    )
+
+    def __init__(self, images, capacity=ENTITY_ARRAYS_CAPACITY):
+        """
+        Constructor del almacén.
+
+        Args:
+            images: Secuencia de superficies; kind es el índice de la imagen
+            capacity: Capacidad inicial (se duplica si hace falta)
+
+        Raises:
+            RuntimeError: Si NumPy no está instalado
+        """
+        if not NUMPY_AVAILABLE:
+            raise RuntimeError("EntityArrays requiere NumPy (pip install numpy)")
+
+        self.images = tuple(images)
+        self.capacity = max(1, capacity)
+        self.count = 0
+
+        for name, dtype in self.FIELDS:
+            setattr(self, name, np.zeros(self.capacity, dtype=dtype))
+
+    def __len__(self):
+        """
+        Entidades VIVAS (las muertas siguen ocupando su posición
+        hasta compact(), pero no se cuentan).
+        """
+        return int(np.count_nonzero(self.alive[:self.count]))
+
+    def __iter__(self):
+        """
+        Recorre las entidades vivas como vistas ArrayEntity.
+
+        Es la ruta lenta (un objeto por entidad): úsala para pocas
+        entidades o desde código genérico.
+        """
+        for index in np.flatnonzero(self.alive[:self.count]):
+            yield ArrayEntity(self, int(index))
+
+    def grow(self):
+        """
+        Duplica la capacidad de todos los arreglos.
+        """
+        self.capacity *= 2
+        for name, _ in self.FIELDS:
+            old = getattr(self, name)
+            new = np.zeros(self.capacity, dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+
+    def spawn(self, x, y, vx, vy, w, h, kind=0, health=1, timer=0.0):
+        """
+        Añade una entidad al final de los arreglos.
+
+        Args:
+            x, y: Esquina superior izquierda (píxeles)
+            vx, vy: Velocidad (px/segundo)
+            w, h: Tamaño (píxeles)
+            kind: Índice de su imagen en images
+            health: Vida (o daño, según el uso)
+            timer: Cuenta regresiva inicial (segundos)
+
+        Returns:
+            int: Índice de la nueva entidad
+        """
+        if self.count == self.capacity:
+            self.grow()
+
+        i = self.count
+        self.x[i] = self.prev_x[i] = x
+        self.y[i] = self.prev_y[i] = y
+        self.vx[i] = vx
+        self.vy[i] = vy
+        self.w[i] = w
+        self.h[i] = h
+        self.kind[i] = kind
+        self.health[i] = health
+        self.timer[i] = timer
+        self.alive[i] = True
+
+        self.count += 1
+        return i
+
+    def update(self, delta_time):
+        """
+        Mueve todas las entidades, descuenta sus timers y marca como
+        muertas las que salieron de la pantalla.
+
+        Args:
+            delta_time: Duración del paso de simulación (segundos)
+        """
+        n = self.count
+        if n == 0:
+            return
+
+        x, y = self.x[:n], self.y[:n]
+        self.prev_x[:n] = x
+        self.prev_y[:n] = y
+        x += self.vx[:n] * delta_time
+        y += self.vy[:n] * delta_time
+
+        timer = self.timer[:n]
+        np.maximum(timer - delta_time, 0, out=timer)
+
+        # Fuera de pantalla: el rect ya no toca la ventana
+        offscreen = ((x + self.w[:n] < 0) | (x > WINDOW_WIDTH) |
+                     (y + self.h[:n] < 0) | (y > WINDOW_HEIGHT))
+        self.alive[:n] &= ~offscreen
+
+    def compact(self):
+        """
+        Elimina las entidades muertas, dejando las vivas contiguas.
+        """
+        n = self.count
+        keep = self.alive[:n]
+        alive_count = int(np.count_nonzero(keep))
+        if alive_count == n:
+            return
+
+        for name, _ in self.FIELDS:
+            field = getattr(self, name)
+            field[:alive_count] = field[:n][keep]
+        self.count = alive_count
+
+    def overlap(self, rect):
+        """
+        Entidades vivas cuyo rect se superpone con el dado (AABB).
+
+        Args:
+            rect: pygame.Rect de consulta
+
+        Returns:
+            ndarray: Índices de las entidades que colisionan
+        """
+        n = self.count
+        left = np.floor(self.x[:n])
+        top = np.floor(self.y[:n])
+        hits = (self.alive[:n] &
+                (left < rect.right) & (left + self.w[:n] > rect.left) &
+                (top < rect.bottom) & (top + self.h[:n] > rect.top))
+        return np.flatnonzero(hits)
+
+    def bounds(self):
+        """
+        Rect que envuelve a todas las entidades vivas.
+
+        Returns:
+            pygame.Rect: Caja envolvente, o None si no hay entidades vivas
+        """
+        n = self.count
+        alive = self.alive[:n]
+        if not alive.any():
+            return None
+        left = np.floor(self.x[:n][alive])
+        top = np.floor(self.y[:n][alive])
+        x_min, y_min = int(left.min()), int(top.min())
+        return pygame.Rect(x_min, y_min,
+                           int((left + self.w[:n][alive]).max()) - x_min,
+                           int((top + self.h[:n][alive]).max()) - y_min)
+
+    def kill(self, indices):
+        """
+        Marca entidades como muertas.
+
+        Args:
+            indices: Índice o arreglo de índices
+        """
+        self.alive[indices] = False
+
+    def blit_sequence(self, alpha=1.0):
+        """
+        Lista (imagen, posición) de las entidades vivas para Surface.blits().
+
+        Args:
+            alpha: Interpolación entre los dos últimos pasos (1.0 = actual)
+
+        Returns:
+            list: Tuplas (Surface, (x, y))
+        """
+        n = self.count
+        alive = self.alive[:n]
+        x, y = self.x[:n][alive], self.y[:n][alive]
+        if alpha < 1.0:
+            x = self.prev_x[:n][alive] + (x - self.prev_x[:n][alive]) * alpha
+            y = self.prev_y[:n][alive] + (y - self.prev_y[:n][alive]) * alpha
+
+        images = self.images
+        return [
+            (images[kind], (left, top))
+            for kind, left, top in zip(
+                self.kind[:n][alive].tolist(),
+                np.floor(x).astype(np.int32).tolist(),
+                np.floor(y).astype(np.int32).tolist()
+            )
+        ]
+
+    def empty(self):
+        """
+        Elimina todas las entidades (misma interfaz que Group.empty()).
+        """
+        self.count = 0
+
+
+class ArrayEntity:
+    """
+    Vista de UNA entidad de un EntityArrays.
+
+    Imita lo que el resto del juego usa de un sprite
+    (rect, image, alive, visible, destroy()) sin copiar datos.
+    """
+
+    __slots__ = ('store', 'index')
+
+    visible = True
+
+    def __init__(self, store, index):
+        self.store = store
+        self.index = index
+
+    @property
+    def rect(self):
+        store, i = self.store, self.index
+        return pygame.Rect(math.floor(store.x[i]), math.floor(store.y[i]),
+                           int(store.w[i]), int(store.h[i]))
+
+    @property
+    def image(self):
+        return self.store.images[self.store.kind[self.index]]
+
+    @property
+    def alive(self):
+        return bool(self.store.alive[self.index])
+
+    def render_position(self, alpha):
+        """
+        Posición de dibujo interpolada (misma interfaz que Entity).
+        """
+        store, i = self.store, self.index
+        return (
+            math.floor(store.prev_x[i] + (store.x[i] - store.prev_x[i]) * alpha),
+            math.floor(store.prev_y[i] + (store.y[i] - store.prev_y[i]) * alpha)
+        )
+
+    def destroy(self):
+        """
+        Marca la entidad como muerta (se compacta más tarde).
+        """
+        self.store.alive[self.index] = False
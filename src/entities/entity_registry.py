@@ -0,0 +1,179 @@
+# ==============================================================================
+# ENTITY REGISTRY - REGISTRO DE ENTIDADES POR TIPO
+# ==============================================================================
+# Sustituye a los grupos de sprites superpuestos (all_sprites, bullets,
+# player_bullets...). Cada tipo ("kind") tiene una lista compacta y las
+# entidades destruidas se quitan en un solo paso, al final de cada fase
+
+class EntityRegistry:
+    """
+    Registro de entidades con índices por tipo.
+
+    - add(entidad, *tipos): la agrega a la lista de cada tipo
+    - kind(tipo): lista compacta de ese tipo (para recorrer, len(), etc.)
+    - Entity.destroy() NO la quita en el momento: la pone en la cola
+      de destrucción (discard). flush() procesa la cola.
+
+    Quitar una entidad cuesta O(1) por tipo: el hueco se rellena con la
+    última de la lista. Así cada limpieza cuesta O(entidades muertas),
+    no O(todas las entidades × grupos).
+
+    Las listas son siempre el MISMO objeto: se pueden guardar en
+    atributos (ej: game_screen.enemies) y pasar a otros managers.
+    """
+
+    def __init__(self, kinds, indexes=()):
+        """
+        Constructor del registro.
+
+        Args:
+            kinds: Nombres de los tipos, en orden de actualización
+                   (ej: "players", "enemies", "player_bullets")
+            indexes: Índices secundarios: subconjuntos de otro tipo
+                     (ej: "loose_enemies"). Se pueden consultar pero
+                     update() no los recorre (ya se actualizan por su tipo)
+        """
+        self.kinds = tuple(kinds)
+        self.indexes = tuple(indexes)
+        self.lists = {kind: [] for kind in self.kinds + self.indexes}
+
+        # Cola de destrucción (se vacía en flush())
+        self.pending = []
+
+        # Estadísticas
+        self.destroyed = 0
+
+    def kind(self, kind):
+        """
+        Devuelve la lista compacta de un tipo.
+
+        Args:
+            kind: Nombre del tipo
+
+        Returns:
+            list: Entidades registradas de ese tipo (no modificar a mano)
+        """
+        return self.lists[kind]
+
+    def add(self, entity, *kinds):
+        """
+        Registra una entidad en uno o varios tipos.
+
+        Si ya estaba registrada, solo se agregan los tipos nuevos
+        (ej: un enemigo que pasa a ser "suelto").
+
+        Args:
+            entity: Entidad a registrar
+            *kinds: Tipos a los que pertenece
+        """
+        entity.registry = self
+        slots = entity.slots
+        for kind in kinds:
+            if kind in slots:
+                continue
+            entities = self.lists[kind]
+            slots[kind] = len(entities)
+            entities.append(entity)
+
+    def remove_kind(self, entity, kind):
+        """
+        Quita una entidad de UN tipo, en O(1).
+
+        El hueco se rellena con la última entidad de la lista.
+
+        Args:
+            entity: Entidad registrada en ese tipo
+            kind: Tipo del que se quita
+        """
+        entities = self.lists[kind]
+        index = entity.slots.pop(kind)
+        last = entities.pop()
+        if last is not entity:
+            entities[index] = last
+            last.slots[kind] = index
+
+    def discard(self, entity):
+        """
+        Pone una entidad en la cola de destrucción.
+
+        La llama Entity.destroy(). La entidad sigue en las listas
+        (con alive = False) hasta el próximo flush().
+
+        Args:
+            entity: Entidad destruida
+        """
+        self.pending.append(entity)
+
+    def flush(self):
+        """
+        Procesa la cola de destrucción.
+
+        Quita cada entidad destruida de todos sus tipos y, si viene
+        de un pool, la devuelve a él (recién aquí es seguro reutilizarla).
+
+        Returns:
+            int: Entidades quitadas
+        """
+        pending = self.pending
+        if not pending:
+            return 0
+
+        removed = 0
+        for entity in pending:
+            # Destruida dos veces: ya se quitó en esta misma pasada
+            if entity.registry is not self:
+                continue
+
+            for kind in list(entity.slots):
+                self.remove_kind(entity, kind)
+            entity.registry = None
+            removed += 1
+
+            if entity.pool is not None:
+                entity.pool.release(entity)
+
+        pending.clear()
+        self.destroyed += removed
+        return removed
+
+    def update(self, delta_time):
+        """
+        Actualiza todas las entidades, tipo por tipo.
+
+        Las entidades agregadas durante el recorrido se actualizan
+        a partir del próximo paso; las destruidas no se vuelven
+        a actualizar.
+
+        Args:
+            delta_time: Duración del paso de simulación (segundos)
+        """
+        for kind in self.kinds:
+            entities = self.lists[kind]
+            for i in range(len(entities)):
+                entity = entities[i]
+                if entity.alive:
+                    entity.update(delta_time)
+
+    def clear(self):
+        """
+        Destruye todas las entidades registradas.
+        """
+        for entities in self.lists.values():
+            for entity in entities:
+                if entity.alive:
+                    entity.destroy()
+                else:
+                    self.discard(entity)
+        self.flush()
+
+    def get_stats(self):
+        """
+        Devuelve las estadísticas del registro.
+
+        Returns:
+            dict: Entidades por tipo, pendientes y destruidas en total
+        """
+        stats = {kind: len(entities) for kind, entities in self.lists.items()}
+        stats['pending'] = len(self.pending)
+        stats['destroyed'] = self.destroyed
+        return stats
@@ -0,0 +1,370 @@
+# ==============================================================================
+# FORMATION - FORMACIÓN DE ENEMIGOS
+# ==============================================================================
+# Rejilla rígida de enemigos: todos se mueven juntos como un solo bloque.
+# La posición de cada enemigo es: origen de la formación + su celda
+
+import math
+from config import *
+
+
+class Formation:
+    """
+    Formación rígida de enemigos en rejilla (filas x columnas).
+
+    Responsabilidades:
+    - Guardar qué enemigo ocupa cada celda (fila, columna)
+    - Mover a todos los enemigos a la vez (un solo origen x, y)
+    - Avisar cuándo cambió su aspecto (para la capa de renderizado)
+
+    El origen se guarda en float para permitir velocidades
+    con decimales; los rects se calculan con floor().
+    prev_x/prev_y guardan el origen al inicio del paso de simulación
+    para interpolar el dibujo.
+    """
+
+    def __init__(self, rows, cols, x, y, spacing_x, spacing_y):
+        """
+        Constructor de la formación.
+
+        Args:
+            rows: Número de filas
+            cols: Número de columnas
+            x: Posición horizontal de la celda (0, 0)
+            y: Posición vertical de la celda (0, 0)
+            spacing_x: Distancia horizontal entre columnas
+            spacing_y: Distancia vertical entre filas
+        """
+        self.rows = rows
+        self.cols = cols
+        self.x = float(x)
+        self.y = float(y)
+        self.prev_x = self.x
+        self.prev_y = self.y
+        self.spacing_x = spacing_x
+        self.spacing_y = spacing_y
+
+        # Dirección de movimiento horizontal (1 = derecha, -1 = izquierda)
+        self.direction = 1
+
+        # Rejilla de enemigos: grid[fila][columna] = Enemy o None
+        self.grid = [[None] * cols for _ in range(rows)]
+
+        # Enemigos vivos en la formación
+        self.count = 0
+
+        # Enemigos vivos por fila y por columna
+        self.row_counts = [0] * rows
+        self.col_counts = [0] * cols
+
+        # Filas y columnas extremas con algún enemigo vivo (límites del bloque).
+        # Se actualizan al añadir/quitar enemigos, así los bordes se
+        # consultan sin recorrer la formación. Vacía: first > last
+        self.first_row = rows
+        self.last_row = -1
+        self.first_col = cols
+        self.last_col = -1
+
+        # Fila del enemigo vivo más bajo de cada columna (-1 = columna vacía).
+        # Es el único que puede disparar sin darle a sus compañeros
+        self.col_bottom = [-1] * cols
+
+        # Enemigos que pasaron a ser el más bajo de su columna (al añadirse
+        # o al morir el de abajo). El FireDirector los recoge en cada paso
+        self.promoted = []
+
+        # Enemigos VIVOS que salieron de la formación (release).
+        # GameScreen los pasa al grupo de enemigos sueltos
+        self.released = []
+
+        # Tamaño total de la formación en píxeles
+        self.width = (cols - 1) * spacing_x + ENEMY_WIDTH
+        self.height = (rows - 1) * spacing_y + ENEMY_HEIGHT
+
+        # Se incrementa cada vez que cambia el aspecto de la formación
+        # (un enemigo muere, recibe daño o cambia de frame de animación)
+        self.version = 0
+
+    def __iter__(self):
+        """
+        Recorre los enemigos vivos de la formación.
+        """
+        for row in self.grid:
+            for enemy in row:
+                if enemy is not None:
+                    yield enemy
+
+    def __len__(self):
+        return self.count
+
+    def add(self, enemy, row, col):
+        """
+        Coloca un enemigo en una celda de la formación.
+
+        Args:
+            enemy: Enemigo a colocar
+            row: Fila de la celda
+            col: Columna de la celda
+        """
+        self.grid[row][col] = enemy
+        enemy.formation = self
+        enemy.slot = (row, col)
+        enemy.rect.topleft = self.cell_position(row, col)
+
+        self.count += 1
+        self.row_counts[row] += 1
+        self.col_counts[col] += 1
+        self.first_row = min(self.first_row, row)
+        self.last_row = max(self.last_row, row)
+        self.first_col = min(self.first_col, col)
+        self.last_col = max(self.last_col, col)
+        if row > self.col_bottom[col]:
+            self.col_bottom[col] = row
+            self.promoted.append(enemy)
+        self.version += 1
+
+    def remove(self, enemy):
+        """
+        Quita un enemigo de la formación (murió o salió de ella).
+
+        Args:
+            enemy: Enemigo a quitar
+        """
+        row, col = enemy.slot
+        if self.grid[row][col] is enemy:
+            self.grid[row][col] = None
+            self.count -= 1
+            self.row_counts[row] -= 1
+            self.col_counts[col] -= 1
+            if self.col_bottom[col] == row:
+                self.update_column_bottom(col)
+            self.update_bounds()
+            self.version += 1
+
+        enemy.formation = None
+        enemy.slot = None
+
+        # Desde ahora se mueve por su cuenta, desde donde estaba
+        enemy.set_position(enemy.rect.x, enemy.rect.y)
+
+    def update_bounds(self):
+        """
+        Recorta las filas/columnas extremas que se quedaron vacías.
+
+        Solo avanza desde los extremos hacia dentro: cada fila o columna
+        se descarta una vez por oleada (coste amortizado O(1) por muerte).
+        """
+        row_counts = self.row_counts
+        while self.first_row <= self.last_row and row_counts[self.first_row] == 0:
+            self.first_row += 1
+        while self.last_row >= self.first_row and row_counts[self.last_row] == 0:
+            self.last_row -= 1
+
+        col_counts = self.col_counts
+        while self.first_col <= self.last_col and col_counts[self.first_col] == 0:
+            self.first_col += 1
+        while self.last_col >= self.first_col and col_counts[self.last_col] == 0:
+            self.last_col -= 1
+
+    def update_column_bottom(self, col):
+        """
+        Busca el nuevo enemigo más bajo de una columna (murió el anterior).
+
+        Solo sube desde la fila del que murió: como mucho `rows` celdas.
+
+        Args:
+            col: Columna cuyo enemigo más bajo dejó la formación
+        """
+        grid = self.grid
+        row = self.col_bottom[col] - 1
+        while row >= 0 and grid[row][col] is None:
+            row -= 1
+
+        self.col_bottom[col] = row
+        if row >= 0:
+            self.promoted.append(grid[row][col])
+
+    def is_front(self, enemy):
+        """
+        Comprueba si un enemigo es el más bajo de su columna.
+
+        Args:
+            enemy: Enemigo de la formación
+
+        Returns:
+            bool: True si nadie de la formación le tapa el disparo
+        """
+        if enemy.formation is not self:
+            return False
+        row, col = enemy.slot
+        return self.col_bottom[col] == row
+
+    @property
+    def left(self):
+        """
+        Borde izquierdo del enemigo vivo más a la izquierda (píxeles).
+        """
+        return math.floor(self.x) + self.first_col * self.spacing_x
+
+    @property
+    def right(self):
+        """
+        Borde derecho del enemigo vivo más a la derecha (píxeles).
+        """
+        return math.floor(self.x) + self.last_col * self.spacing_x + ENEMY_WIDTH
+
+    @property
+    def top(self):
+        """
+        Borde superior de la fila viva más alta (píxeles).
+        """
+        return math.floor(self.y) + self.first_row * self.spacing_y
+
+    @property
+    def bottom(self):
+        """
+        Borde inferior de la fila viva más baja (píxeles).
+        """
+        return math.floor(self.y) + self.last_row * self.spacing_y + ENEMY_HEIGHT
+
+    def is_near(self, rect, margin=0):
+        """
+        Comprueba si un rect está cerca de los enemigos vivos.
+
+        Compara solo con la caja que envuelve a los vivos: sirve para
+        descartar en O(1) las pruebas de colisión contra el jugador.
+
+        Args:
+            rect: Rect a comprobar (ej: el jugador)
+            margin: Distancia extra en píxeles
+
+        Returns:
+            bool: True si el rect toca la caja ampliada en margin
+        """
+        if self.count == 0:
+            return False
+
+        return (rect.right > self.left - margin and
+                rect.left < self.right + margin and
+                rect.bottom > self.top - margin and
+                rect.top < self.bottom + margin)
+
+    def release(self, enemy):
+        """
+        Saca de la formación a un enemigo que sigue vivo.
+
+        A partir de aquí se mueve y colisiona como enemigo suelto.
+
+        Args:
+            enemy: Enemigo que abandona la formación
+        """
+        self.remove(enemy)
+        self.released.append(enemy)
+
+    def query(self, rect):
+        """
+        Enemigos de las celdas que solapa un rect.
+
+        Como la formación es una rejilla regular, las celdas se calculan
+        con aritmética: no hace falta recorrer a todos los enemigos.
+        Una bala solapa como mucho 2x2 celdas.
+
+        Son CANDIDATOS: hay que confirmar con colliderect().
+
+        Args:
+            rect: Rect de consulta (ej: una bala)
+
+        Returns:
+            list: Enemigos vivos de las celdas solapadas
+        """
+        if self.count == 0:
+            return []
+
+        origin_x = math.floor(self.x)
+        origin_y = math.floor(self.y)
+
+        # Celda c ocupa [origen + c*spacing, origen + c*spacing + tamaño).
+        # Se limita a las filas/columnas extremas con enemigos vivos
+        col_min = max((rect.left - origin_x - ENEMY_WIDTH) // self.spacing_x + 1, self.first_col)
+        col_max = min((rect.right - 1 - origin_x) // self.spacing_x, self.last_col)
+        row_min = max((rect.top - origin_y - ENEMY_HEIGHT) // self.spacing_y + 1, self.first_row)
+        row_max = min((rect.bottom - 1 - origin_y) // self.spacing_y, self.last_row)
+
+        if col_min > col_max or row_min > row_max:
+            return []
+
+        return [enemy
+                for row in self.grid[row_min:row_max + 1]
+                for enemy in row[col_min:col_max + 1]
+                if enemy is not None]
+
+    def mark_changed(self):
+        """
+        Indica que el aspecto de algún enemigo cambió.
+
+        La capa de renderizado volverá a componer la formación.
+        """
+        self.version += 1
+
+    def cell_position(self, row, col):
+        """
+        Calcula la posición en pantalla de una celda.
+
+        Args:
+            row: Fila de la celda
+            col: Columna de la celda
+
+        Returns:
+            tuple: (x, y) en píxeles enteros
+        """
+        return (
+            math.floor(self.x) + col * self.spacing_x,
+            math.floor(self.y) + row * self.spacing_y
+        )
+
+    def save_position(self):
+        """
+        Guarda el origen actual como "anterior" (inicio del paso).
+        """
+        self.prev_x = self.x
+        self.prev_y = self.y
+
+    def render_position(self, alpha):
+        """
+        Origen de dibujo interpolado entre los dos últimos pasos.
+
+        Args:
+            alpha: Fracción del paso de simulación transcurrida (0.0 a 1.0)
+
+        Returns:
+            tuple: (x, y) en píxeles enteros
+        """
+        return (
+            math.floor(self.prev_x + (self.x - self.prev_x) * alpha),
+            math.floor(self.prev_y + (self.y - self.prev_y) * alpha)
+        )
+
+    def move(self, dx, dy=0):
+        """
+        Mueve toda la formación y actualiza los rects de sus enemigos.
+
+        Args:
+            dx: Desplazamiento horizontal (píxeles, puede tener decimales)
+            dy: Desplazamiento vertical (píxeles)
+        """
+        self.x += dx
+        self.y += dy
+
+        origin_x = math.floor(self.x)
+        origin_y = math.floor(self.y)
+        for row, enemies in enumerate(self.grid):
+            y = origin_y + row * self.spacing_y
+            for col, enemy in enumerate(enemies):
+                if enemy is not None:
+                    enemy.rect.topleft = (origin_x + col * self.spacing_x, y)
+
+    def reverse_direction(self):
+        """
+        Invierte la dirección de movimiento horizontal.
+        """
+        self.direction *= -1
@@ -3,10 +3,14 @@
 # ==============================================================================
 # Clase que representa al jugador (la nave espacial)
 
+import logging
 import pygame
 from src.entities.entity import Entity
+from src.managers.asset_manager import AssetManager
 from config import *
 
+logger = logging.getLogger(__name__)
+
 class Player(Entity):
     """
     Clase del jugador.
@@ -18,33 +22,35 @@ class Player(Entity):
     - Colisiones con enemigos/balas
     """
     
-    def __init__(self, x, y):
+    def __init__(self, x, y, scheduler):
         """
         Constructor del jugador.
         
         Args:
             x: Posición horizontal inicial
             y: Posición vertical inicial
+            scheduler: TimerScheduler del juego (cooldowns e invulnerabilidad)
         """
         # Llamar al constructor de Entity
         super().__init__(x, y, PLAYER_WIDTH, PLAYER_HEIGHT)
         
-        # Cargar sprite del jugador desde imagen
+        # Obtener sprite del jugador desde la caché (ya cargado y escalado)
         try:
-            self.image = pygame.image.load('assets/images/player.png').convert_alpha()
-            # Escalar la imagen al tamaño configurado
-            self.image = pygame.transform.scale(self.image, (PLAYER_WIDTH, PLAYER_HEIGHT))
-            print("✅ Sprite del jugador cargado")
+            self.image = AssetManager().get_image(PLAYER_IMAGE, (PLAYER_WIDTH, PLAYER_HEIGHT))
+            logger.debug("✅ Sprite del jugador cargado")
         except pygame.error as e:
-            print(f"⚠️ No se pudo cargar sprite del jugador: {e}")
+            logger.warning("⚠️ No se pudo cargar sprite del jugador: %s", e)
             # Fallback: usar rectángulo azul
             self.image.fill(BLUE)
         
         # Velocidad de movimiento (se usa cuando se presionan teclas)
         self.speed = PLAYER_SPEED
         
+        # Timers en el reloj del juego (pausa incluida)
+        self.scheduler = scheduler
+        
         # Cooldown de disparo
-        self.shoot_cooldown = 0  # Tiempo restante hasta poder disparar
+        self.shoot_timer = None  # Timer de recarga (None = puede disparar)
         self.shoot_delay = PLAYER_SHOOT_COOLDOWN / 1000.0  # Convertir ms a segundos
         
         # Vidas del jugador
@@ -52,8 +58,12 @@ class Player(Entity):
         
         # Estado de invulnerabilidad (después de ser golpeado)
         self.invulnerable = False
-        self.invulnerable_time = 0
+        self.invulnerable_timer = None
         self.invulnerable_duration = 2.0  # 2 segundos de invulnerabilidad
+        
+        # Controlador externo (ej: piloto automático en modo headless)
+        # None = se usa el teclado
+        self.controller = None
     
     def handle_input(self):
         """
@@ -65,7 +75,14 @@ class Player(Entity):
         
         Nota: No usamos events, sino get_pressed() para
         movimiento continuo y suave.
+        
+        Si hay un controlador asignado, él decide la dirección.
         """
+        # Controlador externo: devuelve -1 (izquierda), 0 o 1 (derecha)
+        if self.controller is not None:
+            self.velocity_x = self.controller.get_direction() * self.speed
+            return
+        
         # Obtener estado de todas las teclas
         # get_pressed() retorna un diccionario de teclas
         keys = pygame.key.get_pressed()
@@ -92,26 +109,22 @@ class Player(Entity):
         self.handle_input()
         
         # Mover al jugador según su velocidad
-        self.rect.x += self.velocity_x
+        self.move(delta_time)
         
         # Aplicar límites de pantalla (no puede salir)
         # Limitar por la izquierda
-        if self.rect.left < 0:
-            self.rect.left = 0
+        if self.pos_x < 0:
+            self.pos_x = 0.0
+            self.sync_rect()
         
         # Limitar por la derecha
-        if self.rect.right > WINDOW_WIDTH:
-            self.rect.right = WINDOW_WIDTH
-        
-        # Actualizar cooldown de disparo
-        if self.shoot_cooldown > 0:
-            self.shoot_cooldown -= delta_time
-        
-        # Actualizar invulnerabilidad
-        if self.invulnerable:
-            self.invulnerable_time -= delta_time
-            if self.invulnerable_time <= 0:
-                self.invulnerable = False
+        if self.pos_x > WINDOW_WIDTH - self.rect.width:
+            self.pos_x = float(WINDOW_WIDTH - self.rect.width)
+            self.sync_rect()
+        
+        # Parpadeo mientras es invulnerable: visible cada 0.1 segundos
+        # (el cooldown y la invulnerabilidad los vence el scheduler)
+        self.visible = not self.invulnerable or int(self.invulnerable_timer.remaining * 10) % 2 != 0
     
     def can_shoot(self):
         """
@@ -120,7 +133,13 @@ class Player(Entity):
         Returns:
             bool: True si puede disparar, False si está en cooldown
         """
-        return self.shoot_cooldown <= 0
+        return self.shoot_timer is None
+    
+    def reload(self):
+        """
+        Termina el cooldown de disparo (lo llama el scheduler).
+        """
+        self.shoot_timer = None
     
     def shoot(self):
         """
@@ -133,8 +152,8 @@ class Player(Entity):
             tuple: Posición (x, y) desde donde sale la bala
         """
         if self.can_shoot():
-            # Resetear cooldown
-            self.shoot_cooldown = self.shoot_delay
+            # Iniciar cooldown
+            self.shoot_timer = self.scheduler.schedule(self.shoot_delay, self.reload)
             
             # Calcular posición de spawn de la bala
             # Sale del centro-arriba del jugador
@@ -153,31 +172,23 @@ class Player(Entity):
         """
         if not self.invulnerable:
             self.lives -= 1
-            print(f"💔 Jugador golpeado! Vidas restantes: {self.lives}")
+            logger.info("💔 Jugador golpeado! Vidas restantes: %s", self.lives)
             
             if self.lives > 0:
                 # Activar invulnerabilidad
                 self.invulnerable = True
-                self.invulnerable_time = self.invulnerable_duration
+                self.invulnerable_timer = self.scheduler.schedule(
+                    self.invulnerable_duration, self.end_invulnerability
+                )
             else:
                 # Game Over
-                print("☠️ Game Over!")
+                logger.info("☠️ Game Over!")
                 self.destroy()
     
-    def draw(self, screen):
+    def end_invulnerability(self):
         """
-        Dibuja al jugador.
-        
-        Si está invulnerable, parpadea (efecto visual).
-        
-        Args:
-            screen: Superficie donde dibujar
+        Termina la invulnerabilidad (lo llama el scheduler).
         """
-        # Si está invulnerable, hacer parpadeo
-        if self.invulnerable:
-            # Parpadear cada 0.1 segundos
-            if int(self.invulnerable_time * 10) % 2 == 0:
-                return  # No dibujar (efecto de parpadeo)
-        
-        # Dibujar normalmente
-        super().draw(screen)
+        self.invulnerable = False
+        self.invulnerable_timer = None
+        self.visible = True
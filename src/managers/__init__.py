@@ -1,3 +1,17 @@
+from .log_manager import LogManager
+from .frame_profiler import FrameProfiler
+from .tracer import Tracer, traced
+from .gc_manager import GCManager
+from .profile_capture import ProfileCapture
+from .hitch_watchdog import HitchWatchdog
 from .game_manager import GameManager
+from .asset_manager import AssetManager
+from .font_manager import FontManager
+from .text_cache import TextCache
+from .resource_loader import ResourceLoader
+from .pool_manager import PoolManager, ObjectPool
+from .timer_scheduler import TimerScheduler, Timer
 from .spawn_manager import SpawnManager
+from .fire_director import FireDirector
+from .spatial_hash import SpatialHash
 from .collision_manager import CollisionManager
\ No newline at end of file
@@ -0,0 +1,236 @@
+# ==============================================================================
+# ASSET MANAGER - CACHÉ GLOBAL DE RECURSOS
+# ==============================================================================
+# Este manager carga cada imagen UNA sola vez y la comparte entre todas
+# las entidades que la usan (jugador, enemigos, balas).
+# También pre-calcula las variantes tintadas de cada sprite.
+
+import logging
+import threading
+import pygame
+
+logger = logging.getLogger(__name__)
+
+
+class AssetManager():
+    """
+    Caché de recursos del juego (Patrón Singleton).
+
+    SINGLETON: Todas las entidades comparten la misma caché durante
+    toda la ejecución del programa.
+
+    Responsabilidades:
+    - Cargar, convertir y escalar cada imagen una sola vez
+    - Entregar superficies compartidas indexadas por (ruta, tamaño)
+    - Generar una sola vez cada variante tintada (ruta, tamaño, tintes)
+    - Cargar sonidos una sola vez
+    - Llevar estadísticas de aciertos/fallos de la caché
+
+    Es seguro usarlo desde el hilo de carga del LoadingScreen.
+
+    IMPORTANTE: Las superficies entregadas son COMPARTIDAS.
+    Si una entidad necesita modificar su imagen, debe hacer .copy() primero.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(AssetManager, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+
+        # Imágenes escaladas: {(ruta, (ancho, alto)): Surface}
+        self.images = {}
+
+        # Variantes tintadas: {(ruta, (ancho, alto), tintes): Surface}
+        self.variants = {}
+
+        # Imágenes originales decodificadas: {ruta: Surface}
+        # Así escalar la misma imagen a otro tamaño no vuelve a leer el disco
+        self.raw_images = {}
+
+        # Sonidos: {ruta: Sound}
+        self.sounds = {}
+
+        # Estadísticas de la caché
+        self.hits = 0
+        self.misses = 0
+
+        # Candado: la carga inicial ocurre en un hilo aparte
+        self.lock = threading.RLock()
+
+        self._initialized = True
+        logger.info("✅ AssetManager inicializado")
+
+    def load_raw_image(self, path):
+        """
+        Carga y decodifica una imagen desde disco (sin escalar).
+
+        Args:
+            path: Ruta del archivo de imagen
+
+        Returns:
+            Surface: Imagen convertida con canal alfa
+                     (sin convertir si no hay ventana, ej: modo headless)
+
+        Raises:
+            pygame.error: Si la imagen no se puede cargar
+        """
+        with self.lock:
+            image = self.raw_images.get(path)
+            if image is None:
+                image = pygame.image.load(path)
+                if pygame.display.get_surface() is not None:
+                    image = image.convert_alpha()
+                self.raw_images[path] = image
+            return image
+
+    def get_image(self, path, size):
+        """
+        Devuelve la imagen escalada al tamaño pedido.
+
+        La primera vez se carga desde disco; las siguientes se
+        entrega la misma superficie desde la caché.
+
+        Args:
+            path: Ruta del archivo de imagen
+            size: Tupla (ancho, alto) del tamaño final
+
+        Returns:
+            Surface: Superficie COMPARTIDA (no modificar sin copiar)
+
+        Raises:
+            pygame.error: Si la imagen no se puede cargar
+        """
+        key = (path, tuple(size))
+
+        with self.lock:
+            image = self.images.get(key)
+            if image is not None:
+                self.hits += 1
+                return image
+
+            self.misses += 1
+            image = pygame.transform.scale(self.load_raw_image(path), key[1])
+            self.images[key] = image
+            return image
+
+    def get_variant(self, path, size, tints=()):
+        """
+        Devuelve la imagen escalada con una secuencia de tintes aplicada.
+
+        Cada tinte se aplica con BLEND_RGBA_MULT, en orden. La variante
+        se genera una sola vez y después se comparte desde la caché.
+
+        Args:
+            path: Ruta del archivo de imagen
+            size: Tupla (ancho, alto) del tamaño final
+            tints: Tupla de colores RGBA a aplicar (vacía = imagen original)
+
+        Returns:
+            Surface: Superficie COMPARTIDA (no modificar sin copiar)
+
+        Raises:
+            pygame.error: Si la imagen no se puede cargar
+        """
+        if not tints:
+            return self.get_image(path, size)
+
+        key = (path, tuple(size), tuple(tints))
+
+        with self.lock:
+            image = self.variants.get(key)
+            if image is not None:
+                self.hits += 1
+                return image
+
+            self.misses += 1
+            image = self.get_image(path, size).copy()
+            for color in tints:
+                tint = pygame.Surface(image.get_size(), pygame.SRCALPHA)
+                tint.fill(color)
+                image.blit(tint, (0, 0), special_flags=pygame.BLEND_RGBA_MULT)
+
+            self.variants[key] = image
+            return image
+
+    def bake_variants(self, variants):
+        """
+        Genera por adelantado todas las variantes indicadas.
+
+        Se llama durante la carga para que crear entidades en pleno
+        juego no tenga que tintar ninguna superficie.
+
+        Args:
+            variants: Lista de tuplas (ruta, tamaño, tintes)
+
+        Returns:
+            int: Cantidad de variantes que no se pudieron generar
+        """
+        failed = 0
+        for path, size, tints in variants:
+            try:
+                self.get_variant(path, size, tints)
+            except pygame.error as e:
+                logger.warning("⚠️ No se pudo generar variante de %s: %s", path, e)
+                failed += 1
+        return failed
+
+    def get_sound(self, path):
+        """
+        Devuelve el sonido indicado, cargándolo solo la primera vez.
+
+        Args:
+            path: Ruta del archivo de audio
+
+        Returns:
+            Sound: Sonido compartido, o None si el mezclador no está disponible
+
+        Raises:
+            pygame.error: Si el archivo no se puede cargar
+        """
+        if not pygame.mixer.get_init():
+            return None
+
+        with self.lock:
+            sound = self.sounds.get(path)
+            if sound is not None:
+                self.hits += 1
+                return sound
+
+            self.misses += 1
+            sound = pygame.mixer.Sound(path)
+            self.sounds[path] = sound
+            return sound
+
+    def get_stats(self):
+        """
+        Devuelve las estadísticas de uso de la caché.
+
+        Returns:
+            dict: Aciertos, fallos y cantidad de superficies en caché
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'images': len(self.images),
+            'variants': len(self.variants),
+            'sounds': len(self.sounds)
+        }
+
+    def clear(self):
+        """
+        Vacía la caché (por ejemplo, tras recrear la ventana).
+        """
+        with self.lock:
+            self.images.clear()
+            self.variants.clear()
+            self.raw_images.clear()
+            self.sounds.clear()
+            self.hits = 0
+            self.misses = 0
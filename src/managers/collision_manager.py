@@ -3,8 +3,12 @@
 # ==============================================================================
 # Este manager detecta y maneja todas las colisiones del juego
 
-import pygame
+import logging
 from config import *
+from src.managers.spatial_hash import SpatialHash
+from src.managers.tracer import traced
+
+logger = logging.getLogger(__name__)
 
 class CollisionManager:
     """
@@ -15,145 +19,322 @@ class CollisionManager:
     - Detectar colisiones entre balas y jugador
     - Detectar colisiones entre enemigos y jugador
     - Calcular puntuación por eliminaciones
+    
+    Fase ancha (broadphase): un grupo de cada pareja se anota en una
+    rejilla espacial (SpatialHash) y el otro la consulta.
+    Solo los candidatos de las celdas vecinas pasan a colliderect().
+    
+    Los enemigos en formación no necesitan rejilla: la propia formación
+    es una rejilla regular y Formation.query() calcula la celda de cada
+    bala con aritmética. La rejilla espacial queda para los enemigos sueltos.
     """
     
+    # Capas de colisión: qué grupos de GameScreen chocan entre sí.
+    # (clave del resultado, método que la resuelve, atributos a pasarle...)
+    # Añadir una interacción nueva = añadir una fila aquí
+    COLLISION_LAYERS = (
+        ('points_gained', 'check_bullet_enemy_collisions', 'player_bullets', 'loose_enemies', 'formation'),
+        ('player_hit', 'check_bullet_player_collisions', 'enemy_bullets', 'player'),
+        ('enemy_collision', 'check_enemy_player_collisions', 'loose_enemies', 'player', 'formation'),
+    )
+    
     def __init__(self):
         """
         Constructor del CollisionManager.
         """
-        print("✅ CollisionManager inicializado")
+        self.cell_size = COLLISION_CELL_SIZE
+        
+        # Rejillas construidas en el tick actual: {id(grupo): (grupo, rejilla)}
+        # None = fuera de check_all_collisions (cada consulta construye la suya)
+        self.indexes = None
+        
+        # Estadísticas: pruebas colliderect() realizadas (fase estrecha)
+        self.narrow_checks = 0
+        
+        logger.info("✅ CollisionManager inicializado")
     
-    def check_bullet_enemy_collisions(self, player_bullets, enemies):
+    def get_index(self, sprites):
+        """
+        Devuelve la rejilla espacial de un grupo de sprites.
+        
+        Dentro de check_all_collisions la rejilla de cada grupo se construye
+        UNA vez por tick y la comparten todas las capas que lo usan.
+        
+        Args:
+            sprites: Grupo (o cualquier iterable) de sprites
+        
+        Returns:
+            SpatialHash: Rejilla con los sprites anotados
+        """
+        if self.indexes is not None:
+            entry = self.indexes.get(id(sprites))
+            if entry is not None:
+                return entry[1]
+        
+        index = SpatialHash(self.cell_size)
+        index.insert_all(sprites)
+        
+        if self.indexes is not None:
+            self.indexes[id(sprites)] = (sprites, index)
+        return index
+    
+    def find_hits(self, rect, index):
+        """
+        Sprites vivos de la rejilla que chocan con un rect.
+        
+        Args:
+            rect: Rect de consulta
+            index: SpatialHash donde buscar
+        
+        Returns:
+            list: Sprites que colisionan con el rect
+        """
+        candidates = index.query(rect)
+        self.narrow_checks += len(candidates)
+        
+        # Un sprite destruido antes en este mismo tick sigue en la rejilla
+        return [sprite for sprite in candidates
+                if sprite.alive and rect.colliderect(sprite.rect)]
+    
+    def find_enemy_hits(self, rect, index, formation):
+        """
+        Enemigos (en formación y sueltos) que chocan con un rect.
+        
+        Args:
+            rect: Rect de consulta
+            index: SpatialHash de los enemigos fuera de la formación
+            formation: Formación actual (None = todos van por la rejilla)
+        
+        Returns:
+            list: Enemigos que colisionan con el rect
+        """
+        hits = self.find_hits(rect, index)
+        
+        if formation is not None:
+            candidates = formation.query(rect)
+            self.narrow_checks += len(candidates)
+            hits.extend(enemy for enemy in candidates if rect.colliderect(enemy.rect))
+        
+        return hits
+    
+    @traced("CollisionManager.check_bullet_enemy_collisions")
+    def check_bullet_enemy_collisions(self, player_bullets, enemies, formation=None):
         """
         Detecta colisiones entre balas del jugador y enemigos.
         
         Args:
-            player_bullets: Grupo de balas del jugador
-            enemies: Grupo de enemigos
+            player_bullets: Grupo de balas del jugador (o EntityArrays)
+            enemies: Grupo de enemigos (si se pasa formation, solo los que
+                     están FUERA de ella)
+            formation: Formación de enemigos, consultada por celdas
         
         Returns:
             int: Puntos ganados por las eliminaciones
         """
-        # groupcollide(grupo1, grupo2, kill_grupo1, kill_grupo2)
-        # Retorna un diccionario: {sprite_grupo1: [sprites_grupo2_colisionados]}
-        # True = eliminar sprite al colisionar
-        # False = no eliminar (útil para enemigos con más vida)
+        if not player_bullets or (not enemies and not formation):
+            return 0
         
-        collisions = pygame.sprite.groupcollide(
-            player_bullets,  # Balas del jugador
-            enemies,         # Enemigos
-            True,            # Eliminar bala al impactar
-            False            # NO eliminar enemigo automáticamente (maneja vida)
-        )
+        # Los enemigos sueltos van a la rejilla; cada bala consulta su celda
+        index = self.get_index(enemies)
+        
+        # Balas en arreglos: pocos enemigos, muchas balas -> una prueba
+        # AABB vectorizada por enemigo candidato
+        if hasattr(player_bullets, 'overlap'):
+            return self.check_array_bullet_enemy_collisions(player_bullets, index, formation)
         
         total_points = 0
-        enemies_to_kill = []  # Lista de enemigos que murieron
+        enemies_killed = 0
         
-        # Procesar cada colisión
-        for bullet, hit_enemies in collisions.items():
+        # Procesar cada bala (copia: la lista cambia al destruir balas)
+        for bullet in list(player_bullets):
+            hit_enemies = self.find_enemy_hits(bullet.rect, index, formation)
+            if not hit_enemies:
+                continue
+            
+            # Eliminar bala al impactar
+            bullet.destroy()
+            
             for enemy in hit_enemies:
-                # El enemigo recibe daño
+                # El enemigo recibe daño (si muere, take_damage lo destruye)
                 points = enemy.take_damage(damage=1)
                 total_points += points
                 
-                # Si murió, agregarlo a la lista de eliminación
                 if points > 0:
-                    enemies_to_kill.append(enemy)
+                    enemies_killed += 1
                 
                 # TODO: Crear efecto de explosión si murió
                 # if points > 0:
                 #     self.create_explosion(enemy.rect.center)
         
-        # ELIMINAR INMEDIATAMENTE los enemigos muertos
-        for enemy in enemies_to_kill:
-            enemy.kill()  # Forzar eliminación de todos los grupos
+        if total_points > 0:
+            logger.debug("💰 +%s puntos! (%s enemigos destruidos)", total_points, enemies_killed)
+        
+        return total_points
+    
+    def check_array_bullet_enemy_collisions(self, player_bullets, index, formation):
+        """
+        Colisiones entre balas en arreglos (EntityArrays) y enemigos.
+        
+        Candidatos: los enemigos (en formación y sueltos) que tocan la caja
+        que envuelve a todas las balas. Cada candidato hace UNA prueba
+        vectorizada contra toda la población de balas.
+        
+        Mismo resultado que recorrer las balas una a una: cada bala resta
+        1 de vida a cada enemigo que toca, y las balas que llegan a un
+        enemigo ya muerto lo atraviesan.
+        
+        Args:
+            player_bullets: EntityArrays con las balas del jugador
+            index: SpatialHash de los enemigos fuera de la formación
+            formation: Formación actual (None = todos van por la rejilla)
+        
+        Returns:
+            int: Puntos ganados por las eliminaciones
+        """
+        bounds = player_bullets.bounds()
+        if bounds is None:
+            return 0
+        
+        candidates = self.find_hits(bounds, index)
+        if formation is not None:
+            candidates.extend(enemy for enemy in formation.query(bounds)
+                              if bounds.colliderect(enemy.rect))
+        
+        # Primero todas las pruebas: una bala puede tocar a dos enemigos
+        hits = []
+        for enemy in candidates:
+            hit_indices = player_bullets.overlap(enemy.rect)
+            self.narrow_checks += player_bullets.count
+            if len(hit_indices) > 0:
+                hits.append((enemy, hit_indices))
+        
+        total_points = 0
+        enemies_killed = 0
+        for enemy, hit_indices in hits:
+            # Solo las balas necesarias para matarlo (en orden de disparo)
+            used = hit_indices[:max(enemy.health, 1)]
+            player_bullets.kill(used)
+            
+            points = enemy.take_damage(damage=len(used))
+            total_points += points
+            if points > 0:
+                enemies_killed += 1
         
         if total_points > 0:
-            print(f"💰 +{total_points} puntos! ({len(enemies_to_kill)} enemigos destruidos)")
+            logger.debug("💰 +%s puntos! (%s enemigos destruidos)", total_points, enemies_killed)
         
         return total_points
     
+    @traced("CollisionManager.check_bullet_player_collisions")
     def check_bullet_player_collisions(self, enemy_bullets, player):
         """
         Detecta colisiones entre balas de enemigos y el jugador.
         
         Args:
-            enemy_bullets: Grupo de balas enemigas
+            enemy_bullets: Grupo de balas enemigas (o EntityArrays)
             player: Sprite del jugador
         
         Returns:
             bool: True si el jugador fue golpeado, False si no
         """
-        # spritecollide(sprite, grupo, kill_grupo)
-        # Retorna lista de sprites del grupo que colisionaron
-        hit_bullets = pygame.sprite.spritecollide(
-            player,        # Jugador
-            enemy_bullets, # Balas enemigas
-            True           # Eliminar balas al impactar
-        )
+        if player is None or not enemy_bullets:
+            return False
+        
+        # Balas en arreglos: una sola prueba AABB vectorizada
+        if hasattr(enemy_bullets, 'overlap'):
+            hit_indices = enemy_bullets.overlap(player.rect)
+            self.narrow_checks += len(enemy_bullets)
+            if len(hit_indices) == 0:
+                return False
+            enemy_bullets.kill(hit_indices)
+            player.take_damage()
+            return True
+        
+        # Las balas van a la rejilla; el jugador hace UNA consulta
+        hit_bullets = self.find_hits(player.rect, self.get_index(enemy_bullets))
         
         # Si hubo colisión
         if hit_bullets:
+            # Eliminar balas al impactar
+            for bullet in hit_bullets:
+                bullet.destroy()
+            
             # El jugador recibe daño
             player.take_damage()
             return True
         
         return False
     
-    def check_enemy_player_collisions(self, enemies, player):
+    @traced("CollisionManager.check_enemy_player_collisions")
+    def check_enemy_player_collisions(self, enemies, player, formation=None):
         """
         Detecta colisiones directas entre enemigos y el jugador.
         
         Esto ocurre cuando un enemigo toca físicamente al jugador.
         
         Args:
-            enemies: Grupo de enemigos
+            enemies: Grupo de enemigos (si se pasa formation, solo los que
+                     están FUERA de ella)
             player: Sprite del jugador
+            formation: Formación de enemigos, consultada por celdas
         
         Returns:
             bool: True si hubo colisión, False si no
         """
-        hit_enemies = pygame.sprite.spritecollide(
-            player,   # Jugador
-            enemies,  # Enemigos
-            False     # NO eliminar enemigo (game over de todas formas)
-        )
+        if player is None or (not enemies and not formation):
+            return False
+        
+        # Si la formación está lejos del jugador, ni se consulta
+        if formation is not None and not formation.is_near(player.rect):
+            formation = None
+        
+        # Reutiliza la rejilla de enemigos sueltos de la capa de balas
+        hit_enemies = self.find_enemy_hits(player.rect, self.get_index(enemies), formation)
         
         # Si algún enemigo tocó al jugador
         if hit_enemies:
-            print("💥 ¡Enemigo impactó al jugador!")
+            logger.info("💥 ¡Enemigo impactó al jugador!")
             # El jugador recibe daño masivo (game over)
             player.take_damage()
             return True
         
         return False
     
-    def check_enemy_invasion(self, enemies):
+    @traced("CollisionManager.check_enemy_invasion")
+    def check_enemy_invasion(self, enemies, formation=None):
         """
         Verifica si algún enemigo llegó al fondo de la pantalla.
         
         Esto representa una "invasión" y es game over.
         
         Args:
-            enemies: Grupo de enemigos
+            enemies: Grupo de enemigos (si se pasa formation, solo los que
+                     están FUERA de ella)
+            formation: Formación de enemigos (se usa su borde inferior)
         
         Returns:
             bool: True si hubo invasión, False si no
         """
-        # Línea de invasión (cerca del fondo)
-        invasion_line = WINDOW_HEIGHT - 100
+        # La fila viva más baja de la formación, en O(1)
+        if formation is not None and len(formation) > 0 and formation.bottom >= INVASION_LINE:
+            logger.info("🚨 ¡INVASIÓN! Los enemigos llegaron al fondo!")
+            return True
         
         for enemy in enemies:
-            if enemy.rect.bottom >= invasion_line:
-                print("🚨 ¡INVASIÓN! Los enemigos llegaron al fondo!")
+            if enemy.rect.bottom >= INVASION_LINE:
+                logger.info("🚨 ¡INVASIÓN! Los enemigos llegaron al fondo!")
                 return True
         
         return False
     
+    @traced("CollisionManager.check_all_collisions")
     def check_all_collisions(self, game_screen):
         """
         Método conveniente que verifica todas las colisiones.
         
+        Recorre COLLISION_LAYERS en orden. Las rejillas se reconstruyen
+        en cada tick y se comparten entre capas.
+        
         Args:
             game_screen: Instancia del GameScreen con todos los grupos
         
@@ -167,27 +348,31 @@ class CollisionManager:
             'invasion': False
         }
         
-        # 1. Balas del jugador vs enemigos
-        results['points_gained'] = self.check_bullet_enemy_collisions(
-            game_screen.player_bullets,
-            game_screen.enemies
-        )
-        
-        # 2. Balas de enemigos vs jugador
-        results['player_hit'] = self.check_bullet_player_collisions(
-            game_screen.enemy_bullets,
-            game_screen.player
-        )
-        
-        # 3. Enemigos vs jugador (colisión directa)
-        results['enemy_collision'] = self.check_enemy_player_collisions(
-            game_screen.enemies,
-            game_screen.player
-        )
+        self.indexes = {}
+        try:
+            # 1-3. Capas: balas vs enemigos, balas vs jugador, enemigos vs jugador
+            for key, method, *attributes in self.COLLISION_LAYERS:
+                check = getattr(self, method)
+                results[key] = check(*(getattr(game_screen, name) for name in attributes))
+        finally:
+            self.indexes = None
         
         # 4. Invasión (enemigos llegaron al fondo)
         results['invasion'] = self.check_enemy_invasion(
-            game_screen.enemies
+            game_screen.loose_enemies,
+            game_screen.formation
         )
         
         return results
+    
+    def get_stats(self):
+        """
+        Devuelve las estadísticas de la detección de colisiones.
+        
+        Returns:
+            dict: Pruebas colliderect() realizadas y tamaño de celda
+        """
+        return {
+            'narrow_checks': self.narrow_checks,
+            'cell_size': self.cell_size
+        }
@@ -0,0 +1,242 @@
+# ==============================================================================
+# FIRE DIRECTOR - CONTROL DE DISPARO DE LOS ENEMIGOS
+# ==============================================================================
+# Decide QUIÉN y CUÁNDO dispara. Antes se elegía un enemigo al azar entre
+# todos y, si aún estaba recargando, el disparo se perdía. Aquí solo se
+# elige entre los tiradores que ya recargaron, en O(1)
+
+import logging
+import random
+from config import *
+
+logger = logging.getLogger(__name__)
+
+
+class FireDirector:
+    """
+    Control de disparo de los enemigos.
+
+    - Tiradores: el enemigo más bajo de cada columna de la formación
+      (Formation.col_bottom) y los enemigos sueltos
+    - La recarga de cada tirador es un timer del TimerScheduler;
+      al vencer, el tirador pasa a la cola de listos
+    - Elegir quién dispara es O(1) y nunca se elige a uno que
+      todavía está recargando
+
+    Los tiradores no se quitan de la cola cuando mueren o quedan
+    tapados: se descartan al salir de ella (validación perezosa).
+    """
+
+    def __init__(self, scheduler):
+        """
+        Constructor del FireDirector.
+
+        Args:
+            scheduler: TimerScheduler del juego (recargas y cadencia)
+        """
+        self.scheduler = scheduler
+
+        # Formación de la oleada actual (al cambiar se reinicia todo)
+        self.formation = None
+
+        # Tiradores listos para disparar
+        self.ready = []
+
+        # Tiradores seguidos: {enemigo: Timer de su recarga}
+        self.tickets = {}
+
+        # Timer hasta el próximo disparo de la oleada (None = toca disparar)
+        self.volley_timer = None
+
+        # Mayor población vista en la oleada (para escalar la cadencia)
+        self.wave_size = 0
+
+        # Estadísticas
+        self.shots = 0      # Disparos realizados
+        self.delayed = 0    # Pasos en que tocaba disparar y nadie estaba listo
+        self.stale = 0      # Tiradores descartados (muertos o tapados)
+
+        logger.info("✅ FireDirector inicializado")
+
+    def begin_wave(self, formation):
+        """
+        Reinicia el control de disparo para una nueva oleada.
+
+        Args:
+            formation: Formación de la oleada (o None)
+        """
+        self.formation = formation
+        for timer in self.tickets.values():
+            timer.cancel()
+        self.tickets.clear()
+        self.ready.clear()
+
+        if self.volley_timer is not None:
+            self.volley_timer.cancel()
+            self.volley_timer = None
+        self.wave_size = 0
+
+    def add_shooter(self, enemy):
+        """
+        Agrega un tirador listo para disparar (si no lo era ya).
+
+        Args:
+            enemy: Enemigo que puede disparar (más bajo de su columna o suelto)
+        """
+        if enemy not in self.tickets:
+            self.schedule(enemy, 0.0)
+
+    def schedule(self, enemy, delay):
+        """
+        Programa cuándo vuelve a estar listo un tirador.
+
+        Args:
+            enemy: Tirador
+            delay: Segundos de recarga
+        """
+        self.tickets[enemy] = self.scheduler.schedule(delay, self.reloaded, enemy)
+
+    def reloaded(self, enemy):
+        """
+        Un tirador terminó de recargar (lo llama el scheduler).
+
+        Args:
+            enemy: Tirador
+        """
+        if self.is_valid(enemy):
+            self.ready.append(enemy)
+        else:
+            self.drop(enemy)
+
+    def is_valid(self, enemy):
+        """
+        Comprueba si un tirador todavía puede disparar.
+
+        Args:
+            enemy: Tirador
+
+        Returns:
+            bool: True si sigue vivo y nadie le tapa el disparo
+        """
+        if not enemy.alive:
+            return False
+        return enemy.formation is None or enemy.formation.is_front(enemy)
+
+    def drop(self, enemy):
+        """
+        Deja de seguir a un tirador que ya no puede disparar.
+
+        Si vuelve a quedar al frente de su columna, la formación
+        lo promociona de nuevo.
+
+        Args:
+            enemy: Tirador
+        """
+        del self.tickets[enemy]
+        self.stale += 1
+
+    def select(self):
+        """
+        Elige al azar un tirador listo y lo saca de la cola.
+
+        Quitar de la cola cuesta O(1): el hueco se rellena con el último.
+
+        Returns:
+            Enemy: Tirador elegido, o None si no hay ninguno listo
+        """
+        ready = self.ready
+        while ready:
+            i = random.randrange(len(ready))
+            enemy = ready[i]
+            ready[i] = ready[-1]
+            ready.pop()
+
+            if self.is_valid(enemy):
+                return enemy
+            self.drop(enemy)
+
+        return None
+
+    def fire_interval(self, level, population):
+        """
+        Calcula los segundos entre disparos de la oleada.
+
+        La cadencia sube un ENEMY_FIRE_LEVEL_SCALE por nivel y hasta un
+        ENEMY_FIRE_POPULATION_SCALE a medida que mueren enemigos.
+
+        Args:
+            level: Nivel actual
+            population: Enemigos vivos
+
+        Returns:
+            float: Intervalo entre disparos (segundos)
+        """
+        rate = 1.0 + ENEMY_FIRE_LEVEL_SCALE * (level - 1)
+        if self.wave_size > 0:
+            lost = 1.0 - population / self.wave_size
+            rate *= 1.0 + ENEMY_FIRE_POPULATION_SCALE * lost
+        return ENEMY_FIRE_INTERVAL / rate
+
+    def end_volley(self):
+        """
+        Termina la espera entre disparos (lo llama el scheduler).
+        """
+        self.volley_timer = None
+
+    def update(self, level, formation, population):
+        """
+        Decide si algún enemigo dispara en este paso.
+
+        Las recargas y la cadencia avanzan con el scheduler;
+        aquí solo se recogen los tiradores nuevos y se elige uno.
+
+        Args:
+            level: Nivel actual
+            formation: Formación de la oleada actual (o None)
+            population: Enemigos vivos (formación + sueltos)
+
+        Returns:
+            Enemy: Enemigo que debe disparar, o None
+        """
+        if formation is not self.formation:
+            self.begin_wave(formation)
+
+        self.wave_size = max(self.wave_size, population)
+
+        # Nuevos enemigos más bajos de su columna
+        if formation is not None and formation.promoted:
+            for enemy in formation.promoted:
+                self.add_shooter(enemy)
+            formation.promoted.clear()
+
+        if self.volley_timer is not None:
+            return None
+
+        shooter = self.select()
+        if shooter is None:
+            # Nadie listo: se dispara en cuanto alguno recargue
+            self.delayed += 1
+            return None
+
+        self.volley_timer = self.scheduler.schedule(
+            self.fire_interval(level, population), self.end_volley
+        )
+        self.schedule(shooter, random.uniform(*ENEMY_SHOT_COOLDOWN))
+        self.shots += 1
+        return shooter
+
+    def get_stats(self):
+        """
+        Devuelve las estadísticas del control de disparo.
+
+        Returns:
+            dict: Disparos, pasos retrasados, tiradores descartados,
+                  listos y seguidos
+        """
+        return {
+            'shots': self.shots,
+            'delayed': self.delayed,
+            'stale': self.stale,
+            'ready': len(self.ready),
+            'tracked': len(self.tickets)
+        }
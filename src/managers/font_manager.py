@@ -0,0 +1,186 @@
+# ==============================================================================
+# FONT MANAGER - REGISTRO CENTRAL DE FUENTES
+# ==============================================================================
+# Este manager resuelve cada fuente del sistema UNA sola vez y reutiliza
+# los objetos Font entre pantallas, reinicios y cambios de estado
+
+import json
+import logging
+import os
+import threading
+import pygame
+from config import *
+
+logger = logging.getLogger(__name__)
+
+
+class FontManager():
+    """
+    Registro de fuentes del juego (Patrón Singleton).
+
+    pygame.font.SysFont es caro:
+    - La primera vez escanea las fuentes del sistema (fc-list en Linux)
+    - Cada llamada abre el archivo de la fuente y crea un Font nuevo
+
+    Responsabilidades:
+    - Resolver (nombre, negrita, cursiva) -> archivo una sola vez,
+      guardando el resultado en disco entre ejecuciones
+    - Memorizar los objetos Font por (nombre, tamaño, negrita, cursiva)
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(FontManager, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+
+        # Fuentes creadas: {(nombre, tamaño, negrita, cursiva): Font}
+        self.fonts = {}
+
+        # Resoluciones: {"nombre|negrita|cursiva": [ruta, fake_bold, fake_italic]}
+        # fake_bold/fake_italic indican si pygame debe simular el estilo
+        self.resolved = {}
+
+        # Archivo JSON con las fuentes ya resueltas (None = no usar disco)
+        self.cache_file = FONT_CACHE_FILE
+        self.load_cache()
+
+        # Estadísticas
+        self.hits = 0
+        self.misses = 0
+
+        # Candado: las fuentes se precargan desde el hilo de carga
+        self.lock = threading.RLock()
+
+        self._initialized = True
+        logger.info("✅ FontManager inicializado")
+
+    def load_cache(self):
+        """
+        Lee las fuentes resueltas en ejecuciones anteriores.
+
+        Las entradas cuyo archivo ya no existe se descartan
+        (se volverán a resolver con SysFont).
+        """
+        if not self.cache_file or not os.path.exists(self.cache_file):
+            return
+
+        try:
+            with open(self.cache_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            logger.warning("⚠️ No se pudo leer la caché de fuentes: %s", e)
+            return
+
+        # Una caché corrupta o editada a mano se trata como si no existiera
+        if not isinstance(data, dict):
+            logger.warning("⚠️ Caché de fuentes con formato inválido: se ignora")
+            return
+
+        for key, entry in data.items():
+            try:
+                path, fake_bold, fake_italic = entry
+                if path is not None and not isinstance(path, str):
+                    raise TypeError(f"ruta inválida: {path!r}")
+            except (TypeError, ValueError) as e:
+                logger.warning("⚠️ Entrada inválida en la caché de fuentes (%s): %s", key, e)
+                continue
+
+            if path is None or os.path.exists(path):
+                self.resolved[key] = [path, fake_bold, fake_italic]
+
+    def save_cache(self):
+        """
+        Guarda en disco las fuentes resueltas.
+        """
+        if not self.cache_file:
+            return
+
+        try:
+            directory = os.path.dirname(self.cache_file)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.cache_file, 'w', encoding='utf-8') as f:
+                json.dump(self.resolved, f, indent=2)
+        except OSError as e:
+            logger.warning("⚠️ No se pudo guardar la caché de fuentes: %s", e)
+
+    def resolve(self, name, bold=False, italic=False):
+        """
+        Resuelve qué archivo usar para una fuente del sistema.
+
+        Usa el mismo algoritmo que pygame.font.SysFont (pasándole un
+        constructor que solo anota el resultado), así que la fuente
+        elegida es idéntica a la de SysFont.
+
+        Args:
+            name: Nombre de la fuente (ej: 'arial')
+            bold: True para negrita
+            italic: True para cursiva
+
+        Returns:
+            list: [ruta, fake_bold, fake_italic]
+        """
+        key = f"{name}|{int(bold)}|{int(italic)}"
+
+        with self.lock:
+            resolution = self.resolved.get(key)
+            if resolution is None:
+                resolution = pygame.font.SysFont(
+                    name, 1, bold, italic,
+                    constructor=lambda path, size, fake_bold, fake_italic: [path, fake_bold, fake_italic]
+                )
+                self.resolved[key] = resolution
+                self.save_cache()
+            return resolution
+
+    def get_font(self, name, size, bold=False, italic=False):
+        """
+        Devuelve la fuente pedida, creándola solo la primera vez.
+
+        Args:
+            name: Nombre de la fuente (ej: 'arial')
+            size: Tamaño en puntos
+            bold: True para negrita
+            italic: True para cursiva
+
+        Returns:
+            Font: Objeto Font COMPARTIDO entre todas las pantallas
+        """
+        key = (name, size, bool(bold), bool(italic))
+
+        with self.lock:
+            font = self.fonts.get(key)
+            if font is not None:
+                self.hits += 1
+                return font
+
+            self.misses += 1
+            path, fake_bold, fake_italic = self.resolve(name, bold, italic)
+            font = pygame.font.Font(path, size)
+            if fake_bold:
+                font.set_bold(True)
+            if fake_italic:
+                font.set_italic(True)
+
+            self.fonts[key] = font
+            return font
+
+    def get_stats(self):
+        """
+        Devuelve las estadísticas de uso del registro.
+
+        Returns:
+            dict: Aciertos, fallos y cantidad de fuentes creadas
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'fonts': len(self.fonts)
+        }
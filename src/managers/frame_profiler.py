@@ -0,0 +1,304 @@
+# ==============================================================================
+# FRAME PROFILER - TIEMPO DE CADA FASE DEL FRAME
+# ==============================================================================
+# Mide cuánto tarda cada fase del frame (eventos, update, draw) y sus
+# subfases (entidades, colisiones, sprites, flip...). Guarda una ventana
+# de los últimos frames para calcular percentiles (p50/p95/p99), los
+# muestra en un overlay y puede volcar una fila por frame a un CSV.
+#
+# Desactivado (sin overlay ni CSV) cada medición es un solo "if"
+
+import csv
+import logging
+import os
+import time
+from collections import deque
+from config import *
+
+logger = logging.getLogger(__name__)
+
+
+class FrameProfiler:
+    """
+    Perfilador de frames (Patrón Singleton).
+
+    Las mediciones son "vueltas" de cronómetro, sin bloques anidados:
+    - lap(fase): tiempo desde la fase anterior (eventos, update, draw)
+    - split(subfase): tiempo desde la subfase anterior, dentro de una fase
+
+    Si una fase se repite en el frame (varios pasos de simulación),
+    sus tiempos se suman.
+
+    Uso (game loop):
+        profiler.begin_frame()
+        handle_events();  profiler.lap("events")
+        update();         profiler.lap("update")   # con split() dentro
+        draw();           profiler.lap("draw")
+        profiler.end_frame(pasos)
+    """
+
+    # Columnas del CSV y filas del overlay, en orden
+    PHASES = (
+        "events",
+        "update", "update.entities", "update.cleanup", "update.formation",
+        "update.fire", "update.collisions",
+        "draw", "draw.background", "draw.sprites", "draw.hud", "draw.flip",
+    )
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(FrameProfiler, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+
+        # Solo mide si hay overlay o CSV activos
+        self.enabled = False
+        self.overlay_visible = False
+
+        # CSV en curso (None = no se graba)
+        self.csv_file = None
+        self.csv_writer = None
+        self.csv_path = None
+
+        # Cronómetro del frame actual
+        self.frame = 0
+        self.frame_start = 0.0
+        self.last = 0.0          # Fin de la última fase
+        self.last_split = 0.0    # Fin de la última subfase
+        self.current = {}        # {fase: segundos} del frame actual
+
+        # Últimos PROFILER_WINDOW frames por fase (milisegundos)
+        self.history = {name: deque(maxlen=PROFILER_WINDOW)
+                        for name in ("frame",) + self.PHASES}
+
+        # Overlay pre-renderizado (se regenera cada PROFILER_OVERLAY_REFRESH frames)
+        self.overlay = None
+        self.frames_since_refresh = 0
+
+        self._initialized = True
+
+    def update_enabled(self):
+        """
+        Activa la medición si hay overlay o CSV; si no, la desactiva.
+        """
+        was_enabled = self.enabled
+        self.enabled = self.overlay_visible or self.csv_file is not None
+        if self.enabled and not was_enabled:
+            # Empezar a medir desde ahora (el frame actual ya empezó)
+            self.begin_frame()
+
+    def begin_frame(self):
+        """
+        Inicia el cronómetro de un frame.
+        """
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.frame_start = self.last = self.last_split = now
+        self.current.clear()
+
+    def lap(self, name):
+        """
+        Cierra una fase del frame (tiempo desde la fase anterior).
+
+        Args:
+            name: Nombre de la fase (ej: "update")
+        """
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.current[name] = self.current.get(name, 0.0) + now - self.last
+        self.last = self.last_split = now
+
+    def split(self, name):
+        """
+        Cierra una subfase (tiempo desde la subfase anterior).
+
+        Args:
+            name: Nombre de la subfase (ej: "update.collisions")
+        """
+        if not self.enabled:
+            return
+        now = time.perf_counter()
+        self.current[name] = self.current.get(name, 0.0) + now - self.last_split
+        self.last_split = now
+
+    def end_frame(self, steps=0):
+        """
+        Cierra el frame: guarda sus tiempos en la ventana y en el CSV.
+
+        Args:
+            steps: Pasos de simulación ejecutados en el frame
+        """
+        if not self.enabled:
+            return
+
+        total = time.perf_counter() - self.frame_start
+        current = self.current
+        self.frame += 1
+
+        self.history["frame"].append(total * 1000.0)
+        for name in self.PHASES:
+            self.history[name].append(current.get(name, 0.0) * 1000.0)
+
+        if self.csv_writer is not None:
+            self.csv_writer.writerow(
+                [self.frame, steps, f"{total * 1000.0:.3f}"] +
+                [f"{current.get(name, 0.0) * 1000.0:.3f}" for name in self.PHASES]
+            )
+
+        self.frames_since_refresh += 1
+        if self.overlay_visible and (self.overlay is None or
+                                     self.frames_since_refresh >= PROFILER_OVERLAY_REFRESH):
+            self.render_overlay()
+
+    def percentiles(self, name):
+        """
+        Calcula p50/p95/p99 de una fase en la ventana actual.
+
+        Args:
+            name: Fase ("frame" = frame completo)
+
+        Returns:
+            tuple: (p50, p95, p99) en milisegundos (ceros si no hay datos)
+        """
+        values = sorted(self.history[name])
+        n = len(values)
+        if n == 0:
+            return (0.0, 0.0, 0.0)
+        return tuple(values[min(n - 1, int(n * p))] for p in (0.50, 0.95, 0.99))
+
+    def get_stats(self):
+        """
+        Devuelve los percentiles de todas las fases.
+
+        Returns:
+            dict: {fase: (p50, p95, p99)} en milisegundos
+        """
+        return {name: self.percentiles(name) for name in self.history}
+
+    # ========== OVERLAY ==========
+
+    def toggle_overlay(self):
+        """
+        Muestra u oculta el overlay de tiempos.
+
+        Returns:
+            bool: True si quedó visible
+        """
+        self.overlay_visible = not self.overlay_visible
+        self.overlay = None
+        self.update_enabled()
+        return self.overlay_visible
+
+    def render_overlay(self):
+        """
+        Pre-renderiza la tabla de percentiles en una superficie opaca.
+
+        Es opaca para que volver a dibujarla encima de sí misma
+        (modo dirty rects) no acumule nada.
+        """
+        # Import local: el perfilador no necesita pygame para medir
+        import pygame
+        from src.managers.font_manager import FontManager
+        from src.managers.gc_manager import GCManager
+
+        font = FontManager().get_font(*FONT_PROFILER)
+        line_height = font.get_linesize()
+        columns = (0, 150, 210, 270)
+
+        rows = [("ms", "p50", "p95", "p99")]
+        for name in ("frame",) + self.PHASES:
+            p50, p95, p99 = self.percentiles(name)
+            label = "  " + name.split(".", 1)[1] if "." in name else name
+            rows.append((label, f"{p50:.2f}", f"{p95:.2f}", f"{p99:.2f}"))
+
+        # Pausas automáticas del recolector de basura (no son una fase del frame)
+        p50, p95, p99 = GCManager().pause_percentiles()
+        rows.append(("gc pause", f"{p50:.2f}", f"{p95:.2f}", f"{p99:.2f}"))
+
+        surface = pygame.Surface((columns[-1] + 60, line_height * len(rows) + 8))
+        surface.fill(BLACK)
+        for i, row in enumerate(rows):
+            color = YELLOW if i == 0 else WHITE
+            for x, text in zip(columns, row):
+                surface.blit(font.render(text, True, color), (4 + x, 4 + i * line_height))
+
+        self.overlay = surface
+        self.frames_since_refresh = 0
+
+    def draw_overlay(self, screen):
+        """
+        Dibuja el overlay (abajo a la izquierda) si está visible.
+
+        Args:
+            screen: Superficie donde dibujar
+
+        Returns:
+            Rect: Zona dibujada, o None si no hay overlay
+        """
+        if not self.overlay_visible or self.overlay is None:
+            return None
+        rect = self.overlay.get_rect(bottomleft=(10, WINDOW_HEIGHT - 10))
+        screen.blit(self.overlay, rect)
+        return rect
+
+    # ========== CSV ==========
+
+    def toggle_csv(self):
+        """
+        Empieza o termina la grabación de frames en CSV.
+
+        Returns:
+            bool: True si quedó grabando
+        """
+        if self.csv_file is None:
+            self.start_csv()
+        else:
+            self.stop_csv()
+        return self.csv_file is not None
+
+    def start_csv(self, path=None):
+        """
+        Empieza a grabar una fila por frame en un CSV.
+
+        Args:
+            path: Ruta del archivo (None = PROFILER_CSV_DIR/frames_<fecha>.csv)
+        """
+        if self.csv_file is not None:
+            return
+
+        if path is None:
+            os.makedirs(PROFILER_CSV_DIR, exist_ok=True)
+            path = os.path.join(PROFILER_CSV_DIR, time.strftime("frames_%Y%m%d_%H%M%S.csv"))
+
+        try:
+            self.csv_file = open(path, 'w', newline='')
+        except OSError as e:
+            logger.warning("⚠️ No se pudo crear el CSV de frames: %s", e)
+            return
+
+        self.csv_path = path
+        self.csv_writer = csv.writer(self.csv_file)
+        self.csv_writer.writerow(["frame", "steps", "frame_ms"] + list(self.PHASES))
+        self.update_enabled()
+        logger.info("⏺️ Grabando tiempos de frame en %s", path)
+
+    def stop_csv(self):
+        """
+        Termina la grabación del CSV (cierra el archivo).
+        """
+        if self.csv_file is None:
+            return
+
+        self.csv_file.close()
+        self.csv_file = None
+        self.csv_writer = None
+        self.update_enabled()
+        logger.info("⏹️ CSV de frames guardado en %s", self.csv_path)
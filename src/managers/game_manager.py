@@ -1,4 +1,9 @@
+import logging
 import pygame
+from src.managers.tracer import Tracer, traced
+from src.managers.gc_manager import GCManager
+
+logger = logging.getLogger(__name__)
 
 
 class GameManager():
@@ -31,8 +36,9 @@ class GameManager():
         self.previous_state = None
 
         self._initialized = True
-        print("GameManager inicializado.")
+        logger.info("GameManager inicializado.")
 
+    @traced("GameManager.change_state")
     def change_state(self, new_state) -> None:
         """
         Cambia al nuevo estado del juego.
@@ -48,14 +54,17 @@ class GameManager():
         """
 
         if self.current_state is not None:
-            print(f"Saliendo del estado: {type(self.current_state).__name__}")
+            logger.info("Saliendo del estado: %s", type(self.current_state).__name__)
             self.current_state.exit()
             self.previous_state = self.current_state
 
+            # Momento seguro para el GC: entre un estado y otro
+            GCManager().collect("cambio de estado")
+
         self.current_state = new_state
 
         if self.current_state is not None:
-            print(f"Entrando al estado: {type(self.current_state).__name__}")
+            logger.info("Entrando al estado: %s", type(self.current_state).__name__)
             self.current_state.enter()
 
 
@@ -78,14 +87,20 @@ class GameManager():
             delta_time: Tiempo desde el último frame (en segundos)
         """
         if self.current_state is not None:
-            self.current_state.update(delta_time)
+            with Tracer().span_for(self.current_state, "update"):
+                self.current_state.update(delta_time)
     
     def draw(self):
         """
         Delega el renderizado al estado actual.
+        
+        Returns:
+            list: Rects a actualizar, o None para actualizar toda la pantalla
         """
         if self.current_state is not None:
-            self.current_state.draw()
+            with Tracer().span_for(self.current_state, "draw"):
+                return self.current_state.draw()
+        return None
     
     def go_back(self):
         """
@@ -96,5 +111,5 @@ class GameManager():
         - Volver de opciones al menú principal
         """
         if self.previous_state is not None:
-            print("⬅️ Volviendo al estado anterior...")
+            logger.info("⬅️ Volviendo al estado anterior...")
             self.change_state(self.previous_state)
\ No newline at end of file
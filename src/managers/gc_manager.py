@@ -0,0 +1,196 @@
+# ==============================================================================
+# GC MANAGER - POLÍTICA DEL RECOLECTOR DE BASURA
+# ==============================================================================
+# La partida crea un flujo constante de objetos de vida corta (balas,
+# copias de listas de sprites, diccionarios de colisiones...). El
+# recolector cíclico de Python se dispara cuando cuenta suficientes
+# creaciones, así que sus pausas caen en cualquier frame, en plena oleada.
+#
+# Política:
+# - Tras la carga: gc.freeze() saca a los objetos de larga vida (assets,
+#   fuentes, pools) de las recolecciones
+# - Durante la partida: umbrales altos (GC_GAMEPLAY_THRESHOLDS)
+# - En momentos seguros (cambio de estado, fin de oleada, pausa): una
+#   recolección completa explícita, cuando un tirón no se nota
+#
+# Cada pausa del GC se mide con gc.callbacks
+
+import gc
+import logging
+import time
+from collections import deque
+from config import *
+from src.managers.tracer import Tracer
+
+logger = logging.getLogger(__name__)
+
+
+class GCManager:
+    """
+    Política del recolector de basura y métricas de sus pausas (Patrón Singleton).
+
+    Uso:
+        GCManager().freeze()                  # al terminar la carga
+        GCManager().enter_gameplay()          # GameScreen.enter()
+        GCManager().leave_gameplay()          # GameScreen.exit()
+        GCManager().collect("fin de oleada")  # en un momento seguro
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(GCManager, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+
+        # Umbrales originales (se restauran al salir de la partida)
+        self.default_thresholds = gc.get_threshold()
+        self.in_gameplay = False
+
+        # Recolección en curso (la mide el callback)
+        self.collect_start = 0.0
+        self.explicit = False
+
+        # Métricas
+        self.collections = [0, 0, 0]     # Automáticas, por generación
+        self.safe_collections = 0        # Explícitas (momentos seguros)
+        self.collected = 0
+        self.uncollectable = 0
+        self.pause_total = 0.0           # Segundos en pausas automáticas
+        self.pause_max = 0.0
+        self.pauses = deque(maxlen=GC_PAUSE_WINDOW)  # Pausas automáticas (ms)
+
+        gc.callbacks.append(self.on_gc)
+
+        self._initialized = True
+        logger.info("✅ GCManager inicializado")
+
+    def on_gc(self, phase, info):
+        """
+        Callback de gc.callbacks: mide cada recolección.
+
+        Args:
+            phase: "start" o "stop"
+            info: {"generation", "collected", "uncollectable"}
+        """
+        if phase == "start":
+            self.collect_start = time.perf_counter()
+            return
+
+        end = time.perf_counter()
+        pause = end - self.collect_start
+        generation = info["generation"]
+        self.collected += info["collected"]
+        self.uncollectable += info["uncollectable"]
+
+        tracer = Tracer()
+        if tracer.enabled:
+            tracer.complete("gc.collect", self.collect_start, end,
+                            {'generation': generation, 'collected': info["collected"],
+                             'explicit': self.explicit})
+
+        # Las recolecciones explícitas se cuentan aparte: no son tirones
+        if self.explicit:
+            return
+
+        self.collections[generation] += 1
+        self.pause_total += pause
+        self.pause_max = max(self.pause_max, pause)
+        self.pauses.append(pause * 1000.0)
+
+        if pause * 1000.0 >= GC_SLOW_PAUSE_MS:
+            logger.warning("⚠️ Pausa del GC de %.1f ms (generación %s, %s objetos)",
+                           pause * 1000.0, generation, info["collected"])
+
+    def freeze(self):
+        """
+        Congela los objetos actuales: las recolecciones ya no los recorren.
+
+        Se llama al terminar la carga, cuando lo que existe (assets,
+        fuentes, pools pre-calentados) va a vivir toda la partida.
+        """
+        if not GC_FREEZE_AFTER_LOAD:
+            return
+        self.collect("carga completa")
+        gc.freeze()
+        logger.info("🧊 %s objetos congelados para el GC", gc.get_freeze_count())
+
+    def enter_gameplay(self):
+        """
+        Sube los umbrales del GC mientras dura la partida.
+        """
+        if self.in_gameplay:
+            return
+        self.in_gameplay = True
+        gc.set_threshold(*GC_GAMEPLAY_THRESHOLDS)
+
+    def leave_gameplay(self):
+        """
+        Restaura los umbrales originales del GC.
+        """
+        if not self.in_gameplay:
+            return
+        self.in_gameplay = False
+        gc.set_threshold(*self.default_thresholds)
+
+    def collect(self, reason):
+        """
+        Recolección completa explícita, en un momento seguro.
+
+        Args:
+            reason: Motivo (para el log)
+
+        Returns:
+            int: Objetos recolectados
+        """
+        if not GC_SAFE_POINT_COLLECT:
+            return 0
+
+        start = time.perf_counter()
+        self.explicit = True
+        try:
+            collected = gc.collect()
+        finally:
+            self.explicit = False
+        self.safe_collections += 1
+
+        logger.debug("🧹 GC (%s): %s objetos en %.1f ms",
+                     reason, collected, (time.perf_counter() - start) * 1000.0)
+        return collected
+
+    def pause_percentiles(self):
+        """
+        Calcula p50/p95/p99 de las últimas pausas automáticas.
+
+        Returns:
+            tuple: (p50, p95, p99) en milisegundos (ceros si no hubo pausas)
+        """
+        values = sorted(self.pauses)
+        n = len(values)
+        if n == 0:
+            return (0.0, 0.0, 0.0)
+        return tuple(values[min(n - 1, int(n * p))] for p in (0.50, 0.95, 0.99))
+
+    def get_stats(self):
+        """
+        Devuelve las métricas del recolector.
+
+        Returns:
+            dict: Recolecciones por generación, pausas y objetos congelados
+        """
+        return {
+            'collections': list(self.collections),
+            'safe_collections': self.safe_collections,
+            'collected': self.collected,
+            'uncollectable': self.uncollectable,
+            'pause_total_ms': self.pause_total * 1000.0,
+            'pause_max_ms': self.pause_max * 1000.0,
+            'pause_percentiles': self.pause_percentiles(),
+            'frozen': gc.get_freeze_count(),
+            'thresholds': gc.get_threshold()
+        }
@@ -0,0 +1,262 @@
+# ==============================================================================
+# HITCH WATCHDOG - VIGILANTE DE TIRONES DEL GAME LOOP
+# ==============================================================================
+# Un hilo aparte vigila el "latido" que Game.run da en cada frame. Si un
+# frame tarda más de lo esperado (más un margen), el hilo muestrea la pila
+# del hilo principal MIENTRAS dura el tirón (sys._current_frames), así se
+# ve qué estaba haciendo el juego: generar una oleada, cargar una fuente,
+# el recolector de basura... Al terminar el frame se escribe un informe
+# compacto en un archivo rotativo (como mucho uno cada pocos segundos)
+
+import logging
+import logging.handlers
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import Counter
+from config import *
+
+logger = logging.getLogger(__name__)
+
+# Informes completos: solo al archivo rotativo (no a la consola)
+report_logger = logging.getLogger(__name__ + ".reports")
+report_logger.propagate = False
+
+
+class HitchWatchdog:
+    """
+    Vigilante de tirones del game loop.
+
+    - heartbeat(): lo llama Game.run al empezar cada frame
+    - Si desde el último latido pasa más de (duración del frame +
+      margen), el frame está "trabado": se muestrea la pila del hilo
+      principal cada WATCHDOG_SAMPLE_MS
+    - Con el siguiente latido el tirón terminó: se escribe el informe
+      (duración, estado actual, entidades y pilas más frecuentes)
+
+    Los informes tienen un mínimo de WATCHDOG_REPORT_INTERVAL segundos
+    entre sí; los tirones intermedios solo se cuentan.
+    """
+
+    def __init__(self, game, margin_ms=WATCHDOG_MARGIN_MS, sample_ms=WATCHDOG_SAMPLE_MS):
+        """
+        Constructor del vigilante.
+
+        Args:
+            game: Instancia de Game (para leer el estado actual)
+            margin_ms: Retraso tolerado sobre la duración del frame (ms)
+            sample_ms: Intervalo de muestreo de la pila (ms)
+        """
+        self.game = game
+
+        # Duración esperada de un frame y límite para considerarlo tirón
+        self.frame_budget = 1.0 / (FPS if FPS > 0 else SIMULATION_HZ)
+        self.deadline = self.frame_budget + margin_ms / 1000.0
+        self.sample_interval = sample_ms / 1000.0
+
+        # Hilo a vigilar: el que ejecuta Game.run
+        self.main_thread_id = threading.main_thread().ident
+
+        # Último latido: (frame, instante). Una sola asignación (atómica)
+        self.beat = (0, time.perf_counter())
+
+        # Tirón en curso (None = ninguno)
+        self.stall_frame = None
+        self.stall_start = 0.0
+        self.stall_context = None
+        self.samples = Counter()
+
+        # Límite de informes
+        self.last_report = None
+        self.suppressed = 0
+
+        # Estadísticas
+        self.hitches = 0
+        self.reports = 0
+        self.errors = 0
+
+        self.thread = None
+        self.stop_event = threading.Event()
+
+    def start(self):
+        """
+        Arranca el hilo vigilante (y el archivo de informes).
+        """
+        if self.thread is not None:
+            return
+
+        if not report_logger.handlers:
+            try:
+                os.makedirs(os.path.dirname(WATCHDOG_LOG_PATH) or ".", exist_ok=True)
+                handler = logging.handlers.RotatingFileHandler(
+                    WATCHDOG_LOG_PATH, maxBytes=WATCHDOG_LOG_MAX_BYTES,
+                    backupCount=WATCHDOG_LOG_BACKUPS, encoding='utf-8'
+                )
+                handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+                report_logger.addHandler(handler)
+            except OSError as e:
+                logger.warning("⚠️ No se pudo abrir el archivo de tirones: %s", e)
+
+        self.beat = (0, time.perf_counter())
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self.run, name="HitchWatchdog", daemon=True)
+        self.thread.start()
+        logger.info("✅ HitchWatchdog vigilando frames de más de %.0f ms", self.deadline * 1000)
+
+    def stop(self):
+        """
+        Detiene el hilo vigilante.
+        """
+        if self.thread is None:
+            return
+        self.stop_event.set()
+        self.thread.join()
+        self.thread = None
+
+    def heartbeat(self):
+        """
+        Marca el inicio de un frame (lo llama el hilo principal).
+        """
+        self.beat = (self.beat[0] + 1, time.perf_counter())
+
+    def run(self):
+        """
+        Bucle del hilo vigilante.
+
+        Un error no detiene el hilo (si no, los tirones dejarían de
+        informarse sin aviso): se registra una vez y se sigue vigilando.
+        """
+        while not self.stop_event.wait(self.sample_interval):
+            try:
+                self.check()
+            except Exception:
+                self.errors += 1
+                if self.errors == 1:
+                    logger.exception("⚠️ Error en el HitchWatchdog (se sigue vigilando)")
+                # Descartar el tirón a medio registrar
+                self.stall_frame = None
+                self.samples = Counter()
+
+    def check(self):
+        """
+        Una vuelta del vigilante: cierra o muestrea el tirón en curso.
+        """
+        frame, beat_time = self.beat
+
+        # Llegó un latido nuevo: el tirón en curso terminó
+        if self.stall_frame is not None and frame != self.stall_frame:
+            self.finish_stall(beat_time - self.stall_start)
+
+        if time.perf_counter() - beat_time > self.deadline:
+            if self.stall_frame is None:
+                self.stall_frame = frame
+                self.stall_start = beat_time
+                self.stall_context = self.capture_context()
+            self.sample()
+
+    def sample(self):
+        """
+        Guarda la pila actual del hilo principal (una muestra).
+        """
+        frame = sys._current_frames().get(self.main_thread_id)
+        if frame is None:
+            return
+
+        # Sin leer el código fuente (lookup_lines=False): solo archivo, línea y función
+        stack = traceback.StackSummary.extract(traceback.walk_stack(frame), lookup_lines=False)
+        self.samples[tuple(
+            f"{short_path(entry.filename)}:{entry.lineno} {entry.name}"
+            for entry in stack[:WATCHDOG_STACK_DEPTH]
+        )] += 1
+
+    def capture_context(self):
+        """
+        Lee el estado del juego al detectar el tirón.
+
+        Returns:
+            tuple: (nombre del estado, {tipo de entidad: cantidad})
+        """
+        state = self.game.game_manager.current_state
+        registry = getattr(state, 'registry', None)
+
+        # El hilo principal puede estar modificando el registro: copiar
+        # primero y contar sobre la copia (sin cuentas si falla)
+        counts = {}
+        if registry is not None:
+            try:
+                counts = {kind: len(entities) for kind, entities in dict(registry.lists).items()}
+            except RuntimeError:
+                pass
+        return type(state).__name__, counts
+
+    def finish_stall(self, duration):
+        """
+        Cierra el tirón en curso y escribe su informe (si toca).
+
+        Args:
+            duration: Duración real del frame trabado (segundos)
+        """
+        frame, samples = self.stall_frame, self.samples
+        state_name, counts = self.stall_context
+        self.stall_frame = None
+        self.samples = Counter()
+        self.hitches += 1
+
+        now = time.monotonic()
+        if self.last_report is not None and now - self.last_report < WATCHDOG_REPORT_INTERVAL:
+            self.suppressed += 1
+            return
+        self.last_report = now
+
+        logger.warning("⏱️ Tirón de %.0f ms en el frame %s (%s)",
+                       duration * 1000, frame, state_name)
+
+        total = sum(samples.values())
+        lines = [
+            f"⏱️ Tirón de {duration * 1000:.0f} ms en el frame {frame} "
+            f"(límite {self.deadline * 1000:.0f} ms), estado {state_name}",
+            f"   tirones sin informe desde el anterior: {self.suppressed}",
+        ]
+        if counts:
+            lines.append("   entidades: " + " ".join(f"{kind}={count}" for kind, count in counts.items()))
+        for stack, count in samples.most_common(WATCHDOG_STACKS):
+            lines.append(f"   pila ({count}/{total} muestras), de la más interna a la externa:")
+            lines.extend(f"     {entry}" for entry in stack)
+
+        report_logger.warning("\n".join(lines))
+        self.suppressed = 0
+        self.reports += 1
+
+    def get_stats(self):
+        """
+        Devuelve las estadísticas del vigilante.
+
+        Returns:
+            dict: Tirones detectados, informes escritos, tirones sin informe y errores
+        """
+        return {
+            'hitches': self.hitches,
+            'reports': self.reports,
+            'suppressed': self.suppressed,
+            'errors': self.errors
+        }
+
+
+def short_path(filename):
+    """
+    Ruta relativa al directorio actual (o la original si no se puede).
+
+    En Windows relpath() falla si el archivo está en otra unidad.
+
+    Args:
+        filename: Ruta del archivo de código
+
+    Returns:
+        str: Ruta para el informe
+    """
+    try:
+        return os.path.relpath(filename)
+    except ValueError:
+        return filename
@@ -0,0 +1,259 @@
+# ==============================================================================
+# LOG MANAGER - REGISTRO DE MENSAJES CON NIVELES
+# ==============================================================================
+# Sustituye a los print() del juego. Cada módulo usa su propio logger:
+#
+#     logger = logging.getLogger(__name__)
+#     logger.debug("💥 Enemigo %s destruido!", self.enemy_type)
+#
+# - El texto se arma SOLO si el nivel está activo (formato perezoso con %):
+#   un logger.debug() desactivado no construye ningún string
+# - Los mensajes se escriben en un hilo aparte (QueueListener): si stdout
+#   es una tubería lenta, el juego no se frena esperando
+# - Los últimos mensajes quedan en un búfer circular en memoria, con el
+#   frame en que se emitieron (útil para diagnosticar tirones)
+#
+# El texto de cada mensaje se fija al emitirlo (en el hilo del juego): los
+# argumentos pueden ser objetos que cambian después (entidades, excepciones)
+
+import atexit
+import copy
+import logging
+import logging.handlers
+import queue
+import sys
+from collections import deque
+from config import *
+
+
+# Solo para formatear tracebacks (el formato de la línea lo pone cada handler)
+_exception_formatter = logging.Formatter()
+
+
+def freeze_record(record):
+    """
+    Copia un registro con el texto ya armado y sin referencias a sus argumentos.
+
+    Igual que logging.handlers.QueueHandler.prepare(): el mensaje se arma
+    con los valores del momento de la emisión, y la copia no mantiene
+    vivos los objetos del juego ni la excepción (queda su texto).
+
+    Args:
+        record: Registro recibido por el handler
+
+    Returns:
+        LogRecord: Copia con msg fijo, args y exc_info en None
+    """
+    message = record.getMessage()
+    if record.exc_info and not record.exc_text:
+        record.exc_text = _exception_formatter.formatException(record.exc_info)
+
+    frozen = copy.copy(record)
+    frozen.msg = message
+    frozen.message = message
+    frozen.args = None
+    frozen.exc_info = None
+    return frozen
+
+
+class RingBufferHandler(logging.Handler):
+    """
+    Handler que guarda los últimos registros en memoria.
+
+    Guarda copias con el texto ya fijado (freeze_record): no
+    mantiene vivos los objetos pasados como argumentos.
+    """
+
+    def __init__(self, capacity):
+        """
+        Args:
+            capacity: Máximo de registros guardados (los viejos se descartan)
+        """
+        super().__init__()
+        self.records = deque(maxlen=capacity)
+
+    def emit(self, record):
+        self.records.append(freeze_record(record))
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler que nunca bloquea al juego.
+
+    Si la cola está llena (el hilo escritor no da abasto), el mensaje
+    se descarta y se cuenta. El texto del mensaje se fija aquí; el
+    formato de la línea (LOG_FORMAT) se aplica en el hilo escritor.
+    """
+
+    def __init__(self, log_queue):
+        """
+        Args:
+            log_queue: Cola compartida con el QueueListener
+        """
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record):
+        # Texto fijado con los valores de ahora (no cuando lo escriba el otro hilo)
+        return freeze_record(record)
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
+class FrameFilter(logging.Filter):
+    """
+    Anota en cada registro el frame en que se emitió (record.frame).
+    """
+
+    def __init__(self, log_manager):
+        super().__init__()
+        self.log_manager = log_manager
+
+    def filter(self, record):
+        record.frame = self.log_manager.frame
+        return True
+
+
+class LogManager:
+    """
+    Configuración del registro de mensajes (Patrón Singleton).
+
+    Uso:
+        LogManager().setup()          # una vez, al arrancar
+        LogManager().begin_frame()    # una vez por frame
+        LogManager().recent(50)       # últimos mensajes (diagnóstico)
+        LogManager().shutdown()       # al salir (vacía la cola)
+
+    Sin setup() solo se muestran avisos y errores, por stderr
+    (comportamiento por defecto del módulo logging).
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(LogManager, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+
+        # Logger raíz: recibe los mensajes de todos los módulos
+        self.logger = logging.getLogger()
+
+        # Frame actual (lo avanza el game loop)
+        self.frame = 0
+
+        # Búfer circular con los últimos mensajes
+        self.ring = RingBufferHandler(LOG_RING_SIZE)
+        self.ring.addFilter(FrameFilter(self))
+
+        # Salida a consola: directa o a través del hilo escritor
+        self.console = None
+        self.queue_handler = None
+        self.listener = None
+
+        self.configured = False
+        self._initialized = True
+
+    def setup(self, level=LOG_LEVEL, async_sink=LOG_ASYNC):
+        """
+        Configura el logger raíz (solo la primera vez).
+
+        Args:
+            level: Nivel mínimo ("DEBUG", "INFO", "WARNING"...)
+            async_sink: True = escribir a consola desde un hilo aparte
+        """
+        if self.configured:
+            return
+
+        self.logger.setLevel(level)
+        self.logger.addHandler(self.ring)
+
+        self.console = logging.StreamHandler(sys.stdout)
+        self.console.setFormatter(logging.Formatter(LOG_FORMAT))
+
+        if async_sink:
+            log_queue = queue.Queue(LOG_QUEUE_SIZE)
+            self.queue_handler = DroppingQueueHandler(log_queue)
+            self.queue_handler.addFilter(FrameFilter(self))
+            self.logger.addHandler(self.queue_handler)
+
+            self.listener = logging.handlers.QueueListener(log_queue, self.console)
+            self.listener.start()
+            atexit.register(self.shutdown)
+        else:
+            self.console.addFilter(FrameFilter(self))
+            self.logger.addHandler(self.console)
+
+        self.configured = True
+
+    def set_level(self, level):
+        """
+        Cambia el nivel mínimo de los mensajes.
+
+        Args:
+            level: Nuevo nivel (nombre o número)
+
+        Returns:
+            int: Nivel anterior (para restaurarlo)
+        """
+        previous = self.logger.level
+        self.logger.setLevel(level)
+        return previous
+
+    def begin_frame(self):
+        """
+        Avanza el contador de frames con el que se anotan los mensajes.
+        """
+        self.frame += 1
+
+    def recent(self, count=None):
+        """
+        Devuelve los últimos mensajes del búfer circular, ya formateados.
+
+        Args:
+            count: Cuántos mensajes (None = todos los guardados)
+
+        Returns:
+            list: Líneas "[frame] mensaje", de la más vieja a la más nueva
+        """
+        records = list(self.ring.records)
+        if count is not None:
+            records = records[-count:]
+        return [f"[{record.frame}] {record.getMessage()}" for record in records]
+
+    def shutdown(self):
+        """
+        Detiene el hilo escritor (escribe antes los mensajes pendientes).
+
+        Los mensajes posteriores se escriben directamente en la consola.
+        """
+        if self.listener is not None:
+            self.listener.stop()
+            self.listener = None
+
+            self.logger.removeHandler(self.queue_handler)
+            self.console.addFilter(FrameFilter(self))
+            self.logger.addHandler(self.console)
+
+    def get_stats(self):
+        """
+        Devuelve las estadísticas del registro.
+
+        Returns:
+            dict: Nivel, mensajes en el búfer, en cola y descartados
+        """
+        handler = self.queue_handler
+        return {
+            'level': logging.getLevelName(self.logger.level),
+            'ring': len(self.ring.records),
+            'queued': handler.queue.qsize() if handler is not None else 0,
+            'dropped': handler.dropped if handler is not None else 0
+        }
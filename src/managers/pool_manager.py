@@ -0,0 +1,210 @@
+# ==============================================================================
+# POOL MANAGER - REUTILIZACIÓN DE ENTIDADES (OBJECT POOLING)
+# ==============================================================================
+# Crear un Sprite (superficie, rect, grupos) en cada disparo y tirarlo al
+# destruirse genera basura constante para el recolector. Con pools, las
+# entidades destruidas vuelven a una lista libre y se reinician al reusarse
+
+import logging
+from config import *
+
+logger = logging.getLogger(__name__)
+
+
+class ObjectPool:
+    """
+    Pool de objetos de UNA clase.
+
+    - acquire(*args): reutiliza un objeto libre (obj.reset(*args))
+      o crea uno nuevo (cls(*args)) si no hay
+    - release(obj): devuelve el objeto a la lista libre
+
+    La lista libre tiene un tope (capacity): lo que sobra se descarta
+    y queda para el recolector de basura.
+    """
+
+    def __init__(self, cls, capacity):
+        """
+        Constructor del pool.
+
+        Args:
+            cls: Clase de los objetos (debe tener reset() con los
+                 mismos argumentos que su constructor)
+            capacity: Máximo de objetos guardados en la lista libre
+        """
+        self.cls = cls
+        self.capacity = capacity
+
+        # Objetos listos para reutilizar
+        self.free = []
+
+        # Estadísticas
+        self.created = 0      # Objetos construidos (incluye pre-calentado)
+        self.reused = 0       # acquire() servidos desde la lista libre
+        self.discarded = 0    # release() con la lista libre llena
+        self.in_use = 0       # Objetos entregados y aún no devueltos
+        self.high_water = 0   # Máximo de objetos en uso a la vez
+
+    def acquire(self, *args):
+        """
+        Entrega un objeto listo para usar.
+
+        Args:
+            *args: Argumentos de construcción / reset()
+
+        Returns:
+            object: Objeto reiniciado con esos argumentos
+        """
+        if self.free:
+            obj = self.free.pop()
+            obj.in_pool = False
+            obj.reset(*args)
+            self.reused += 1
+        else:
+            obj = self.cls(*args)
+            obj.pool = self
+            self.created += 1
+
+        self.in_use += 1
+        if self.in_use > self.high_water:
+            self.high_water = self.in_use
+        return obj
+
+    def release(self, obj):
+        """
+        Devuelve un objeto a la lista libre.
+
+        Llamar dos veces con el mismo objeto no tiene efecto.
+
+        Args:
+            obj: Objeto entregado antes por acquire()
+        """
+        if obj.in_pool:
+            return
+
+        obj.in_pool = True
+        self.in_use -= 1
+
+        if len(self.free) < self.capacity:
+            self.free.append(obj)
+        else:
+            self.discarded += 1
+
+    def prewarm(self, count, *args):
+        """
+        Crea objetos por adelantado (durante la carga).
+
+        Args:
+            count: Objetos a tener en la lista libre (máximo capacity)
+            *args: Argumentos de construcción
+        """
+        while len(self.free) < min(count, self.capacity):
+            obj = self.cls(*args)
+            obj.pool = self
+            obj.in_pool = True
+            self.free.append(obj)
+            self.created += 1
+
+    def get_stats(self):
+        """
+        Devuelve las estadísticas del pool.
+
+        Returns:
+            dict: Creados, reusados, descartados, en uso, máximo en uso y libres
+        """
+        return {
+            'created': self.created,
+            'reused': self.reused,
+            'discarded': self.discarded,
+            'in_use': self.in_use,
+            'high_water': self.high_water,
+            'free': len(self.free)
+        }
+
+
+class PoolManager:
+    """
+    Gestor de pools de entidades (Patrón Singleton).
+
+    Hay un pool por clase (Bullet, Enemy...). Se crea la primera vez
+    que se pide, con la capacidad de POOL_CAPACITY.
+
+    Uso:
+        bala = PoolManager().acquire(Bullet, x, y, 1, True)
+        ...
+        bala.destroy()  # vuelve al pool automáticamente
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(PoolManager, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+
+        # Pools por clase: {clase: ObjectPool}
+        self.pools = {}
+
+        self._initialized = True
+        logger.info("✅ PoolManager inicializado")
+
+    def get_pool(self, cls):
+        """
+        Devuelve el pool de una clase (creándolo si no existe).
+
+        Args:
+            cls: Clase de las entidades
+
+        Returns:
+            ObjectPool: Pool de esa clase
+        """
+        pool = self.pools.get(cls)
+        if pool is None:
+            capacity = POOL_CAPACITY.get(cls.__name__, POOL_DEFAULT_CAPACITY)
+            pool = self.pools[cls] = ObjectPool(cls, capacity)
+        return pool
+
+    def acquire(self, cls, *args):
+        """
+        Entrega una entidad de la clase indicada, reutilizando si se puede.
+
+        Args:
+            cls: Clase de la entidad
+            *args: Argumentos del constructor / reset()
+
+        Returns:
+            object: Entidad lista para usar
+        """
+        return self.get_pool(cls).acquire(*args)
+
+    def prewarm(self, cls, count, *args):
+        """
+        Pre-crea entidades de una clase (durante la pantalla de carga).
+
+        Args:
+            cls: Clase de la entidad
+            count: Cantidad de entidades a dejar listas
+            *args: Argumentos del constructor
+        """
+        self.get_pool(cls).prewarm(count, *args)
+
+    def get_stats(self):
+        """
+        Devuelve las estadísticas de todos los pools.
+
+        Returns:
+            dict: {nombre de la clase: estadísticas del pool}
+        """
+        return {cls.__name__: pool.get_stats() for cls, pool in self.pools.items()}
+
+    def clear(self):
+        """
+        Vacía todas las listas libres.
+        """
+        for pool in self.pools.values():
+            pool.free.clear()
@@ -0,0 +1,215 @@
+# ==============================================================================
+# PROFILE CAPTURE - CAPTURAS DE cProfile DURANTE LA PARTIDA
+# ==============================================================================
+# Con una tecla se empieza y se termina una captura de cProfile sobre el
+# game loop, en plena partida (los tirones que dependen de la carga no se
+# reproducen bajo un perfilador externo). Cada captura guarda:
+#
+# - <nombre>.pstats: para pstats, snakeviz, tuna...
+# - <nombre>.collapsed: pilas colapsadas ("a;b;c microsegundos"), para
+#   flamegraph.pl, speedscope o inferno
+#
+# Sin captura en curso no hay ningún hook instalado: no cuesta nada
+
+import cProfile
+import logging
+import os
+import pstats
+import time
+from collections import Counter, defaultdict
+from config import *
+
+logger = logging.getLogger(__name__)
+
+
+class ProfileCapture:
+    """
+    Captura de cProfile activada por tecla (Patrón Singleton).
+
+    Uso:
+        capture.toggle()        # empezar / terminar y guardar
+        capture.start(10.0)     # empezar, con fin automático a los 10 s
+        capture.check()         # una vez por frame si capture.active
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(ProfileCapture, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+
+        # Captura en curso (None = ninguna)
+        self.profile = None
+        self.active = False
+        self.started = 0.0
+        self.stop_at = None
+
+        # Capturas guardadas en esta sesión
+        self.captures = 0
+
+        self._initialized = True
+
+    def toggle(self):
+        """
+        Empieza una captura, o termina la actual y la guarda.
+
+        Returns:
+            str: Ruta base de la captura guardada, o None si empezó una
+        """
+        if not self.active:
+            self.start()
+            return None
+        return self.stop()
+
+    def start(self, duration=PROFILE_CAPTURE_SECONDS):
+        """
+        Empieza una captura de cProfile.
+
+        Args:
+            duration: Segundos hasta el fin automático (0 = hasta llamar a stop())
+        """
+        if self.active:
+            return
+
+        self.profile = cProfile.Profile()
+        self.started = time.perf_counter()
+        self.stop_at = self.started + duration if duration > 0 else None
+        self.active = True
+        self.profile.enable()
+
+        if self.stop_at is not None:
+            logger.info("⏺️ Capturando perfil (cProfile) durante %.1f s", duration)
+        else:
+            logger.info("⏺️ Capturando perfil (cProfile)")
+
+    def check(self):
+        """
+        Termina la captura si llegó su fin automático.
+        """
+        if self.stop_at is not None and time.perf_counter() >= self.stop_at:
+            self.stop()
+
+    def stop(self, path=None):
+        """
+        Termina la captura y la guarda (.pstats y .collapsed).
+
+        Args:
+            path: Ruta base sin extensión (None = PROFILE_CAPTURE_DIR/cprofile_<fecha>)
+
+        Returns:
+            str: Ruta base de los archivos, o None si no se pudo guardar
+        """
+        if not self.active:
+            return None
+
+        self.profile.disable()
+        elapsed = time.perf_counter() - self.started
+        profile, self.profile = self.profile, None
+        self.active = False
+        self.stop_at = None
+
+        if path is None:
+            os.makedirs(PROFILE_CAPTURE_DIR, exist_ok=True)
+            path = os.path.join(PROFILE_CAPTURE_DIR, time.strftime("cprofile_%Y%m%d_%H%M%S"))
+
+        stats = pstats.Stats(profile)
+        try:
+            stats.dump_stats(path + ".pstats")
+            with open(path + ".collapsed", 'w', encoding='utf-8') as f:
+                for stack, weight in collapsed_stacks(stats.stats).items():
+                    f.write(f"{stack} {weight}\n")
+        except OSError as e:
+            logger.warning("⚠️ No se pudo guardar el perfil: %s", e)
+            return None
+
+        self.captures += 1
+        logger.info("💾 Perfil guardado en %s.pstats / .collapsed (%.1f s, %s llamadas)",
+                    path, elapsed, stats.total_calls)
+        return path
+
+    def get_stats(self):
+        """
+        Devuelve el estado de las capturas.
+
+        Returns:
+            dict: Si hay captura en curso, su duración y capturas guardadas
+        """
+        return {
+            'active': self.active,
+            'elapsed': time.perf_counter() - self.started if self.active else 0.0,
+            'captures': self.captures
+        }
+
+
+def frame_label(func):
+    """
+    Nombre de una función en las pilas colapsadas: "nombre (archivo:línea)".
+
+    Args:
+        func: Clave de pstats (archivo, línea, nombre)
+
+    Returns:
+        str: Etiqueta sin ";" (el separador de las pilas)
+    """
+    filename, line, name = func
+    if filename == '~':
+        # Funciones de C: "<method 'append' of 'list' objects>"
+        label = name
+    else:
+        label = f"{name} ({os.path.basename(filename)}:{line})"
+    return label.replace(";", ",")
+
+
+def collapsed_stacks(stats, max_depth=PROFILE_CAPTURE_MAX_DEPTH):
+    """
+    Reconstruye pilas colapsadas a partir de las estadísticas de cProfile.
+
+    cProfile solo guarda pares llamador -> llamado, no pilas completas: el
+    tiempo de cada función se reparte entre sus llamados en proporción a
+    lo que cada llamador le pasó. Es una aproximación (la misma que usan
+    flameprof y gprof2dot), suficiente para ver dónde se va el frame.
+
+    Args:
+        stats: Diccionario pstats.Stats.stats
+        max_depth: Profundidad máxima de las pilas
+
+    Returns:
+        Counter: {"raíz;...;hoja": microsegundos de tiempo propio}
+    """
+    # Llamados de cada función, con el tiempo acumulado desde ese llamador
+    callees = defaultdict(list)
+    for func, (_, _, _, _, callers) in stats.items():
+        for caller, caller_stats in callers.items():
+            callees[caller].append((func, caller_stats[3]))
+
+    stacks = Counter()
+    pending = [((func,), stats[func][3]) for func, entry in stats.items() if not entry[4]]
+    while pending:
+        path, cumulative = pending.pop()
+        func = path[-1]
+        _, _, own_time, total_time, _ = stats[func]
+        if total_time <= 0:
+            continue
+
+        # Fracción del tiempo de la función que corresponde a esta pila
+        share = cumulative / total_time
+        weight = int(own_time * share * 1e6)
+        if weight > 0:
+            stacks[";".join(frame_label(f) for f in path)] += weight
+
+        if len(path) >= max_depth:
+            continue
+        for callee, callee_time in callees[func]:
+            # Se cortan las llamadas recursivas (si no, la pila no terminaría)
+            if callee in path:
+                continue
+            if callee_time * share * 1e6 >= 1:
+                pending.append((path + (callee,), callee_time * share))
+
+    return stacks
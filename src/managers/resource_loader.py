@@ -0,0 +1,94 @@
+# ==============================================================================
+# RESOURCE LOADER - CARGA DE RECURSOS EN SEGUNDO PLANO
+# ==============================================================================
+# Ejecuta una lista de tareas de carga (manifiesto) en un hilo aparte,
+# para que la pantalla de carga pueda seguir dibujándose mientras tanto
+
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class ResourceLoader:
+    """
+    Cargador de recursos en un hilo de trabajo.
+
+    El manifiesto es una lista de tareas (descripción, función).
+    Cada tarea es una "unidad de trabajo": el progreso es
+    tareas_completadas / tareas_totales, no un tiempo simulado.
+
+    Uso:
+        loader = ResourceLoader(tareas)
+        loader.start()
+        ...
+        if loader.done:
+            # Todo cargado
+    """
+
+    def __init__(self, tasks):
+        """
+        Constructor del ResourceLoader.
+
+        Args:
+            tasks: Lista de tuplas (descripción, función_sin_argumentos)
+        """
+        self.tasks = list(tasks)
+        self.total = len(self.tasks)
+        self.completed = 0
+
+        # Descripción de la tarea que se está ejecutando ahora
+        self.current_task = ""
+
+        # Errores ocurridos: lista de (descripción, excepción)
+        # Un error no detiene la carga: las entidades tienen fallback
+        self.errors = []
+
+        # True cuando todas las tareas terminaron
+        self.done = self.total == 0
+
+        self.thread = None
+
+    @property
+    def progress(self):
+        """
+        Progreso real de la carga.
+
+        Returns:
+            float: 0.0 a 1.0 según las unidades de trabajo completadas
+        """
+        if self.total == 0:
+            return 1.0
+        return self.completed / self.total
+
+    def start(self):
+        """
+        Inicia la carga en un hilo aparte.
+
+        El hilo es "daemon": si el jugador cierra el juego durante
+        la carga, no impide que el programa termine.
+        """
+        if self.thread is not None or self.done:
+            return
+
+        self.thread = threading.Thread(target=self.run, name="ResourceLoader", daemon=True)
+        self.thread.start()
+
+    def run(self):
+        """
+        Ejecuta todas las tareas del manifiesto en orden.
+
+        Se ejecuta dentro del hilo de trabajo.
+        """
+        for description, task in self.tasks:
+            self.current_task = description
+            try:
+                task()
+            except Exception as e:
+                logger.warning("⚠️ Error cargando %s: %s", description, e)
+                self.errors.append((description, e))
+            self.completed += 1
+
+        self.current_task = ""
+        self.done = True
+        logger.info("✅ Carga completa: %s recursos (%s errores)", self.total, len(self.errors))
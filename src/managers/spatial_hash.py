@@ -0,0 +1,110 @@
+# ==============================================================================
+# SPATIAL HASH - REJILLA ESPACIAL PARA COLISIONES
+# ==============================================================================
+# Divide la pantalla en celdas cuadradas. Cada sprite se anota en las celdas
+# que toca; una consulta solo revisa los sprites de las celdas que solapa
+
+class SpatialHash:
+    """
+    Rejilla uniforme de celdas (spatial hash).
+
+    En vez de comparar cada bala con TODOS los enemigos
+    (O(balas × enemigos)), cada bala solo se compara con los
+    enemigos de su misma celda.
+
+    Uso:
+        grid = SpatialHash(64)
+        grid.insert_all(enemigos)
+        candidatos = grid.query(bala.rect)
+    """
+
+    def __init__(self, cell_size):
+        """
+        Constructor de la rejilla.
+
+        Args:
+            cell_size: Tamaño de cada celda en píxeles
+        """
+        self.cell_size = cell_size
+
+        # Celdas ocupadas: {(columna, fila): [sprites]}
+        self.cells = {}
+
+    def cell_range(self, rect):
+        """
+        Calcula las celdas que cubre un rect.
+
+        Args:
+            rect: Rect a ubicar
+
+        Returns:
+            tuple: (col_min, col_max, fila_min, fila_max), inclusivos
+        """
+        # Los Rect de pygame son enteros: // redondea hacia abajo
+        size = self.cell_size
+        return (
+            rect.left // size,
+            (rect.right - 1) // size,
+            rect.top // size,
+            (rect.bottom - 1) // size
+        )
+
+    def insert(self, sprite):
+        """
+        Anota un sprite en todas las celdas que toca su rect.
+
+        Args:
+            sprite: Sprite con atributo rect
+        """
+        col_min, col_max, row_min, row_max = self.cell_range(sprite.rect)
+        cells = self.cells
+        for col in range(col_min, col_max + 1):
+            for row in range(row_min, row_max + 1):
+                cell = cells.get((col, row))
+                if cell is None:
+                    cells[(col, row)] = [sprite]
+                else:
+                    cell.append(sprite)
+
+    def insert_all(self, sprites):
+        """
+        Anota varios sprites.
+
+        Args:
+            sprites: Iterable de sprites
+        """
+        for sprite in sprites:
+            self.insert(sprite)
+
+    def query(self, rect):
+        """
+        Devuelve los sprites de las celdas que solapa el rect.
+
+        Son CANDIDATOS: hay que confirmar con colliderect().
+
+        Args:
+            rect: Rect de consulta
+
+        Returns:
+            list: Sprites candidatos, sin repetidos
+        """
+        col_min, col_max, row_min, row_max = self.cell_range(rect)
+        cells = self.cells
+
+        # Caso más común: el rect cae en una sola celda
+        if col_min == col_max and row_min == row_max:
+            return cells.get((col_min, row_min), [])
+
+        found = {}
+        for col in range(col_min, col_max + 1):
+            for row in range(row_min, row_max + 1):
+                cell = cells.get((col, row))
+                if cell:
+                    found.update(dict.fromkeys(cell))
+        return list(found)
+
+    def clear(self):
+        """
+        Vacía la rejilla.
+        """
+        self.cells.clear()
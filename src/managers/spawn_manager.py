@@ -3,24 +3,35 @@
 # ==============================================================================
 # Este manager se encarga de crear y gestionar las oleadas de enemigos
 
+import logging
+import time
 import pygame
-from src.entities import Enemy
+from collections import deque
+from src.entities.enemy import Enemy
+from src.entities.formation import Formation
+from src.managers.pool_manager import PoolManager
+from src.managers.tracer import traced
 from config import *
 
+logger = logging.getLogger(__name__)
+
 class SpawnManager:
     """
     Gestor de aparición de enemigos.
     
     Responsabilidades:
-    - Crear oleadas de enemigos en formación
+    - Crear oleadas de enemigos en formación (por partes, ver materialize)
     - Gestionar la dificultad progresiva
     - Controlar el movimiento en formación
     - Detectar victoria (todos los enemigos eliminados)
     """
     
-    def __init__(self):
+    def __init__(self, scheduler):
         """
         Constructor del SpawnManager.
+        
+        Args:
+            scheduler: TimerScheduler del juego (cooldown de descenso)
         """
         # Nivel actual del juego
         self.current_level = 1
@@ -37,26 +48,37 @@ class SpawnManager:
         # Velocidad de movimiento de la formación
         self.formation_speed = ENEMY_SPEED
         
+        # Formación de la oleada actual (se crea en prepare_wave)
+        self.formation = None
+        
+        # Enemigos planificados que aún no se crearon:
+        # (fila, columna, x, y, tipo). Se vacía en materialize()
+        self.pending = deque()
+        
         # Cooldown para evitar descensos múltiples
         # Cuando tocan el borde, no pueden volver a bajar hasta que este timer expire
-        self.descent_cooldown = 0  # Tiempo restante de cooldown (segundos)
+        self.scheduler = scheduler
+        self.descent_timer = None  # Timer del cooldown (None = pueden bajar)
         self.descent_delay = 0.5   # Medio segundo entre descensos
         
-        print("✅ SpawnManager inicializado")
+        logger.info("✅ SpawnManager inicializado")
     
-    def spawn_wave(self, level, enemy_group, all_sprites):
+    @traced("SpawnManager.prepare_wave")
+    def prepare_wave(self, level):
         """
-        Genera una oleada de enemigos según el nivel.
+        Prepara una oleada de enemigos según el nivel.
+        
+        Solo crea la formación (vacía) y planifica qué enemigo va en
+        cada celda: los enemigos se crean después, por partes, en
+        materialize() (presentación de la oleada).
         
         Args:
             level: Nivel actual del juego
-            enemy_group: Grupo donde agregar los enemigos
-            all_sprites: Grupo de todos los sprites
         
         Returns:
-            int: Cantidad de enemigos generados
+            int: Cantidad de enemigos planificados
         """
-        print(f"🌊 Generando oleada del nivel {level}...")
+        logger.info("🌊 Generando oleada del nivel %s...", level)
         
         # Aumentar dificultad con el nivel
         # Más columnas cada 2 niveles
@@ -69,9 +91,13 @@ class SpawnManager:
         # Centrar la formación horizontalmente
         start_x = (WINDOW_WIDTH - formation_width) // 2
         
-        enemies_created = 0
+        # Crear la formación: todos los enemigos se moverán juntos
+        self.formation = Formation(
+            rows, cols, start_x, self.start_y, self.spacing_x, self.spacing_y
+        )
         
-        # Crear la formación de enemigos
+        # Planificar la formación de enemigos
+        self.pending.clear()
         for row in range(rows):
             for col in range(cols):
                 # Calcular posición del enemigo
@@ -89,45 +115,101 @@ class SpawnManager:
                 else:
                     enemy_type = "fast"
                 
-                # Crear el enemigo
-                enemy = Enemy(x, y, enemy_type)
-                
-                # Agregar a los grupos
-                enemy_group.add(enemy)
-                all_sprites.add(enemy)
-                
-                enemies_created += 1
+                self.pending.append((row, col, x, y, enemy_type))
+        
+        return len(self.pending)
+    
+    @property
+    def spawning(self):
+        """
+        True mientras quedan enemigos de la oleada por crear.
+        """
+        return len(self.pending) > 0
+    
+    @traced("SpawnManager.materialize")
+    def materialize(self, registry, max_count=WAVE_SPAWN_PER_STEP, budget_ms=WAVE_SPAWN_BUDGET_MS):
+        """
+        Crea una parte de los enemigos planificados.
+        
+        Se llama una vez por paso durante la presentación de la oleada.
+        Para al crear max_count enemigos o al agotar el presupuesto de
+        tiempo (siempre crea al menos uno, para avanzar).
+        
+        Args:
+            registry: EntityRegistry donde registrar los enemigos
+            max_count: Máximo de enemigos a crear en este paso
+            budget_ms: Tiempo máximo a dedicar (milisegundos)
         
-        print(f"👾 {enemies_created} enemigos creados en formación {rows}x{cols}")
-        return enemies_created
+        Returns:
+            int: Cantidad de enemigos creados en este paso
+        """
+        pending = self.pending
+        if not pending:
+            return 0
+        
+        deadline = time.perf_counter() + budget_ms / 1000.0
+        pool = PoolManager()
+        created = 0
+        
+        while pending and created < max_count:
+            row, col, x, y, enemy_type = pending.popleft()
+            
+            # Crear (o reutilizar del pool) el enemigo y colocarlo en su celda
+            enemy = pool.acquire(Enemy, x, y, enemy_type)
+            self.formation.add(enemy, row, col)
+            
+            # Registrar el enemigo
+            registry.add(enemy, "enemies")
+            
+            created += 1
+            if time.perf_counter() >= deadline:
+                break
+        
+        if not pending:
+            formation = self.formation
+            logger.info("👾 %s enemigos creados en formación %sx%s", len(formation), formation.rows, formation.cols)
+        
+        return created
     
     def update_formation(self, enemy_group, delta_time):
         """
         Actualiza el movimiento en formación de los enemigos.
         
+        La formación entera se desplaza a formation_speed.
         Cuando un enemigo llega al borde de la pantalla:
         - Todos descienden (solo si no hay cooldown activo)
         - Todos invierten dirección
         
+        Los bordes de la formación se leen de sus límites (O(1));
+        solo los enemigos sueltos se revisan uno por uno.
+        
         Args:
-            enemy_group: Grupo de enemigos a actualizar
+            enemy_group: Grupo de enemigos FUERA de la formación (sueltos)
             delta_time: Tiempo desde el último frame (segundos)
         
         Returns:
             bool: True si llegaron al fondo (invasión), False si no
         """
-        if len(enemy_group) == 0:
+        formation = self.formation
+        has_formation = formation is not None and len(formation) > 0
+        if not has_formation and len(enemy_group) == 0:
             return False
         
-        # Actualizar cooldown de descenso
-        if self.descent_cooldown > 0:
-            self.descent_cooldown -= delta_time
-        
         # Verificar si algún enemigo llegó al borde
         hit_left_edge = False
         hit_right_edge = False
         hit_bottom = False
         
+        # Mover toda la formación como un solo bloque
+        if has_formation:
+            formation.save_position()
+            formation.move(self.formation_speed * formation.direction * delta_time)
+            
+            # Bordes de los enemigos vivos de la formación
+            hit_left_edge = formation.left <= 0
+            hit_right_edge = formation.right >= WINDOW_WIDTH
+            hit_bottom = formation.bottom >= INVASION_LINE
+        
         for enemy in enemy_group:
             # Verificar borde izquierdo
             if enemy.rect.left <= 0:
@@ -138,24 +220,35 @@ class SpawnManager:
                 hit_right_edge = True
             
             # Verificar si llegaron al fondo (invasión)
-            if enemy.rect.bottom >= WINDOW_HEIGHT - 100:
+            if enemy.rect.bottom >= INVASION_LINE:
                 hit_bottom = True
         
         # Si alguno llegó al borde horizontal Y no hay cooldown activo
-        if (hit_left_edge or hit_right_edge) and self.descent_cooldown <= 0:
+        if (hit_left_edge or hit_right_edge) and self.descent_timer is None:
             # Todos los enemigos bajan y cambian dirección
+            if has_formation:
+                formation.move(0, ENEMY_DESCENT_SPEED)
+                formation.reverse_direction()
+            
+            # Enemigos fuera de formación (se mueven por su cuenta)
             for enemy in enemy_group:
                 enemy.move_down()
                 enemy.reverse_direction()
             
             # Activar cooldown para evitar descensos múltiples
-            self.descent_cooldown = self.descent_delay
+            self.descent_timer = self.scheduler.schedule(self.descent_delay, self.end_descent_cooldown)
             
-            print("🔄 Formación descendió y cambió dirección")
+            logger.debug("🔄 Formación descendió y cambió dirección")
         
         # Retornar si hubo invasión
         return hit_bottom
     
+    def end_descent_cooldown(self):
+        """
+        Termina el cooldown de descenso (lo llama el scheduler).
+        """
+        self.descent_timer = None
+    
     def all_enemies_dead(self, enemy_group):
         """
         Verifica si todos los enemigos han sido eliminados.
@@ -176,10 +269,10 @@ class SpawnManager:
             int: Nuevo nivel
         """
         self.current_level += 1
-        print(f"🎊 ¡Nivel {self.current_level} desbloqueado!")
+        logger.info("🎊 ¡Nivel %s desbloqueado!", self.current_level)
         
         # Aumentar velocidad de enemigos progresivamente
-        self.formation_speed += 0.2
+        self.formation_speed += ENEMY_SPEED_PER_LEVEL
         
         return self.current_level
     
@@ -189,5 +282,10 @@ class SpawnManager:
         """
         self.current_level = 1
         self.formation_speed = ENEMY_SPEED
-        self.descent_cooldown = 0  # Resetear cooldown
-        print("🔄 SpawnManager reiniciado")
+        self.formation = None
+        self.pending.clear()
+        # Resetear cooldown
+        if self.descent_timer is not None:
+            self.descent_timer.cancel()
+            self.descent_timer = None
+        logger.info("🔄 SpawnManager reiniciado")
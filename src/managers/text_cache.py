@@ -0,0 +1,103 @@
+# ==============================================================================
+# TEXT CACHE - CACHÉ DE TEXTOS RENDERIZADOS
+# ==============================================================================
+# Font.render() rasteriza el texto cada vez que se llama.
+# Este manager guarda las superficies ya renderizadas para reutilizarlas
+# mientras el texto no cambie
+
+import logging
+from collections import OrderedDict
+from config import *
+
+logger = logging.getLogger(__name__)
+
+
+class TextCache():
+    """
+    Caché de superficies de texto (Patrón Singleton).
+
+    Clave: (fuente, texto, color, antialias)
+
+    La caché tiene un tamaño máximo: cuando se llena, se descarta
+    el texto usado hace más tiempo (LRU: Least Recently Used).
+    Así los valores viejos del HUD (ej: "SCORE: 10") no se acumulan.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(TextCache, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+
+        # Superficies renderizadas, ordenadas de menos a más recientemente usadas
+        self.surfaces = OrderedDict()
+        self.capacity = TEXT_CACHE_SIZE
+
+        # Estadísticas
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+        self._initialized = True
+        logger.info("✅ TextCache inicializado")
+
+    def render(self, font, text, color, antialias=True):
+        """
+        Devuelve el texto renderizado, rasterizándolo solo si no está en caché.
+
+        Args:
+            font: Fuente (idealmente compartida vía FontManager)
+            text: Texto a renderizar
+            color: Color RGB del texto
+            antialias: True para suavizar bordes
+
+        Returns:
+            Surface: Superficie COMPARTIDA (no modificar)
+        """
+        key = (font, text, tuple(color), antialias)
+
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.hits += 1
+            self.surfaces.move_to_end(key)
+            return surface
+
+        self.misses += 1
+        surface = font.render(text, antialias, color)
+        self.surfaces[key] = surface
+
+        # Descartar el texto menos usado si nos pasamos del límite
+        if len(self.surfaces) > self.capacity:
+            self.surfaces.popitem(last=False)
+            self.evictions += 1
+
+        return surface
+
+    def get_stats(self):
+        """
+        Devuelve las estadísticas de uso de la caché.
+
+        Returns:
+            dict: Aciertos, fallos, descartes y textos en caché
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions,
+            'texts': len(self.surfaces)
+        }
+
+    def clear(self):
+        """
+        Vacía la caché y reinicia sus estadísticas.
+        """
+        self.surfaces.clear()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
@@ -0,0 +1,152 @@
+# ==============================================================================
+# TIMER SCHEDULER - PLANIFICADOR DE TIMERS SOBRE EL RELOJ DEL JUEGO
+# ==============================================================================
+# Cooldowns, invulnerabilidad, recargas... En vez de que cada objeto
+# descuente su propio float en cada paso, registran un plazo y una función
+# a llamar. El planificador guarda los plazos en un heap: cada paso solo
+# cuesta trabajo por los timers que vencen
+
+import heapq
+
+
+class Timer:
+    """
+    Timer registrado en un TimerScheduler.
+
+    Lo devuelve schedule(); sirve para consultar el tiempo restante
+    o para cancelarlo.
+    """
+
+    __slots__ = ('scheduler', 'deadline', 'callback', 'args', 'active')
+
+    def __init__(self, scheduler, deadline, callback, args):
+        self.scheduler = scheduler
+        self.deadline = deadline
+        self.callback = callback
+        self.args = args
+        self.active = True
+
+    @property
+    def remaining(self):
+        """
+        Segundos de juego que faltan para que venza (0 si ya no está activo).
+        """
+        if not self.active:
+            return 0.0
+        return max(0.0, self.deadline - self.scheduler.time)
+
+    def cancel(self):
+        """
+        Cancela el timer (no tiene efecto si ya venció o se canceló).
+        """
+        if self.active:
+            self.active = False
+            self.scheduler.cancelled += 1
+
+
+class TimerScheduler:
+    """
+    Planificador de timers sobre el reloj del juego.
+
+    - schedule(segundos, función, *args): registra un plazo
+    - update(delta_time): avanza el reloj y llama a las funciones
+      de los timers vencidos, en orden de plazo
+    - pause()/resume(): congela el reloj (y todos los timers)
+
+    Los timers cancelados se quedan en el heap y se descartan
+    al llegar su plazo (cancelar cuesta O(1)).
+    """
+
+    def __init__(self):
+        """
+        Constructor del planificador.
+        """
+        # Reloj del juego (segundos simulados, sin contar pausas)
+        self.time = 0.0
+        self.paused = False
+
+        # Heap de (plazo, orden, Timer): a igual plazo, primero el más antiguo
+        self.heap = []
+        self.sequence = 0
+
+        # Estadísticas
+        self.fired = 0
+        self.cancelled = 0
+
+    def __len__(self):
+        return len(self.heap)
+
+    def schedule(self, delay, callback, *args):
+        """
+        Registra una función para dentro de `delay` segundos de juego.
+
+        Args:
+            delay: Segundos hasta el plazo
+            callback: Función a llamar al vencer
+            *args: Argumentos de la función
+
+        Returns:
+            Timer: Timer registrado (para cancelarlo o ver cuánto falta)
+        """
+        timer = Timer(self, self.time + delay, callback, args)
+        heapq.heappush(self.heap, (timer.deadline, self.sequence, timer))
+        self.sequence += 1
+        return timer
+
+    def update(self, delta_time):
+        """
+        Avanza el reloj y ejecuta los timers vencidos.
+
+        Un timer registrado desde una función con plazo ya cumplido
+        se ejecuta en este mismo paso.
+
+        Args:
+            delta_time: Duración del paso de simulación (segundos)
+
+        Returns:
+            int: Timers ejecutados en este paso
+        """
+        if self.paused:
+            return 0
+
+        self.time += delta_time
+
+        heap = self.heap
+        fired = 0
+        while heap and heap[0][0] <= self.time:
+            timer = heapq.heappop(heap)[2]
+            if not timer.active:
+                continue
+            timer.active = False
+            timer.callback(*timer.args)
+            fired += 1
+
+        self.fired += fired
+        return fired
+
+    def pause(self):
+        """
+        Congela el reloj: ningún timer avanza ni vence.
+        """
+        self.paused = True
+
+    def resume(self):
+        """
+        Reanuda el reloj.
+        """
+        self.paused = False
+
+    def get_stats(self):
+        """
+        Devuelve las estadísticas del planificador.
+
+        Returns:
+            dict: Reloj, timers pendientes (incluye cancelados sin descartar),
+                  ejecutados y cancelados
+        """
+        return {
+            'time': self.time,
+            'pending': len(self.heap),
+            'fired': self.fired,
+            'cancelled': self.cancelled
+        }
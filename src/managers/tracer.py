@@ -0,0 +1,280 @@
+# ==============================================================================
+# TRACER - TRAZAS DEL GAME LOOP (FORMATO CHROME / PERFETTO)
+# ==============================================================================
+# Registra cada frame, update, draw, cambio de estado, oleada y prueba de
+# colisiones como un intervalo (span) con su inicio y duración, más
+# contadores (entidades, balas vivas). Al volcarlo se obtiene un JSON en
+# "Trace Event Format" que se abre en https://ui.perfetto.dev o en
+# chrome://tracing para ver frame por frame qué hacía el juego.
+#
+# Apagado, cada span cuesta un solo "if"
+
+import functools
+import json
+import logging
+import os
+import threading
+import time
+from collections import deque
+from config import *
+
+logger = logging.getLogger(__name__)
+
+
+class _NullSpan:
+    """
+    Span que no hace nada (tracer apagado). Se comparte una sola instancia.
+    """
+
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    """
+    Span activo: al salir del bloque registra inicio y duración.
+    """
+
+    __slots__ = ('tracer', 'name', 'args', 'start')
+
+    def __init__(self, tracer, name, args):
+        self.tracer = tracer
+        self.name = name
+        self.args = args
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.tracer.complete(self.name, self.start, time.perf_counter(), self.args)
+        return False
+
+
+class Tracer:
+    """
+    Grabador de trazas del game loop (Patrón Singleton).
+
+    - span(nombre): bloque "with" medido
+    - span_for(objeto, "update"): igual, con nombre "<Clase>.update"
+    - @traced(nombre): mide cada llamada a una función
+    - counter(nombre, valor=...): serie de valores en el tiempo
+
+    Los eventos se guardan en un búfer circular de TRACE_BUFFER_SIZE:
+    si se llena, se pierden los más viejos (siempre quedan los últimos
+    segundos, que es donde está el tirón que interesa). Cada span se
+    guarda como UN evento completo ("X"), así que nunca quedan un
+    inicio sin fin ni un fin sin inicio.
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super(Tracer, cls).__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+
+        self.enabled = False
+
+        # Eventos: (fase, nombre, inicio_us, duración_us, hilo, args)
+        self.events = deque(maxlen=TRACE_BUFFER_SIZE)
+
+        # Origen de tiempos de la traza (perf_counter al iniciar)
+        self.origin = 0.0
+
+        # Nombres "<Clase>.<método>" ya armados
+        self.names = {}
+
+        # Nombres de los hilos vistos (metadatos de la traza)
+        self.threads = {}
+
+        self._initialized = True
+
+    def start(self):
+        """
+        Empieza a grabar (descarta lo grabado antes).
+        """
+        self.events.clear()
+        self.threads.clear()
+        self.origin = time.perf_counter()
+        self.enabled = True
+        logger.info("⏺️ Grabando traza (Trace Event Format)")
+
+    def stop(self):
+        """
+        Deja de grabar (lo grabado sigue en el búfer hasta flush()).
+        """
+        self.enabled = False
+
+    def toggle(self):
+        """
+        Empieza a grabar, o termina y vuelca la traza a disco.
+
+        Returns:
+            str: Ruta de la traza guardada, o None si empezó a grabar
+        """
+        if not self.enabled:
+            self.start()
+            return None
+        self.stop()
+        return self.flush()
+
+    def span(self, name, **args):
+        """
+        Devuelve un bloque "with" que se registra como span.
+
+        Args:
+            name: Nombre del span
+            **args: Datos extra que se muestran al seleccionar el span
+
+        Returns:
+            Context manager (uno vacío si el tracer está apagado)
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        return _Span(self, name, args)
+
+    def span_for(self, obj, method):
+        """
+        Span con nombre "<Clase>.<método>" (ej: "GameScreen.update").
+
+        El nombre se arma una sola vez por clase y método.
+
+        Args:
+            obj: Objeto cuyo método se mide
+            method: Nombre del método
+
+        Returns:
+            Context manager (uno vacío si el tracer está apagado)
+        """
+        if not self.enabled:
+            return _NULL_SPAN
+        key = (type(obj), method)
+        name = self.names.get(key)
+        if name is None:
+            name = self.names[key] = f"{type(obj).__name__}.{method}"
+        return _Span(self, name, None)
+
+    def complete(self, name, start, end, args=None):
+        """
+        Registra un span ya terminado.
+
+        Args:
+            name: Nombre del span
+            start: Inicio (time.perf_counter())
+            end: Fin (time.perf_counter())
+            args: Datos extra (dict) o None
+        """
+        thread = threading.get_ident()
+        if thread not in self.threads:
+            self.threads[thread] = threading.current_thread().name
+        self.events.append((
+            'X', name,
+            (start - self.origin) * 1e6, (end - start) * 1e6,
+            thread, args
+        ))
+
+    def counter(self, name, **values):
+        """
+        Registra el valor actual de uno o varios contadores.
+
+        Args:
+            name: Nombre del grupo (una pista en el visor)
+            **values: Valores numéricos (ej: enemies=32, bullets=5)
+        """
+        if not self.enabled:
+            return
+        self.events.append((
+            'C', name,
+            (time.perf_counter() - self.origin) * 1e6, 0,
+            threading.get_ident(), values
+        ))
+
+    def to_dict(self):
+        """
+        Convierte lo grabado al Trace Event Format.
+
+        Returns:
+            dict: {"traceEvents": [...], "displayTimeUnit": "ms"}
+        """
+        pid = os.getpid()
+        trace_events = [
+            {'name': 'process_name', 'ph': 'M', 'pid': pid, 'tid': 0,
+             'args': {'name': WINDOW_TITLE}}
+        ]
+        for thread, thread_name in self.threads.items():
+            trace_events.append({'name': 'thread_name', 'ph': 'M', 'pid': pid,
+                                 'tid': thread, 'args': {'name': thread_name}})
+
+        for phase, name, ts, dur, thread, args in self.events:
+            event = {'name': name, 'cat': 'game', 'ph': phase,
+                     'ts': round(ts, 3), 'pid': pid, 'tid': thread}
+            if phase == 'X':
+                event['dur'] = round(dur, 3)
+            if args:
+                event['args'] = args
+            trace_events.append(event)
+
+        return {'traceEvents': trace_events, 'displayTimeUnit': 'ms'}
+
+    def flush(self, path=None):
+        """
+        Guarda lo grabado como JSON y vacía el búfer.
+
+        Args:
+            path: Ruta del archivo (None = TRACE_DIR/trace_<fecha>.json)
+
+        Returns:
+            str: Ruta del archivo, o None si no se pudo guardar
+        """
+        if path is None:
+            os.makedirs(TRACE_DIR, exist_ok=True)
+            path = os.path.join(TRACE_DIR, time.strftime("trace_%Y%m%d_%H%M%S.json"))
+
+        count = len(self.events)
+        try:
+            with open(path, 'w') as f:
+                json.dump(self.to_dict(), f)
+        except OSError as e:
+            logger.warning("⚠️ No se pudo guardar la traza: %s", e)
+            return None
+
+        self.events.clear()
+        logger.info("💾 Traza guardada en %s (%s eventos)", path, count)
+        return path
+
+
+def traced(name):
+    """
+    Decorador: registra cada llamada a la función como un span.
+
+    Apagado, solo añade una comprobación de tracer.enabled.
+
+    Args:
+        name: Nombre del span (ej: "CollisionManager.check_all_collisions")
+    """
+    def decorator(func):
+        tracer = Tracer()
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not tracer.enabled:
+                return func(*args, **kwargs)
+            with _Span(tracer, name, None):
+                return func(*args, **kwargs)
+
+        return wrapper
+    return decorator
@@ -0,0 +1,8 @@
+# ==============================================================================
+# RENDERING PACKAGE
+# ==============================================================================
+# Utilidades de renderizado (rectángulos sucios, dibujo por lotes, capas)
+
+from .dirty_rect_renderer import DirtyRectRenderer
+from .sprite_batch import SpriteBatch
+from .formation_layer import FormationLayer
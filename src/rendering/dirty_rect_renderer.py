@@ -0,0 +1,111 @@
+# ==============================================================================
+# DIRTY RECT RENDERER - RENDERIZADO POR RECTÁNGULOS SUCIOS
+# ==============================================================================
+# En vez de limpiar y enviar a pantalla los 800x600 píxeles cada frame,
+# solo se limpian y actualizan las zonas que cambiaron ("dirty rects")
+
+import pygame
+from config import *
+
+
+class DirtyRectRenderer:
+    """
+    Seguimiento de rectángulos sucios para un estado del juego.
+
+    Cada frame:
+    1. clear(): borra (con el color de fondo) donde estaban los sprites
+       el frame anterior y las zonas marcadas con mark_dirty()
+    2. El estado dibuja sus sprites y anota el rect de cada uno
+    3. finish(): devuelve la lista de rects a enviar con
+       pygame.display.update(rects)
+
+    Si se pide un repintado completo (invalidate()), ese frame se limpia
+    la pantalla entera y finish() devuelve None (= usar display.flip()).
+    """
+
+    def __init__(self, screen, background_color=BLACK):
+        """
+        Constructor del DirtyRectRenderer.
+
+        Args:
+            screen: Superficie de la ventana
+            background_color: Color con el que se borran las zonas sucias
+        """
+        self.screen = screen
+        self.background_color = background_color
+
+        # Rects dibujados el frame anterior: {clave (sprite): Rect}
+        self.previous_rects = {}
+
+        # Zonas extra a limpiar y actualizar este frame (ej: textos del HUD)
+        self.extra_rects = []
+
+        # El primer frame siempre es un repintado completo
+        self.full_redraw = True
+
+    def invalidate(self):
+        """
+        Pide un repintado completo en el próximo frame.
+
+        Útil al entrar al estado, al pausar o al mostrar overlays
+        que cubren toda la pantalla.
+        """
+        self.full_redraw = True
+
+    def mark_dirty(self, rect):
+        """
+        Marca una zona para limpiarla y enviarla a pantalla este frame.
+
+        Args:
+            rect: Rect de la zona que cambió
+        """
+        if rect is not None:
+            self.extra_rects.append(pygame.Rect(rect))
+
+    def clear(self):
+        """
+        Borra las zonas sucias (o toda la pantalla si hay repintado completo).
+
+        Debe llamarse ANTES de dibujar los sprites del frame.
+        """
+        if self.full_redraw:
+            self.screen.fill(self.background_color)
+            return
+
+        for rect in self.previous_rects.values():
+            self.screen.fill(self.background_color, rect)
+        for rect in self.extra_rects:
+            self.screen.fill(self.background_color, rect)
+
+    def finish(self, drawn_rects):
+        """
+        Cierra el frame y calcula qué zonas enviar a la pantalla.
+
+        Por cada sprite se envía la unión de su rect anterior y el actual.
+        Los sprites que ya no se dibujaron envían su rect anterior
+        (para que desaparezcan de la pantalla).
+
+        Args:
+            drawn_rects: Diccionario {clave (sprite): Rect dibujado este frame}
+
+        Returns:
+            list: Rects para pygame.display.update(), o None si hay
+                  que hacer pygame.display.flip() (repintado completo)
+        """
+        if self.full_redraw:
+            self.full_redraw = False
+            self.previous_rects = drawn_rects
+            self.extra_rects = []
+            return None
+
+        dirty_rects = self.extra_rects
+        for key, rect in drawn_rects.items():
+            old_rect = self.previous_rects.pop(key, None)
+            dirty_rects.append(rect.union(old_rect) if old_rect else rect)
+
+        # Sprites que desaparecieron (muertos o invisibles)
+        dirty_rects.extend(self.previous_rects.values())
+
+        self.previous_rects = drawn_rects
+        self.extra_rects = []
+        return dirty_rects
@@ -0,0 +1,78 @@
+# ==============================================================================
+# FORMATION LAYER - CAPA PRE-COMPUESTA DE LA FORMACIÓN
+# ==============================================================================
+# Toda la formación de enemigos se compone en UNA superficie, que solo se
+# vuelve a componer cuando cambia su aspecto. Cada frame basta un solo blit
+
+import pygame
+
+
+class FormationLayer:
+    """
+    Capa de renderizado de la formación de enemigos.
+
+    En vez de 80 blits por frame (uno por enemigo), se hace:
+    - 1 blit por frame (la superficie ya compuesta, en el origen actual)
+    - 1 recomposición solo cuando un enemigo muere, recibe daño
+      o cambia de frame de animación (Formation.version cambia)
+    """
+
+    def __init__(self):
+        """
+        Constructor de la capa.
+        """
+        self.surface = None
+
+        # Formación y versión con las que se compuso la superficie
+        self.formation = None
+        self.version = -1
+
+        # Cantidad de recomposiciones (estadística)
+        self.composites = 0
+
+    def composite(self, formation):
+        """
+        Dibuja todos los enemigos visibles de la formación en la superficie.
+
+        Args:
+            formation: Formación a componer
+        """
+        size = (formation.width, formation.height)
+        if self.surface is None or self.surface.get_size() != size:
+            self.surface = pygame.Surface(size, pygame.SRCALPHA)
+        else:
+            self.surface.fill((0, 0, 0, 0))
+
+        self.surface.blits(
+            [
+                (enemy.image, (col * formation.spacing_x, row * formation.spacing_y))
+                for row, enemies in enumerate(formation.grid)
+                for col, enemy in enumerate(enemies)
+                if enemy is not None and enemy.visible
+            ],
+            doreturn=False
+        )
+
+        self.formation = formation
+        self.version = formation.version
+        self.composites += 1
+
+    def draw(self, screen, formation, alpha=1.0):
+        """
+        Dibuja la formación con un solo blit en su posición actual.
+
+        Args:
+            screen: Superficie donde dibujar
+            formation: Formación a dibujar (puede ser None)
+            alpha: Interpolación entre los dos últimos pasos (1.0 = actual)
+
+        Returns:
+            Rect: Zona dibujada, o None si no hay formación
+        """
+        if formation is None or len(formation) == 0:
+            return None
+
+        if formation is not self.formation or formation.version != self.version:
+            self.composite(formation)
+
+        return screen.blit(self.surface, formation.render_position(alpha))
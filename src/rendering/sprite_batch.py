@@ -0,0 +1,75 @@
+# ==============================================================================
+# SPRITE BATCH - DIBUJO DE SPRITES POR LOTES
+# ==============================================================================
+# En vez de llamar a sprite.draw() (un blit por entidad), se arma la lista
+# (imagen, rect) de cada capa y se envía en UNA sola llamada a Surface.blits()
+
+
+class SpriteBatch:
+    """
+    Dibujo por lotes de varias capas de sprites.
+
+    Las capas se dibujan en el orden indicado:
+    lo que se dibuja primero queda DEBAJO.
+
+    Solo se dibujan los sprites con visible = True
+    (ej: el jugador parpadeando mientras es invulnerable).
+
+    Con alpha < 1.0 cada sprite se dibuja interpolado entre su
+    posición anterior y la actual (simulación a paso fijo).
+
+    Una capa también puede ser un almacén con blit_sequence(alpha)
+    (ej: EntityArrays): entrega la lista ya armada, sin recorrer sprites.
+    """
+
+    def __init__(self, *layers):
+        """
+        Constructor del SpriteBatch.
+
+        Args:
+            *layers: Grupos de sprites (o EntityArrays), del fondo
+                     hacia el frente (ej: enemigos, balas, jugador)
+        """
+        self.layers = layers
+
+    def draw(self, screen, collect_rects=False, alpha=1.0):
+        """
+        Dibuja todas las capas con un Surface.blits() por capa.
+
+        Args:
+            screen: Superficie donde dibujar
+            collect_rects: True para devolver las zonas dibujadas
+                           (necesario en modo dirty rects)
+            alpha: Interpolación entre los dos últimos pasos (1.0 = actual)
+
+        Returns:
+            dict: {sprite: Rect dibujado} si collect_rects, si no None
+                  (en capas de arreglos la clave es (capa, posición))
+        """
+        drawn_rects = {} if collect_rects else None
+
+        for layer in self.layers:
+            if hasattr(layer, 'blit_sequence'):
+                sequence = layer.blit_sequence(alpha)
+                if collect_rects:
+                    rects = screen.blits(sequence)
+                    drawn_rects.update(((layer, i), rect) for i, rect in enumerate(rects))
+                else:
+                    screen.blits(sequence, doreturn=False)
+                continue
+
+            if alpha >= 1.0:
+                sequence = [(sprite.image, sprite.rect) for sprite in layer if sprite.visible]
+            else:
+                sequence = [
+                    (sprite.image, sprite.render_position(alpha))
+                    for sprite in layer if sprite.visible
+                ]
+
+            if collect_rects:
+                visible = [sprite for sprite in layer if sprite.visible]
+                drawn_rects.update(zip(visible, screen.blits(sequence)))
+            else:
+                screen.blits(sequence, doreturn=False)
+
+        return drawn_rects
@@ -3,13 +3,17 @@
 # ==============================================================================
 # Este estado es donde ocurre el juego real
 
+import logging
 import pygame
-import random
 from src.screens.game_state import GameState
-from src.entities import Player, Bullet
-from src.managers import SpawnManager, CollisionManager
+from src.entities import Player, Bullet, EntityArrays, EntityRegistry, NUMPY_AVAILABLE
+from src.managers import SpawnManager, CollisionManager, FireDirector, FontManager, TextCache, PoolManager, TimerScheduler, FrameProfiler, Tracer, GCManager
+from src.ui import HudText
+from src.rendering import DirtyRectRenderer, SpriteBatch, FormationLayer
 from config import *
 
+logger = logging.getLogger(__name__)
+
 class GameScreen(GameState):
     """
     Pantalla principal del juego.
@@ -30,26 +34,49 @@ class GameScreen(GameState):
         """
         super().__init__(game)
         
-        # ========== GRUPOS DE SPRITES ==========
-        # Los grupos facilitan actualizar/dibujar múltiples entidades
-        # y detectar colisiones de forma eficiente
+        # ========== REGISTRO DE ENTIDADES ==========
+        # Una lista compacta por tipo (para update, colisiones y dibujo).
+        # Las entidades destruidas se quitan en cleanup_dead_sprites()
+        self.registry = EntityRegistry(
+            ("players", "enemies", "player_bullets", "enemy_bullets"),
+            indexes=("loose_enemies",)  # Enemigos fuera de formación
+        )
+        
+        self.players = self.registry.kind("players")
+        self.enemies = self.registry.kind("enemies")
+        self.loose_enemies = self.registry.kind("loose_enemies")
+        self.player_bullets = self.registry.kind("player_bullets")  # Solo balas del jugador
+        self.enemy_bullets = self.registry.kind("enemy_bullets")    # Solo balas de enemigos
+        
+        # Balas en arreglos de NumPy (opcional): sustituyen a las listas
+        # player_bullets/enemy_bullets y se actualizan de forma vectorizada
+        self.bullet_arrays = ()
+        if ARRAY_BULLETS:
+            if NUMPY_AVAILABLE:
+                self.player_bullets = self.create_bullet_arrays(True)
+                self.enemy_bullets = self.create_bullet_arrays(False)
+                self.bullet_arrays = (self.player_bullets, self.enemy_bullets)
+            else:
+                logger.warning("⚠️ ARRAY_BULLETS requiere NumPy: se usan sprites normales")
         
-        # Grupo con TODAS las entidades (para update/draw global)
-        self.all_sprites = pygame.sprite.Group()
+        # La formación se dibuja como una sola superficie pre-compuesta
+        self.formation_layer = FormationLayer()
         
-        # Grupos específicos (para colisiones y lógica)
-        self.players = pygame.sprite.Group()
-        self.bullets = pygame.sprite.Group()
-        self.player_bullets = pygame.sprite.Group()  # Solo balas del jugador
-        self.enemy_bullets = pygame.sprite.Group()   # Solo balas de enemigos
-        self.enemies = pygame.sprite.Group()
+        # Resto de capas (del fondo hacia el frente): un blits() por capa
+        self.sprite_batch = SpriteBatch(
+            self.loose_enemies, self.player_bullets, self.enemy_bullets, self.players
+        )
         
         # ========== ENTIDADES ==========
         self.player = None  # Se crea en enter()
         
         # ========== MANAGERS ==========
-        self.spawn_manager = SpawnManager()
+        # Timers (cooldowns, recargas...) sobre el reloj del juego:
+        # se congela en pausa
+        self.scheduler = TimerScheduler()
+        self.spawn_manager = SpawnManager(self.scheduler)
         self.collision_manager = CollisionManager()
+        self.fire_director = FireDirector(self.scheduler)  # Quién y cuándo disparan los enemigos
         
         # ========== JUEGO STATE ==========
         self.score = 0
@@ -58,46 +85,128 @@ class GameScreen(GameState):
         self.paused = False
         self.victory = False  # Victoria al completar oleada
         
-        # ========== DISPARO DE ENEMIGOS ==========
-        self.enemy_shoot_timer = 0
-        self.enemy_shoot_interval = 1.5  # Cada cuántos segundos disparan
-        
         # ========== UI ==========
         self.font_hud = None
         self.font_game_over = None
+        
+        # Textos del HUD ligados a valores del juego (se crean en enter())
+        self.hud_widgets = []
+        
+        # Capa oscura semi-transparente de pausa/game over (se crea una sola vez)
+        self.overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
+        self.overlay.set_alpha(128)
+        self.overlay.fill(BLACK)
+        
+        # Renderizador por rectángulos sucios (None = pantalla completa)
+        self.renderer = DirtyRectRenderer(self.screen) if DIRTY_RECT_RENDERING else None
+        
+        # Tiempos de las subfases de update y draw (overlay F3)
+        self.profiler = FrameProfiler()
+        
+        # Contadores de entidades en la traza (F5)
+        self.tracer = Tracer()
+        
+        # Política del GC: umbrales altos en partida, recolección en momentos seguros
+        self.gc_manager = GCManager()
+    
+    def create_bullet_arrays(self, is_player_bullet):
+        """
+        Crea el almacén en arreglos para un tipo de bala.
+        
+        Args:
+            is_player_bullet: True para las balas del jugador
+        
+        Returns:
+            EntityArrays: Almacén vacío con el sprite de la bala
+        """
+        try:
+            image = Bullet.get_sprite(is_player_bullet)
+        except pygame.error as e:
+            logger.warning("⚠️ No se pudo cargar sprite de bala: %s", e)
+            image = pygame.Surface((BULLET_WIDTH, BULLET_HEIGHT))
+            image.fill(BULLET_COLOR if is_player_bullet else ENEMY_BULLET_COLOR)
+        return EntityArrays((image,))
+    
+    def spawn_bullet(self, x, y, is_player_bullet):
+        """
+        Crea una bala centrada en (x, y).
+        
+        Args:
+            x: Posición horizontal del centro
+            y: Posición vertical del centro
+            is_player_bullet: True = sube (jugador), False = baja (enemigo)
+        """
+        direction = 1 if is_player_bullet else -1
+        
+        if self.bullet_arrays:
+            store = self.player_bullets if is_player_bullet else self.enemy_bullets
+            store.spawn(
+                x - BULLET_WIDTH // 2, y - BULLET_HEIGHT // 2,
+                0, -BULLET_SPEED * direction,
+                BULLET_WIDTH, BULLET_HEIGHT
+            )
+            return
+        
+        # Reutilizar una bala destruida si hay alguna en el pool
+        bullet = PoolManager().acquire(Bullet, x, y, direction, is_player_bullet)
+        self.registry.add(bullet, "player_bullets" if is_player_bullet else "enemy_bullets")
+    
+    @property
+    def formation(self):
+        """
+        Formación de la oleada actual (None si no hay oleada).
+        """
+        return self.spawn_manager.formation
     
     def enter(self):
         """
         Inicialización al entrar a la pantalla de juego.
         """
-        print("🎬 Entrando a Game Screen")
+        logger.info("🎬 Entrando a Game Screen")
+        
+        # Obtener fuentes del registro (reiniciar no vuelve a crearlas)
+        self.font_hud = FontManager().get_font(*FONT_HUD)
+        self.font_game_over = FontManager().get_font(*FONT_GAME_OVER)
         
-        # Inicializar fuentes
-        self.font_hud = pygame.font.SysFont('arial', 24)
-        self.font_game_over = pygame.font.SysFont('arial', 64, bold=True)
+        # Textos del HUD: solo se re-renderizan cuando su valor cambia
+        margin = 10
+        self.hud_widgets = [
+            # Puntuación (arriba izquierda)
+            HudText(self.font_hud, "SCORE: {}", WHITE, lambda: self.score,
+                    topleft=(margin, margin)),
+            # Vidas (arriba derecha)
+            HudText(self.font_hud, "LIVES: {}", GREEN, lambda: self.player.lives,
+                    topright=(WINDOW_WIDTH - margin, margin)),
+            # Nivel (arriba centro)
+            HudText(self.font_hud, "LEVEL {}", CYAN, lambda: self.level,
+                    midtop=(WINDOW_WIDTH // 2, margin)),
+        ]
         
         # Crear jugador
         # Posición: centro horizontal, cerca del fondo
         player_x = WINDOW_WIDTH // 2
         player_y = WINDOW_HEIGHT - 100
-        self.player = Player(player_x, player_y)
+        self.player = Player(player_x, player_y, self.scheduler)
         
-        # Agregar jugador a los grupos
-        self.all_sprites.add(self.player)
-        self.players.add(self.player)
+        # Sin recolecciones automáticas grandes durante la partida
+        self.gc_manager.enter_gameplay()
+        
+        # Registrar al jugador
+        self.registry.add(self.player, "players")
         
         # Resetear estado del juego
         self.score = 0
         self.game_over = False
         self.paused = False
+        self.scheduler.resume()  # Por si se salió al menú estando en pausa
         self.victory = False
         self.level = 1
         
-        # Generar primera oleada de enemigos
-        self.spawn_manager.spawn_wave(self.level, self.enemies, self.all_sprites)
+        # Preparar la primera oleada (se crea por partes en update())
+        self.spawn_manager.prepare_wave(self.level)
         
-        print("✅ Jugador creado en posición inicial")
-        print("🎮 Controles: A/D o ←/→ para mover, SPACE para disparar")
+        logger.info("✅ Jugador creado en posición inicial")
+        logger.info("🎮 Controles: A/D o ←/→ para mover, SPACE para disparar")
     
     def handle_events(self, events):
         """
@@ -132,51 +241,25 @@ class GameScreen(GameState):
         
         # Si puede disparar (no está en cooldown)
         if bullet_pos is not None:
-            # Crear nueva bala
-            bullet = Bullet(
-                bullet_pos[0],  # x
-                bullet_pos[1],  # y
-                direction=1,    # Hacia arriba
-                is_player_bullet=True
-            )
+            # Crear nueva bala (hacia arriba)
+            self.spawn_bullet(bullet_pos[0], bullet_pos[1], is_player_bullet=True)
             
-            # Agregar a los grupos
-            self.all_sprites.add(bullet)
-            self.bullets.add(bullet)
-            self.player_bullets.add(bullet)
-            
-            print("🔫 ¡Bala disparada!")
+            logger.debug("🔫 ¡Bala disparada!")
             # TODO: Reproducir sonido de disparo
     
-    def enemy_shoot(self):
-        """
-        Un enemigo aleatorio dispara.
+    def enemy_shoot(self, shooting_enemy):
         """
-        if len(self.enemies) == 0:
-            return
+        Un enemigo dispara.
         
-        # Elegir un enemigo aleatorio para disparar
-        shooting_enemy = random.choice(list(self.enemies))
-        
-        # El enemigo intenta disparar
+        Args:
+            shooting_enemy: Enemigo elegido por el FireDirector
+        """
         bullet_pos = shooting_enemy.shoot()
         
-        # Si puede disparar
-        if bullet_pos is not None:
-            # Crear bala enemiga
-            bullet = Bullet(
-                bullet_pos[0],  # x
-                bullet_pos[1],  # y
-                direction=-1,   # Hacia abajo
-                is_player_bullet=False
-            )
-            
-            # Agregar a los grupos
-            self.all_sprites.add(bullet)
-            self.bullets.add(bullet)
-            self.enemy_bullets.add(bullet)
-            
-            # TODO: Reproducir sonido de disparo enemigo
+        # Crear bala enemiga (hacia abajo)
+        self.spawn_bullet(bullet_pos[0], bullet_pos[1], is_player_bullet=False)
+        
+        # TODO: Reproducir sonido de disparo enemigo
     
     def toggle_pause(self):
         """
@@ -184,9 +267,12 @@ class GameScreen(GameState):
         """
         self.paused = not self.paused
         if self.paused:
-            print("⏸️ Juego pausado")
+            self.scheduler.pause()  # Congela todos los timers
+            self.gc_manager.collect("pausa")
+            logger.info("⏸️ Juego pausado")
         else:
-            print("▶️ Juego reanudado")
+            self.scheduler.resume()
+            logger.info("▶️ Juego reanudado")
     
     def cleanup_dead_sprites(self):
         """
@@ -194,40 +280,26 @@ class GameScreen(GameState):
         
         Este método es crucial para evitar "enemigos fantasma" que siguen
         apareciendo en pantalla después de ser destruidos.
-        """
-        # Limpiar enemigos muertos (prioridad #1)
-        for enemy in list(self.enemies):
-            if hasattr(enemy, 'alive') and not enemy.alive:
-                enemy.kill()  # Elimina del grupo enemies Y all_sprites
         
-        # Limpiar balas muertas
-        for bullet in list(self.bullets):
-            if hasattr(bullet, 'alive') and not bullet.alive:
-                bullet.kill()
+        Solo recorre la cola de destrucción del registro: cuesta
+        O(entidades muertas), no O(todas las entidades).
+        """
+        self.registry.flush()
         
-        # Limpiar cualquier otro sprite muerto
-        for sprite in list(self.all_sprites):
-            if hasattr(sprite, 'alive') and not sprite.alive:
-                sprite.kill()
+        # Balas en arreglos: compactar las muertas
+        for store in self.bullet_arrays:
+            store.compact()
     
     def restart_game(self):
         """
         Reinicia el juego (vuelve a enter()).
         """
-        print("🔄 Reiniciando juego...")
+        logger.info("🔄 Reiniciando juego...")
         
-        # Destruir TODOS los sprites individualmente
-        # Esto asegura que se llame kill() en cada uno
-        for sprite in list(self.all_sprites):
-            sprite.kill()
-        
-        # Limpiar todos los grupos
-        self.all_sprites.empty()
-        self.players.empty()
-        self.bullets.empty()
-        self.player_bullets.empty()
-        self.enemy_bullets.empty()
-        self.enemies.empty()
+        # Destruir TODAS las entidades (balas y enemigos vuelven a sus pools)
+        self.registry.clear()
+        for store in self.bullet_arrays:
+            store.empty()
         
         # Volver a inicializar
         self.enter()
@@ -243,29 +315,36 @@ class GameScreen(GameState):
         if self.paused or self.game_over:
             return
         
-        # Actualizar todas las entidades
-        # Cada sprite ejecuta su método update()
-        for sprite in list(self.all_sprites):  # list() crea copia para evitar modificar durante iteración
-            sprite.update(delta_time)
+        # Subfases medidas por el perfilador (no hace nada si está apagado)
+        profiler = self.profiler
+        
+        # Avanzar el reloj del juego: solo cuestan los timers que vencen
+        self.scheduler.update(delta_time)
+        
+        # Actualizar todas las entidades, tipo por tipo
+        # Cada entidad ejecuta su método update()
+        self.registry.update(delta_time)
+        
+        # Balas en arreglos: una operación vectorizada por almacén
+        for store in self.bullet_arrays:
+            store.update(delta_time)
+        profiler.split("update.entities")
         
         # PRIMERA LIMPIEZA: Eliminar sprites destruidos durante update()
         self.cleanup_dead_sprites()
+        profiler.split("update.cleanup")
         
-        # Actualizar movimiento en formación de enemigos
-        invasion = self.spawn_manager.update_formation(self.enemies, delta_time)
-        if invasion:
-            print("🚨 ¡INVASIÓN! Game Over!")
-            self.game_over = True
-            self.player.lives = 0  # Forzar game over
-        
-        # Enemigos disparan aleatoriamente
-        self.enemy_shoot_timer -= delta_time
-        if self.enemy_shoot_timer <= 0 and len(self.enemies) > 0:
-            self.enemy_shoot()
-            self.enemy_shoot_timer = self.enemy_shoot_interval
+        # Presentación de la oleada: los enemigos aparecen por partes
+        # (con presupuesto por paso) y la formación espera quieta
+        if self.spawn_manager.spawning:
+            self.spawn_manager.materialize(self.registry)
+            profiler.split("update.formation")
+        else:
+            self.update_enemies(delta_time)
         
         # Detectar todas las colisiones
         collision_results = self.collision_manager.check_all_collisions(self)
+        profiler.split("update.collisions")
         
         # Aplicar resultados de colisiones
         self.score += collision_results['points_gained']
@@ -275,44 +354,117 @@ class GameScreen(GameState):
         self.cleanup_dead_sprites()
         
         if collision_results['invasion']:
-            print("🚨 ¡INVASIÓN! Game Over!")
+            logger.info("🚨 ¡INVASIÓN! Game Over!")
             self.game_over = True
             self.player.lives = 0
         
         # Verificar si el jugador murió
         if self.player.lives <= 0:
             self.game_over = True
-            print("☠️ GAME OVER!")
+            logger.info("☠️ GAME OVER!")
         
         # Verificar si se eliminaron todos los enemigos (victoria)
-        if self.spawn_manager.all_enemies_dead(self.enemies) and not self.game_over:
-            print("🎉 ¡Oleada completada!")
+        # (durante la presentación aún no están todos creados)
+        if (not self.spawn_manager.spawning and
+                self.spawn_manager.all_enemies_dead(self.enemies) and not self.game_over):
+            logger.info("🎉 ¡Oleada completada!")
             self.victory = True
             self.level = self.spawn_manager.next_level()
-            # Generar nueva oleada después de 2 segundos
-            # Por ahora la generamos inmediatamente
-            self.spawn_manager.spawn_wave(self.level, self.enemies, self.all_sprites)
+            # Preparar la nueva oleada: sus enemigos se crean por partes
+            # en los próximos pasos (presentación de la oleada)
+            self.spawn_manager.prepare_wave(self.level)
             self.victory = False
+            
+            # Momento seguro para el GC: entre una oleada y la siguiente
+            self.gc_manager.collect("fin de oleada")
+        
+        profiler.split("update.cleanup")
+        
+        # Contadores de la traza: para cruzar un tirón con lo que había en juego
+        if self.tracer.enabled:
+            self.tracer.counter(
+                "entities",
+                enemies=len(self.enemies),
+                loose_enemies=len(self.loose_enemies),
+                player_bullets=len(self.player_bullets),
+                enemy_bullets=len(self.enemy_bullets)
+            )
+    
+    def update_enemies(self, delta_time):
+        """
+        Mueve la formación y hace disparar a los enemigos.
+        
+        Args:
+            delta_time: Tiempo desde el último frame (segundos)
+        """
+        # Actualizar movimiento en formación de enemigos
+        invasion = self.spawn_manager.update_formation(self.loose_enemies, delta_time)
+        if invasion:
+            logger.info("🚨 ¡INVASIÓN! Game Over!")
+            self.game_over = True
+            self.player.lives = 0  # Forzar game over
+        
+        # Los enemigos que salieron de la formación pasan a ser "sueltos":
+        # se dibujan por lotes y colisionan por la rejilla espacial
+        formation = self.formation
+        if formation is not None and formation.released:
+            for enemy in formation.released:
+                self.registry.add(enemy, "loose_enemies")
+                self.fire_director.add_shooter(enemy)  # Suelto: nadie le tapa
+            formation.released.clear()
+        self.profiler.split("update.formation")
+        
+        # Enemigos disparan: el FireDirector elige a uno que ya recargó
+        shooter = self.fire_director.update(self.level, formation, len(self.enemies))
+        if shooter is not None:
+            self.enemy_shoot(shooter)
+        self.profiler.split("update.fire")
     
     def draw(self):
         """
         Dibuja la pantalla de juego.
+        
+        Returns:
+            list: Rects que cambiaron (modo dirty rects), o None
+                  para actualizar la pantalla completa
         """
-        # Limpiar pantalla (fondo negro del espacio)
-        self.screen.fill(BLACK)
+        # Los overlays de pausa/game over cubren toda la pantalla:
+        # en esos casos siempre se repinta todo
+        use_dirty_rects = self.renderer is not None and not (self.paused or self.game_over)
+        
+        if use_dirty_rects:
+            # Textos del HUD que cambiaron: borrar el texto viejo.
+            # El texto se vuelve a dibujar cada frame y tiene bordes
+            # semi-transparentes: su zona se limpia siempre para que no
+            # se acumulen al pasar una bala por encima
+            for widget in self.hud_widgets:
+                if widget.refresh():
+                    self.renderer.mark_dirty(widget.previous_rect)
+                self.renderer.mark_dirty(widget.rect)
+            
+            # Limpiar solo las zonas sucias
+            self.renderer.clear()
+        else:
+            # Limpiar pantalla (fondo negro del espacio)
+            self.screen.fill(BLACK)
+            if self.renderer is not None:
+                self.renderer.invalidate()
+        self.profiler.split("draw.background")
         
         # TODO: Dibujar fondo de estrellas
         
-        # Dibujar todas las entidades VIVAS
-        # Filtrar solo los sprites que están vivos
-        for sprite in self.all_sprites:
-            # Verificar si el sprite sigue vivo antes de dibujarlo
-            if hasattr(sprite, 'alive'):
-                if sprite.alive:
-                    sprite.draw(self.screen)
-            else:
-                # Si no tiene atributo alive, dibujarlo (por compatibilidad)
-                sprite.draw(self.screen)
+        # Interpolación entre los dos últimos pasos de simulación
+        # (en pausa o game over la simulación está quieta: posición actual)
+        alpha = 1.0 if self.paused or self.game_over else self.game.interpolation
+        
+        # Dibujar todas las entidades visibles por lotes
+        # (las entidades destruidas ya se quitaron del registro)
+        formation = self.spawn_manager.formation
+        formation_rect = self.formation_layer.draw(self.screen, formation, alpha)
+        drawn_rects = self.sprite_batch.draw(self.screen, use_dirty_rects, alpha)
+        if use_dirty_rects and formation_rect is not None:
+            drawn_rects[formation] = formation_rect
+        self.profiler.split("draw.sprites")
         
         # Dibujar HUD (puntuación, vidas)
         self.draw_hud()
@@ -324,45 +476,37 @@ class GameScreen(GameState):
         # Si es game over, mostrar mensaje
         if self.game_over:
             self.draw_game_over()
+        self.profiler.split("draw.hud")
+        
+        if use_dirty_rects:
+            return self.renderer.finish(drawn_rects)
+        return None
     
     def draw_hud(self):
         """
         Dibuja el HUD (Head-Up Display): puntuación, vidas, nivel.
-        """
-        # Margen desde el borde
-        margin = 10
-        
-        # Puntuación (arriba izquierda)
-        score_text = self.font_hud.render(f"SCORE: {self.score}", True, WHITE)
-        self.screen.blit(score_text, (margin, margin))
         
-        # Vidas (arriba derecha)
-        lives_text = self.font_hud.render(f"LIVES: {self.player.lives}", True, GREEN)
-        lives_rect = lives_text.get_rect(topright=(WINDOW_WIDTH - margin, margin))
-        self.screen.blit(lives_text, lives_rect)
-        
-        # Nivel (arriba centro)
-        level_text = self.font_hud.render(f"LEVEL {self.level}", True, CYAN)
-        level_rect = level_text.get_rect(midtop=(WINDOW_WIDTH // 2, margin))
-        self.screen.blit(level_text, level_rect)
+        Cada texto solo se re-renderiza cuando su valor cambia.
+        """
+        for widget in self.hud_widgets:
+            widget.draw(self.screen)
     
     def draw_pause_menu(self):
         """
         Dibuja el menú de pausa.
         """
+        texts = TextCache()
+        
         # Overlay semi-transparente
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-        overlay.set_alpha(128)  # Semi-transparente
-        overlay.fill(BLACK)
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self.overlay, (0, 0))
         
         # Texto "PAUSED"
-        pause_text = self.font_game_over.render("PAUSED", True, YELLOW)
+        pause_text = texts.render(self.font_game_over, "PAUSED", YELLOW)
         pause_rect = pause_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2))
         self.screen.blit(pause_text, pause_rect)
         
         # Instrucción
-        instruction = self.font_hud.render("Press P to resume", True, WHITE)
+        instruction = texts.render(self.font_hud, "Press P to resume", WHITE)
         instruction_rect = instruction.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 60))
         self.screen.blit(instruction, instruction_rect)
     
@@ -370,28 +514,27 @@ class GameScreen(GameState):
         """
         Dibuja la pantalla de Game Over.
         """
+        texts = TextCache()
+        
         # Overlay semi-transparente
-        overlay = pygame.Surface((WINDOW_WIDTH, WINDOW_HEIGHT))
-        overlay.set_alpha(128)
-        overlay.fill(BLACK)
-        self.screen.blit(overlay, (0, 0))
+        self.screen.blit(self.overlay, (0, 0))
         
         # Texto "GAME OVER"
-        game_over_text = self.font_game_over.render("GAME OVER", True, RED)
+        game_over_text = texts.render(self.font_game_over, "GAME OVER", RED)
         game_over_rect = game_over_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 - 50))
         self.screen.blit(game_over_text, game_over_rect)
         
         # Puntuación final
-        final_score = self.font_hud.render(f"Final Score: {self.score}", True, WHITE)
+        final_score = texts.render(self.font_hud, f"Final Score: {self.score}", WHITE)
         score_rect = final_score.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 20))
         self.screen.blit(final_score, score_rect)
         
         # Instrucciones
-        restart_text = self.font_hud.render("Press R to restart", True, YELLOW)
+        restart_text = texts.render(self.font_hud, "Press R to restart", YELLOW)
         restart_rect = restart_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 60))
         self.screen.blit(restart_text, restart_rect)
         
-        menu_text = self.font_hud.render("Press ESC for menu", True, GRAY)
+        menu_text = texts.render(self.font_hud, "Press ESC for menu", GRAY)
         menu_rect = menu_text.get_rect(center=(WINDOW_WIDTH // 2, WINDOW_HEIGHT // 2 + 90))
         self.screen.blit(menu_text, menu_rect)
     
@@ -399,16 +542,12 @@ class GameScreen(GameState):
         """
         Limpieza al salir de la pantalla de juego.
         """
-        print("🚪 Saliendo de Game Screen")
+        logger.info("🚪 Saliendo de Game Screen")
         
-        # Destruir todos los sprites individualmente
-        for sprite in list(self.all_sprites):
-            sprite.kill()
+        # Umbrales normales del GC fuera de la partida
+        self.gc_manager.leave_gameplay()
         
-        # Limpiar todos los sprites
-        self.all_sprites.empty()
-        self.players.empty()
-        self.bullets.empty()
-        self.enemies.empty()
-        self.player_bullets.empty()
-        self.enemy_bullets.empty()
+        # Destruir todas las entidades (balas y enemigos vuelven a sus pools)
+        self.registry.clear()
+        for store in self.bullet_arrays:
+            store.empty()
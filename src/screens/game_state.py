@@ -1,6 +1,9 @@
+import logging
 from abc import ABC, abstractmethod
 from time import time
 
+logger = logging.getLogger(__name__)
+
 class GameState(ABC):
 
     """
@@ -68,6 +71,11 @@ class GameState(ABC):
         """
         Dibuja los elementos visuales del estado.
         
+        Returns:
+            None para actualizar la pantalla completa (display.flip()),
+            o una lista de Rects para actualizar solo esas zonas
+            (display.update(rects), modo dirty rects)
+        
         ABSTRACTO: Cada estado DEBE implementar este método.
         Por ejemplo:
         - En MENU: título, opciones, cursor
@@ -88,7 +96,7 @@ class GameState(ABC):
         - Resetear valores
         
         """
-        print("Entering state:", self.__class__.__name__)
+        logger.info("Entering state: %s", self.__class__.__name__)
 
     @abstractmethod
     def exit(self):
@@ -101,4 +109,4 @@ class GameState(ABC):
         - Guardar datos
         
         """
-        print("Exiting state:", self.__class__.__name__)
\ No newline at end of file
+        logger.info("Exiting state: %s", self.__class__.__name__)
\ No newline at end of file
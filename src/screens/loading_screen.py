@@ -1,13 +1,21 @@
+import logging
+import os
 import pygame
 from src.screens import GameState
+from src.entities import Bullet, Enemy
+from src.managers import AssetManager, FontManager, PoolManager, ResourceLoader, GCManager
 from config import *
 
+logger = logging.getLogger(__name__)
+
 
 class LoadingScreen(GameState):
     """
     Pantalla de carga inicial del juego.
     
-    Simula la precarga de recursos y muestra una barra de progreso.
+    Carga los recursos reales del juego en un hilo aparte
+    (imágenes, variantes tintadas, fuentes y sonidos) y muestra
+    una barra de progreso según el trabajo completado.
     Cuando termina (100%), cambia automáticamente al menú principal.
     """
     def __init__(self, game):
@@ -17,12 +25,9 @@ class LoadingScreen(GameState):
 
         # Progreso de carga (0.0 a 0%, 1.0 = 100%)
         self.progress = 0.0
-        
-        # Velocidad de carga simulada
-        self.load_speed = 0.3
 
-        self.total_resources = 10  # Número total de recursos a cargar
-        self.loaded_resources = 0  # Recursos cargados hasta ahora
+        # Cargador en segundo plano (se crea en enter())
+        self.loader = None
 
         self.font_large = None
         self.font_small = None
@@ -34,67 +39,111 @@ class LoadingScreen(GameState):
         Aquí se configuran las fuentes y otros elementos necesarios.
         """
 
-        print("Entrando en LoadingScreen...")
+        logger.info("Entrando en LoadingScreen...")
 
-        # Cargar fuentes
-        self.font_large = pygame.font.SysFont('arial', 48, bold=True)
-        self.font_small = pygame.font.SysFont('arial', 24)
+        # Obtener fuentes del registro (se necesitan ya para dibujar)
+        self.font_large = FontManager().get_font(*FONT_LOADING_TITLE)
+        self.font_small = FontManager().get_font(*FONT_LOADING_TEXT)
 
         # Resetear progreso
         self.progress = 0.0
-        self.loaded_resources = 0
+
+        # Iniciar la carga real en un hilo aparte
+        self.loader = ResourceLoader(self.build_manifest())
+        self.loader.start()
+
+    def build_manifest(self):
+        """
+        Construye el manifiesto de carga: una tarea por unidad de trabajo.
+
+        Orden:
+        1. Decodificar cada imagen
+        2. Generar cada variante (escalada y tintada) de SPRITE_VARIANTS
+        3. Crear las fuentes de todas las pantallas
+        4. Cargar los sonidos (si existen)
+        5. Pre-crear balas y enemigos en sus pools
+
+        Returns:
+            list: Tuplas (descripción, función)
+        """
+        assets = AssetManager()
+        tasks = []
+
+        # 1. Imágenes (una decodificación por archivo)
+        paths = []
+        for path, size, tints in SPRITE_VARIANTS:
+            if path not in paths:
+                paths.append(path)
+        for path in paths:
+            tasks.append((path, lambda path=path: assets.load_raw_image(path)))
+
+        # 2. Variantes tintadas (así crear entidades no tinta nada)
+        for path, size, tints in SPRITE_VARIANTS:
+            tasks.append((
+                f"{os.path.basename(path)} {size[0]}x{size[1]}",
+                lambda variant=(path, size, tints): assets.get_variant(*variant)
+            ))
+
+        # 3. Fuentes (así entrar a una pantalla no llama a SysFont)
+        fonts = FontManager()
+        for spec in UI_FONTS:
+            tasks.append((f"{spec[0]} {spec[1]}", lambda spec=spec: fonts.get_font(*spec)))
+
+        # 4. Sonidos
+        if os.path.isdir(SOUNDS_DIR):
+            for filename in sorted(os.listdir(SOUNDS_DIR)):
+                if filename.lower().endswith(('.wav', '.ogg', '.mp3')):
+                    path = f"{SOUNDS_DIR}/{filename}"
+                    tasks.append((path, lambda path=path: assets.get_sound(path)))
+
+        # 5. Pools (así los primeros disparos y oleadas no crean objetos)
+        pools = PoolManager()
+        tasks.append((
+            "Pool de balas",
+            lambda: pools.prewarm(Bullet, POOL_PREWARM.get("Bullet", 0), 0, 0, 1)
+        ))
+        tasks.append((
+            "Pool de enemigos",
+            lambda: pools.prewarm(Enemy, POOL_PREWARM.get("Enemy", 0), 0, 0)
+        ))
+
+        return tasks
 
     def handle_events(self, events):
         """
         Maneja eventos de esta pantalla.
         
         Por ahora no hacemos nada (carga automática).
-        Opcional: podríamos permitir saltar con SPACE.
         
         Args:
             events: Lista de eventos de pygame
         """
 
-        # TODO: Opcional - presionar SPACE para saltar la carga
-
-        for event in events:
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_SPACE:
-                    self.progress = 1.0  # Saltar a 100%
-                    print("Carga saltada por el usuario.")
+        # La carga es real: no se puede saltar, pero termina
+        # en cuanto el último recurso está listo
+        pass
 
     def update(self, delta_time):
         """
         Actualiza la lógica de la pantalla de carga.
         
-        Incrementa el progreso gradualmente hasta llegar al 100%.
+        Lee el progreso real del hilo de carga.
         Cuando termina, cambia al siguiente estado.
         
         Args:
             delta_time: Tiempo desde el último frame (en segundos)
         """
 
-        if self.progress < 1.0:
-            # Incrementar el progreso basado en el tiempo
-            self.progress += self.load_speed * delta_time
-
-            # Asegurar que no pasemos del 100%
-            if self.progress > 1.0:
-                self.progress = 1.0
-
-            # Simular carga de recursos
-            expected_loaded = int(self.progress * self.total_resources)
+        self.progress = self.loader.progress
 
-            # Si cargamos un nuevo recurso, mostramos mensaje
-            if expected_loaded > self.loaded_resources:
-                self.loaded_resources = expected_loaded
-                print(f"Cargando recurso {self.loaded_resources}/{self.total_resources}...")
+        if self.loader.done:
+            # Lo cargado vive toda la partida: sacarlo de las recolecciones
+            GCManager().freeze()
 
-        elif self.progress >= 1.0:
-            # Cambio al menú principal cuando la carga termina
+            # Cambio al menú principal en cuanto la carga termina
             from src.screens.menu_screen import MenuScreen
             self.game.game_manager.change_state(MenuScreen(self.game))
-            print("Carga completa. Cambiando al MenuScreen...")
+            logger.info("Carga completa. Cambiando al MenuScreen...")
 
     def draw(self):
         """
@@ -151,12 +200,14 @@ class LoadingScreen(GameState):
         percent_rect = percent_text.get_rect(center=(WINDOW_WIDTH // 2,  400))
         self.screen.blit(percent_text, percent_rect)
 
-        if self.progress < 1.0:
-            hint_text = self.font_small.render("Press SPACE to skip", True, GRAY)
-            hint_rect = hint_text.get_rect(center=(WINDOW_WIDTH // 2, 450))
-            self.screen.blit(hint_text, hint_rect)
+        # 6. Recurso que se está cargando ahora
+        current_task = self.loader.current_task
+        if current_task:
+            task_text = self.font_small.render(current_task, True, GRAY)
+            task_rect = task_text.get_rect(center=(WINDOW_WIDTH // 2, 450))
+            self.screen.blit(task_text, task_rect)
 
     def exit(self):
-        print("Saliendo de LoadingScreen...")
+        logger.info("Saliendo de LoadingScreen...")
         return super().exit()
 
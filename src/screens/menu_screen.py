@@ -1,6 +1,10 @@
+import logging
 import pygame
 from config import *
 from src.screens.game_state import GameState
+from src.managers import FontManager
+
+logger = logging.getLogger(__name__)
 
 class MenuScreen(GameState):
     """
@@ -43,13 +47,14 @@ class MenuScreen(GameState):
         
         Inicializa fuentes y resetea la selección.
         """
-        print("🎬 Entrando al Menu Screen")
+        logger.info("🎬 Entrando al Menu Screen")
 
-        # Cargar fuentes
-        self.font_title = pygame.font.SysFont('arial', 64, bold=True)
-        self.font_subtitle = pygame.font.SysFont('arial', 24, italic=True)
-        self.font_options = pygame.font.SysFont('arial', 36, bold=True)
-        self.font_controls = pygame.font.SysFont('arial', 18)
+        # Obtener fuentes del registro (ya creadas durante la carga)
+        fonts = FontManager()
+        self.font_title = fonts.get_font(*FONT_MENU_TITLE)
+        self.font_subtitle = fonts.get_font(*FONT_MENU_SUBTITLE)
+        self.font_options = fonts.get_font(*FONT_MENU_OPTIONS)
+        self.font_controls = fonts.get_font(*FONT_MENU_CONTROLS)
 
         # Resetear selección
         self.selected_option = 0
@@ -90,7 +95,7 @@ class MenuScreen(GameState):
             # Si pasamos de la primera opción, ir a la ultima
             self.selected_option = len(self.options) - 1
 
-        print(f"Opción seleccionada: {self.options[self.selected_option]}")
+        logger.debug("Opción seleccionada: %s", self.options[self.selected_option])
 
         # TODO: Reproducir sonido de navegación
 
@@ -102,7 +107,7 @@ class MenuScreen(GameState):
             # Si pasamos de la primera opción, ir a la ultima
             self.selected_option = 0
 
-        print(f"Opción seleccionada: {self.options[self.selected_option]}")
+        logger.debug("Opción seleccionada: %s", self.options[self.selected_option])
 
         # TODO: Reproducir sonido de navegación
 
@@ -116,19 +121,19 @@ class MenuScreen(GameState):
         - 2 (EXIT): Salir del juego
         """
         option_name = self.options[self.selected_option]
-        print(f"✅ Opción seleccionada: {option_name}")
+        logger.info("✅ Opción seleccionada: %s", option_name)
         
         # TODO: Reproducir sonido de selección
         # self.sound_select.play()
         
         if self.selected_option == 0:  # PLAY
-            print("🎮 Iniciando juego...")
+            logger.info("🎮 Iniciando juego...")
             # Cambiar a GameScreen
             from src.screens.game_screen import GameScreen
             self.game.game_manager.change_state(GameScreen(self.game))
         
         elif self.selected_option == 1:  # EXIT
-            print("👋 Saliendo del juego...")
+            logger.info("👋 Saliendo del juego...")
             # Cerrar el juego (establecer running = False)
             self.game.running = False
     
@@ -236,7 +241,7 @@ class MenuScreen(GameState):
         
         Limpieza de recursos (música, etc.)
         """
-        print("🚪 Saliendo del Menu Screen")
+        logger.info("🚪 Saliendo del Menu Screen")
         
         # TODO: Detener música de menú
         # pygame.mixer.music.stop()
@@ -0,0 +1,7 @@
+# ==============================================================================
+# SIMULATION PACKAGE
+# ==============================================================================
+# Modo headless: partidas simuladas sin ventana, con piloto automático
+
+from .autopilot import Autopilot
+from .headless import run_simulations, simulate_game
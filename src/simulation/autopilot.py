@@ -0,0 +1,74 @@
+# ==============================================================================
+# AUTOPILOT - PILOTO AUTOMÁTICO DEL JUGADOR
+# ==============================================================================
+# Controla al jugador sin teclado: se usa en el modo headless para
+# simular partidas completas (CI, servidores de pruebas)
+
+import random
+
+
+class Autopilot:
+    """
+    Piloto automático sencillo.
+
+    Estrategia:
+    - Elegir el enemigo más cercano en horizontal
+    - Moverse hasta quedar debajo de él
+    - Disparar en cuanto esté alineado
+
+    Se asigna como controller del jugador: Player.handle_input()
+    le pide la dirección con get_direction().
+    """
+
+    def __init__(self, game_screen, rng=None):
+        """
+        Constructor del piloto automático.
+
+        Args:
+            game_screen: GameScreen a controlar
+            rng: Generador aleatorio (para simulaciones reproducibles)
+        """
+        self.game_screen = game_screen
+        self.rng = rng or random.Random()
+
+        # Dirección elegida en el último paso (-1, 0, 1)
+        self.direction = 0
+
+        # Tolerancia horizontal para considerarse "alineado" (píxeles)
+        self.aim_tolerance = 10
+
+    def get_direction(self):
+        """
+        Dirección de movimiento para el jugador.
+
+        Returns:
+            int: -1 izquierda, 0 quieto, 1 derecha
+        """
+        return self.direction
+
+    def update(self):
+        """
+        Decide el movimiento y dispara si está alineado.
+
+        Se llama una vez por paso de simulación, antes de actualizar el juego.
+        """
+        screen = self.game_screen
+        player = screen.player
+        if player is None or screen.game_over or len(screen.enemies) == 0:
+            self.direction = 0
+            return
+
+        # Enemigo más cercano en horizontal
+        player_x = player.rect.centerx
+        target = min(screen.enemies, key=lambda enemy: abs(enemy.rect.centerx - player_x))
+        offset = target.rect.centerx - player_x
+
+        if abs(offset) <= self.aim_tolerance:
+            self.direction = 0
+            screen.player_shoot()
+        else:
+            self.direction = 1 if offset > 0 else -1
+
+        # Un poco de ruido para que no todas las partidas sean idénticas
+        if self.rng.random() < 0.05:
+            self.direction = self.rng.choice((-1, 0, 1))
@@ -0,0 +1,93 @@
+# ==============================================================================
+# HEADLESS - SIMULACIÓN DE PARTIDAS SIN VENTANA
+# ==============================================================================
+# Ejecuta la lógica completa de GameScreen (oleadas, formación, disparos,
+# colisiones, puntuación) sin dibujar nada y sin limitar los FPS
+
+import logging
+import random
+import time
+
+from src.managers import ResourceLoader, LogManager, GCManager
+from src.screens.game_screen import GameScreen
+from src.screens.loading_screen import LoadingScreen
+from src.simulation.autopilot import Autopilot
+
+
+def preload(game):
+    """
+    Carga todos los recursos de forma síncrona (sin hilo ni barra).
+
+    Args:
+        game: Instancia de Game en modo headless
+    """
+    loader = ResourceLoader(LoadingScreen(game).build_manifest())
+    loader.run()
+    GCManager().freeze()
+
+
+def simulate_game(game, seed, max_steps):
+    """
+    Simula UNA partida completa con el piloto automático.
+
+    Args:
+        game: Instancia de Game en modo headless
+        seed: Semilla aleatoria de la partida
+        max_steps: Máximo de pasos de simulación (por si nunca termina)
+
+    Returns:
+        dict: Resultado (semilla, puntuación, nivel, pasos, tiempo real)
+    """
+    random.seed(seed)
+
+    screen = GameScreen(game)
+    game.game_manager.change_state(screen)
+
+    autopilot = Autopilot(screen, random.Random(seed))
+    screen.player.controller = autopilot
+
+    start = time.perf_counter()
+    steps = 0
+    while steps < max_steps and not screen.game_over:
+        autopilot.update()
+        game.update()
+        steps += 1
+
+    return {
+        'seed': seed,
+        'score': screen.score,
+        'level': screen.level,
+        'steps': steps,
+        'game_time': steps * game.delta_time,
+        'wall_time': time.perf_counter() - start,
+        'game_over': screen.game_over
+    }
+
+
+def run_simulations(game, games=1, seed=0, max_steps=36000, quiet=True):
+    """
+    Simula varias partidas seguidas a máxima velocidad.
+
+    Args:
+        game: Instancia de Game creada con headless=True
+        games: Cantidad de partidas
+        seed: Semilla de la primera partida (las siguientes suman 1)
+        max_steps: Máximo de pasos por partida (36000 = 10 min a 60 Hz)
+        quiet: True para mostrar solo avisos y errores del juego
+
+    Returns:
+        list: Un diccionario de resultados por partida
+    """
+    results = []
+
+    # Silenciar subiendo el nivel del log: los mensajes ni se formatean
+    previous_level = LogManager().set_level(logging.WARNING) if quiet else None
+    try:
+        preload(game)
+        for i in range(games):
+            results.append(simulate_game(game, seed + i, max_steps))
+    finally:
+        if previous_level is not None:
+            LogManager().set_level(previous_level)
+
+    return results
@@ -0,0 +1,6 @@
+# ==============================================================================
+# UI PACKAGE
+# ==============================================================================
+# Elementos de interfaz reutilizables (HUD, textos, overlays)
+
+from .hud_text import HudText
@@ -0,0 +1,79 @@
+# ==============================================================================
+# HUD TEXT - TEXTO DEL HUD QUE SOLO SE RENDERIZA AL CAMBIAR
+# ==============================================================================
+# Un elemento de texto del HUD "ligado" a un valor del juego
+# (puntuación, vidas, nivel). Solo vuelve a renderizar cuando el valor cambia
+
+from src.managers.text_cache import TextCache
+
+
+class HudText:
+    """
+    Texto del HUD con renderizado "sucio" (dirty).
+
+    Cada frame consulta su valor ligado; si no cambió desde el
+    último frame, reutiliza la superficie ya renderizada.
+
+    Ejemplo:
+        score = HudText(font, "SCORE: {}", WHITE, lambda: self.score,
+                        topleft=(10, 10))
+        score.draw(screen)
+    """
+
+    def __init__(self, font, template, color, source, **anchor):
+        """
+        Constructor del texto del HUD.
+
+        Args:
+            font: Fuente del texto
+            template: Plantilla con {} donde va el valor (ej: "LIVES: {}")
+            color: Color RGB del texto
+            source: Función sin argumentos que devuelve el valor actual
+            **anchor: Punto de anclaje del rect (ej: topright=(790, 10))
+        """
+        self.font = font
+        self.template = template
+        self.color = color
+        self.source = source
+        self.anchor = anchor
+
+        # Último valor renderizado (None = aún no renderizado)
+        self.value = None
+        self.surface = None
+        self.rect = None
+
+        # Rect del texto anterior (para borrarlo en modo dirty rects)
+        self.previous_rect = None
+
+        # True si el valor cambió en el último refresh()
+        self.dirty = True
+
+    def refresh(self):
+        """
+        Consulta el valor ligado y re-renderiza solo si cambió.
+
+        Returns:
+            bool: True si el texto cambió en este frame
+        """
+        value = self.source()
+        self.dirty = self.surface is None or value != self.value
+
+        if self.dirty:
+            self.previous_rect = self.rect
+            self.value = value
+            self.surface = TextCache().render(
+                self.font, self.template.format(value), self.color
+            )
+            self.rect = self.surface.get_rect(**self.anchor)
+
+        return self.dirty
+
+    def draw(self, screen):
+        """
+        Dibuja el texto (re-renderizando solo si el valor cambió).
+
+        Args:
+            screen: Superficie donde dibujar
+        """
+        self.refresh()
+        screen.blit(self.surface, self.rect)